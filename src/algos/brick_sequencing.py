@@ -0,0 +1,115 @@
+from .support_order import Algorithm
+from .routing import precedence_route, route_cost
+from ..models.wall import Wall
+from ..models.robot import Robot
+from ..models.brick import Brick
+from ..models.stride import StrideManager, Stride
+from ..models.common import Position, Movement
+from ..models.support import SupportGraph
+from ..models.travel import ArmCostModel
+from ..configs.config import Config
+from dataclasses import dataclass
+
+
+@dataclass
+class SequenceReport:
+    bricks: int
+    before: list[float]  # arm time per stride, planner order
+    after: list[float]  # arm time per stride, sequenced
+
+    @staticmethod
+    def _per_hour(bricks: int, seconds: float) -> float:
+        return 3600 * bricks / seconds if seconds else 0.0
+
+    @property
+    def bricks_per_hour_before(self) -> float:
+        return self._per_hour(self.bricks, sum(self.before))
+
+    @property
+    def bricks_per_hour_after(self) -> float:
+        return self._per_hour(self.bricks, sum(self.after))
+
+    def __str__(self) -> str:
+        return (
+            f"Arm time: {sum(self.before):.1f}s → {sum(self.after):.1f}s, "
+            f"bricks/hour: {self.bricks_per_hour_before:.0f} → "
+            f"{self.bricks_per_hour_after:.0f}"
+        )
+
+
+def sequenced(algorithm: Algorithm, model: ArmCostModel | None = None) -> Algorithm:
+    """Planner stage: run ``algorithm``, then sequence the bricks of each stride"""
+
+    def sequenced_algorithm(
+        wall: Wall, robot: Robot, stride_manager: StrideManager, config: Config
+    ) -> tuple[list[Stride], list[Movement]]:
+        strides, movements = algorithm(wall, robot, stride_manager, config)
+        print(
+            sequence_bricks(wall, strides, model or ArmCostModel.from_config(config))
+        )
+        return strides, movements
+
+    sequenced_algorithm.__name__ = f"sequenced_{algorithm.__name__}"
+    return sequenced_algorithm
+
+
+def sequence_bricks(
+    wall: Wall, strides: list[Stride], model: ArmCostModel
+) -> SequenceReport:
+    """
+    Reorder the bricks of every stride, in place, to minimise arm time.
+
+    The head's round trip from the pickup point through the brick centres
+    is routed with precedence_route; a brick resting on another brick of
+    the same stride stays after it, so each stride is laid bottom-up. Sets
+    ``stride.arm_time`` and reports per-stride times before and after.
+    """
+    graph = SupportGraph(wall)
+    before: list[float] = []
+    after: list[float] = []
+
+    for stride in strides:
+        before.append(stride_arm_time(stride, model))
+
+        rows = graph.rows_of([b.id for b in stride.bricks]).tolist()
+        index_of = {row: i for i, row in enumerate(rows)}
+        successors: list[set[int]] = [
+            {index_of[d] for d in graph.dependents(row).tolist() if d in index_of}
+            for row in rows
+        ]
+        points = [Position(b.center_x, b.center_y) for b in stride.bricks]
+        order = precedence_route(
+            model.pickup(stride.robot_position),
+            points,
+            successors,
+            model.cost,
+            closed=True,
+        )
+        bricks = [stride.bricks[i] for i in order]
+        arm_time = _arm_time(stride.robot_position, bricks, model)
+
+        # Keep the planner's order when it is already bottom-up and quicker
+        planner_order_ok = all(
+            i < j for i, nexts in enumerate(successors) for j in nexts
+        )
+        if arm_time < before[-1] or not planner_order_ok:
+            stride.bricks = bricks
+        else:
+            arm_time = before[-1]
+        stride.arm_time = arm_time
+        after.append(arm_time)
+
+    return SequenceReport(sum(len(s.bricks) for s in strides), before, after)
+
+
+def stride_arm_time(stride: Stride, model: ArmCostModel) -> float:
+    """Arm time to lay a stride's bricks in their current order"""
+    return _arm_time(stride.robot_position, stride.bricks, model)
+
+
+def _arm_time(
+    robot_position: Position, bricks: list[Brick], model: ArmCostModel
+) -> float:
+    points = [Position(b.center_x, b.center_y) for b in bricks]
+    travel = route_cost(model.pickup(robot_position), points, model.cost, closed=True)
+    return travel + model.place_time * len(points)
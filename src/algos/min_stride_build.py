@@ -0,0 +1,141 @@
+from ..models.wall import Wall
+from ..models.robot import Robot
+from ..models.stride import StrideManager, Stride
+from ..models.common import Position, Movement
+from ..configs.config import Config
+import numpy as np
+import numpy.typing as npt
+
+
+def min_stride_build_algorithm(
+    wall: Wall, robot: Robot, stride_manager: StrideManager, config: Config
+) -> tuple[list[Stride], list[Movement]]:
+    """
+    Fewest strides over horizontal bands of the wall.
+
+    The rows of brick centres are split into bands at most one reach high,
+    and within a band the centres are covered by the fewest reach-wide
+    intervals (greedy, which is exact in 1D). A DP over band boundaries
+    picks the split with the fewest strides, then the fewest bands. Bands
+    are built bottom-up, zig-zagging left/right like naive_build.
+    """
+    columns = wall.columns()
+    center_x = columns.x + columns.widths / 2
+    center_y = columns.y + columns.heights / 2
+    levels, level_of = np.unique(center_y, return_inverse=True)
+
+    # Rows grouped by centre level, each group sorted by centre x
+    order = np.lexsort((center_x, level_of))
+    level_ptr = np.searchsorted(level_of[order], np.arange(len(levels) + 1))
+
+    bands = _best_bands(
+        levels, level_ptr, center_x[order], robot.reach_width, robot.reach_height
+    )
+
+    movements: list[Movement] = []
+    strides: list[Stride] = []
+
+    current_robot_pos = Position(robot.position.x, robot.position.y)
+
+    for band_index, (first, last) in enumerate(bands):
+        rows = order[level_ptr[first] : level_ptr[last]]
+        rows = rows[np.argsort(center_x[rows], kind="stable")]
+        intervals = _cover_intervals(center_x[rows], robot.reach_width)
+        if band_index % 2 == 1:
+            intervals.reverse()
+
+        for start, end in intervals:
+            xs = center_x[rows[start:end]]
+            new_pos = Position(float(xs[0] + xs[-1]) / 2, float(levels[first]))
+            if current_robot_pos != new_pos:
+                movements.append(Movement(current_robot_pos, new_pos))
+                current_robot_pos = new_pos
+
+            current_stride: Stride = stride_manager.create_stride(current_robot_pos)
+            for row in np.sort(rows[start:end]).tolist():
+                current_stride.add_brick(wall.bricks[row])
+            strides.append(current_stride)
+
+    built_count = sum(len(stride.bricks) for stride in strides)
+    print(f"Built {built_count}/{wall.total_bricks} bricks")
+
+    return strides, movements
+
+
+def _cover_intervals(
+    xs: npt.NDArray[np.float64], width: float
+) -> list[tuple[int, int]]:
+    """Fewest ``width``-wide intervals covering sorted ``xs``, as index slices"""
+    intervals: list[tuple[int, int]] = []
+    start = 0
+    while start < len(xs):
+        end = int(np.searchsorted(xs, xs[start] + width, side="right"))
+        intervals.append((start, end))
+        start = end
+    return intervals
+
+
+def _cover_count(xs: npt.NDArray[np.float64], width: float) -> int:
+    """len(_cover_intervals(xs, width)), with one searchsorted for all of xs"""
+    next_start = np.searchsorted(xs, xs + width, side="right").tolist()
+    count = 0
+    start = 0
+    while start < len(next_start):
+        start = next_start[start]
+        count += 1
+    return count
+
+
+def _merge_unique(
+    a: npt.NDArray[np.float64], b: npt.NDArray[np.float64]
+) -> npt.NDArray[np.float64]:
+    """Sorted distinct values of two sorted arrays, without re-sorting"""
+    merged = np.empty(len(a) + len(b), dtype=np.result_type(a, b))
+    b_slots = np.searchsorted(a, b, side="right") + np.arange(len(b))
+    a_slots = np.ones(len(merged), dtype=bool)
+    a_slots[b_slots] = False
+    merged[b_slots] = b
+    merged[a_slots] = a
+    distinct = np.ones(len(merged), dtype=bool)
+    distinct[1:] = merged[1:] != merged[:-1]
+    return merged[distinct]
+
+
+def _best_bands(
+    levels: npt.NDArray[np.float64],
+    level_ptr: npt.NDArray[np.intp],
+    sorted_x: npt.NDArray[np.float64],
+    reach_width: float,
+    reach_height: float,
+) -> list[tuple[int, int]]:
+    """
+    Split the centre levels into bands [first, last) of height <= reach_height
+    minimising (strides, bands).
+    """
+    count = len(levels)
+    best: list[tuple[int, int]] = [(0, 0)] * (count + 1)
+    split = [0] * (count + 1)
+
+    for last in range(1, count + 1):
+        candidate: tuple[int, int] | None = None
+        first = last - 1
+        # Distinct centres of the band [first, last), merged level by level
+        xs = np.empty(0)
+        while first >= 0 and levels[last - 1] - levels[first] <= reach_height:
+            xs = _merge_unique(xs, sorted_x[level_ptr[first] : level_ptr[first + 1]])
+            strides, bands = best[first]
+            cost = (strides + _cover_count(xs, reach_width), bands + 1)
+            if candidate is None or cost < candidate:
+                candidate = cost
+                split[last] = first
+            first -= 1
+        assert candidate is not None  # a single level always fits
+        best[last] = candidate
+
+    bands: list[tuple[int, int]] = []
+    last = count
+    while last > 0:
+        bands.append((split[last], last))
+        last = split[last]
+    bands.reverse()
+    return bands
@@ -18,14 +18,57 @@ def naive_build_algorithm(
     # we don't need to worry about boundary bricks as much.
     """
 
+    movements: list[Movement] = []
+    strides: list[Stride] = []
+
+    unbuilt_bricks: list[Brick] = list(wall.bricks)
+
+    current_robot_pos = Position(robot.position.x, robot.position.y)
+
+    for new_pos in zig_zag_positions(wall, config):
+        if current_robot_pos != new_pos:
+            movements.append(Movement(current_robot_pos, new_pos))
+            current_robot_pos = new_pos
+
+        # Temp
+        original_pos = robot.position
+        robot.position = current_robot_pos
+
+        reachable: list[Brick] = []
+        for brick in unbuilt_bricks[:]:
+            if robot.can_reach_brick(brick):
+                reachable.append(brick)
+
+        # Restore
+        robot.position = original_pos
+
+        # Create stride and add bricks
+        if reachable:
+            current_stride: Stride = stride_manager.create_stride(current_robot_pos)
+            for brick in reachable:
+                current_stride.add_brick(brick)
+                unbuilt_bricks.remove(brick)
+            strides.append(current_stride)
+
+    built_count = wall.total_bricks - len(unbuilt_bricks)
+    print(f"Built {built_count}/{wall.total_bricks} bricks")
+
+    return strides, movements
+
+
+def zig_zag_positions(wall: Wall, config: Config) -> list[Position]:
+    """
+    Robot positions of the naive lattice in visiting order.
+
+    Columns are stepped by the reach width (plus a final column that can
+    reach the right wall edge), rows by the reach height; even rows go left
+    to right, odd rows right to left.
+    """
     wall_width = config["wall"]["width"]
     wall_height = config["wall"]["height"]
     robot_reach_width = config["robot"]["reach_width"]
     robot_reach_height = config["robot"]["reach_height"]
 
-    movements: list[Movement] = []
-    strides: list[Stride] = []
-
     x_positions: list[float] = []
     x = robot_reach_width / 2
     while x <= wall_width:
@@ -46,42 +89,11 @@ def naive_build_algorithm(
             break  # Last position
         y += robot_reach_height
 
-    unbuilt_bricks: list[Brick] = list(wall.bricks)
-
-    current_robot_pos = Position(robot.position.x, robot.position.y)
-
+    positions: list[Position] = []
     for y_idx, y_pos in enumerate(y_positions):
         # zig-zag / even -> left to right, odd -> right to left
         x_range = x_positions if y_idx % 2 == 0 else x_positions[::-1]
-
         for x_pos in x_range:
-            # Calculate new position
-            new_pos = Position(x_pos, y_pos)
-            if current_robot_pos != new_pos:
-                movements.append(Movement(current_robot_pos, new_pos))
-                current_robot_pos = new_pos
-
-            # Temp
-            original_pos = robot.position
-            robot.position = current_robot_pos
-
-            reachable: list[Brick] = []
-            for brick in unbuilt_bricks[:]:
-                if robot.can_reach_brick(brick):
-                    reachable.append(brick)
-
-            # Restore
-            robot.position = original_pos
-
-            # Create stride and add bricks
-            if reachable:
-                current_stride: Stride = stride_manager.create_stride(current_robot_pos)
-                for brick in reachable:
-                    current_stride.add_brick(brick)
-                    unbuilt_bricks.remove(brick)
-                strides.append(current_stride)
+            positions.append(Position(x_pos, y_pos))
 
-    built_count = wall.total_bricks - len(unbuilt_bricks)
-    print(f"Built {built_count}/{wall.total_bricks} bricks")
-
-    return strides, movements
+    return positions
@@ -0,0 +1,169 @@
+from ..models.common import Position
+from collections.abc import Callable
+
+Cost = Callable[[Position, Position], float]
+
+
+def precedence_route(
+    start: Position,
+    points: list[Position],
+    successors: list[set[int]],
+    cost: Cost,
+    window: int = 50,
+    closed: bool = False,
+) -> list[int]:
+    """
+    Short visiting order of ``points`` from ``start`` under precedence.
+
+    ``successors[i]`` are the points that must be visited after point i.
+    Nearest-neighbour over the points whose predecessors are done builds a
+    first route, then 2-opt (segment reversal) and Or-opt (moving runs of
+    1-3 points) improve it until no move within ``window`` route positions
+    helps. ``cost`` must be symmetric. A ``closed`` route also pays the way
+    back to ``start``. Returns point indices in visiting order.
+    """
+    route = _nearest_neighbour(start, points, successors, cost)
+
+    # Node 0 is the start and never moves; node k + 1 is route[k]
+    nodes = [start] + [points[i] for i in route]
+    node_of = {point: k + 1 for k, point in enumerate(route)}
+    after: list[set[int]] = [set()]
+    after += [{node_of[j] for j in successors[i]} for i in route]
+    before: list[set[int]] = [set() for _ in nodes]
+    for node, nexts in enumerate(after):
+        for then in nexts:
+            before[then].add(node)
+
+    def node_cost(a: int, b: int | None) -> float:
+        # None is the end of the route
+        if b is None:
+            return cost(nodes[a], start) if closed else 0.0
+        return cost(nodes[a], nodes[b])
+
+    order = list(range(len(nodes)))
+    while _two_opt(order, after, node_cost, window) or _or_opt(
+        order, after, before, node_cost, window
+    ):
+        pass
+
+    return [route[node - 1] for node in order[1:]]
+
+
+def route_cost(
+    start: Position, points: list[Position], cost: Cost, closed: bool = False
+) -> float:
+    """Cost of visiting ``points`` in order from ``start``"""
+    total = 0.0
+    current = start
+    for point in points:
+        total += cost(current, point)
+        current = point
+    if closed:
+        total += cost(current, start)
+    return total
+
+
+def _nearest_neighbour(
+    start: Position,
+    points: list[Position],
+    successors: list[set[int]],
+    cost: Cost,
+) -> list[int]:
+    waiting = [0] * len(points)
+    for nexts in successors:
+        for then in nexts:
+            waiting[then] += 1
+
+    ready = [i for i, count in enumerate(waiting) if count == 0]
+    route: list[int] = []
+    current = start
+    while ready:
+        # Ties go to the lowest index, keeping the input order
+        pick = min(
+            range(len(ready)), key=lambda k: (cost(current, points[ready[k]]), ready[k])
+        )
+        chosen = ready.pop(pick)
+        route.append(chosen)
+        current = points[chosen]
+        for then in successors[chosen]:
+            waiting[then] -= 1
+            if waiting[then] == 0:
+                ready.append(then)
+
+    if len(route) != len(points):
+        raise ValueError("Route precedence contains a cycle")
+    return route
+
+
+def _two_opt(
+    order: list[int],
+    after: list[set[int]],
+    cost: Callable[[int, int | None], float],
+    window: int,
+) -> bool:
+    """Apply the first improving reversal of order[i..j]; False if none"""
+    rank = {node: k for k, node in enumerate(order)}
+    count = len(order)
+    for i in range(1, count - 1):
+        # Reversal is only valid while no precedence lies inside the segment
+        earliest_successor = count
+        for j in range(i, min(count, i + window)):
+            for n in after[order[j]]:
+                earliest_successor = min(earliest_successor, rank[n])
+            if earliest_successor <= j:
+                break
+            if j == i:
+                continue
+            nxt = order[j + 1] if j + 1 < count else None
+            delta = (
+                cost(order[i - 1], order[j])
+                + cost(order[i], nxt)
+                - cost(order[i - 1], order[i])
+                - cost(order[j], nxt)
+            )
+            if delta < -1e-9:
+                order[i : j + 1] = order[i : j + 1][::-1]
+                return True
+    return False
+
+
+def _or_opt(
+    order: list[int],
+    after: list[set[int]],
+    before: list[set[int]],
+    cost: Callable[[int, int | None], float],
+    window: int,
+) -> bool:
+    """Apply the first improving move of a run of 1-3 nodes; False if none"""
+    rank = {node: k for k, node in enumerate(order)}
+    count = len(order)
+    for length in (1, 2, 3):
+        for i in range(1, count - length + 1):
+            segment = order[i : i + length]
+            prev = order[i - 1]
+            nxt = order[i + length] if i + length < count else None
+            removed = (
+                cost(prev, segment[0]) + cost(segment[-1], nxt) - cost(prev, nxt)
+            )
+            # The run may not pass any of its predecessors or successors
+            latest_predecessor = max(
+                (rank[n] for node in segment for n in before[node]), default=0
+            )
+            earliest_successor = min(
+                (rank[n] for node in segment for n in after[node]), default=count
+            )
+            lowest = max(i - window, latest_predecessor + 1)
+            highest = min(i + length + window, earliest_successor, count)
+            # Insert between order[p - 1] and order[p]
+            for p in range(lowest, highest + 1):
+                if i <= p <= i + length:
+                    continue
+                u = order[p - 1]
+                v = order[p] if p < count else None
+                added = cost(u, segment[0]) + cost(segment[-1], v) - cost(u, v)
+                if added - removed < -1e-9:
+                    at = p if p < i else p - length
+                    del order[i : i + length]
+                    order[at:at] = segment
+                    return True
+    return False
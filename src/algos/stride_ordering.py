@@ -0,0 +1,130 @@
+from .support_order import Algorithm
+from .routing import precedence_route
+from ..models.wall import Wall
+from ..models.robot import Robot
+from ..models.stride import StrideManager, Stride
+from ..models.common import Position, Movement
+from ..models.support import SupportGraph
+from ..models.travel import TravelCostModel
+from ..configs.config import Config
+from dataclasses import dataclass
+import numpy as np
+
+
+@dataclass
+class TravelReport:
+    before: float
+    after: float
+    movements_before: int
+    movements_after: int
+
+    def __str__(self) -> str:
+        saved = 100 * (1 - self.after / self.before) if self.before else 0.0
+        return (
+            f"Travel time: {self.before:.1f}s → {self.after:.1f}s "
+            f"({saved:.1f}% saved), "
+            f"movements: {self.movements_before} → {self.movements_after}"
+        )
+
+
+def travel_ordered(
+    algorithm: Algorithm, model: TravelCostModel | None = None
+) -> Algorithm:
+    """Planner stage: run ``algorithm``, then reorder its strides by travel time"""
+
+    def travel_ordered_algorithm(
+        wall: Wall, robot: Robot, stride_manager: StrideManager, config: Config
+    ) -> tuple[list[Stride], list[Movement]]:
+        draft, _ = algorithm(wall, robot, StrideManager(), config)
+        strides, movements, report = order_strides(
+            wall,
+            robot,
+            draft,
+            stride_manager,
+            model or TravelCostModel.from_config(config),
+        )
+        print(report)
+        return strides, movements
+
+    travel_ordered_algorithm.__name__ = f"travel_ordered_{algorithm.__name__}"
+    return travel_ordered_algorithm
+
+
+def order_strides(
+    wall: Wall,
+    robot: Robot,
+    draft: list[Stride],
+    stride_manager: StrideManager,
+    model: TravelCostModel,
+    window: int = 50,
+) -> tuple[list[Stride], list[Movement], TravelReport]:
+    """
+    Reorder strides to minimise total travel time from the robot's position.
+
+    Nearest-neighbour builds a first tour, then 2-opt (segment reversal)
+    and Or-opt (moving runs of 1-3 strides) improve it until no move within
+    ``window`` tour positions helps. Strides that lay a brick resting on a
+    brick of an earlier draft stride stay after it, so reordering never
+    breaks support that the draft respected.
+    """
+    start = Position(robot.position.x, robot.position.y)
+    successors = _precedence(wall, draft)
+
+    points = [stride.robot_position for stride in draft]
+    tour = precedence_route(start, points, successors, model.cost, window)
+
+    strides, movements = emit_strides(start, [draft[i] for i in tour], stride_manager)
+    _, draft_movements = emit_strides(start, draft, None)
+    report = TravelReport(
+        before=model.total(draft_movements),
+        after=model.total(movements),
+        movements_before=len(draft_movements),
+        movements_after=len(movements),
+    )
+    return strides, movements, report
+
+
+def emit_strides(
+    start: Position,
+    order: list[Stride],
+    stride_manager: StrideManager | None,
+) -> tuple[list[Stride], list[Movement]]:
+    """Movements visiting ``order`` from ``start``, and its strides re-created
+    in that order by ``stride_manager`` (the given strides when None)."""
+    movements: list[Movement] = []
+    strides: list[Stride] = []
+
+    current_robot_pos = start
+    for stride in order:
+        new_pos = stride.robot_position
+        if current_robot_pos != new_pos:
+            movements.append(Movement(current_robot_pos, new_pos))
+            current_robot_pos = new_pos
+
+        if stride_manager is None:
+            strides.append(stride)
+            continue
+        current_stride = stride_manager.create_stride(current_robot_pos)
+        for brick in stride.bricks:
+            current_stride.add_brick(brick)
+        strides.append(current_stride)
+
+    return strides, movements
+
+
+def _precedence(wall: Wall, draft: list[Stride]) -> list[set[int]]:
+    """Draft strides that must stay after each draft stride"""
+    graph = SupportGraph(wall)
+    stride_of = np.full(len(graph), -1, dtype=np.int64)
+    for i, stride in enumerate(draft):
+        stride_of[graph.rows_of([b.id for b in stride.bricks])] = i
+
+    brick, supporter = graph.edges()
+    above = stride_of[brick]
+    below = stride_of[supporter]
+    keep = (below >= 0) & (above > below)
+
+    successors: list[set[int]] = [set() for _ in draft]
+    for first, then in zip(below[keep].tolist(), above[keep].tolist()):
+        successors[first].add(then)
+    return successors
@@ -0,0 +1,94 @@
+from ..models.wall import Wall
+from ..models.robot import Robot
+from ..models.stride import StrideManager, Stride
+from ..models.common import Position, Movement
+from ..models.support import SupportGraph
+from ..models.reachability import ReachabilityMatrix
+from ..configs.config import Config
+from collections.abc import Callable
+import numpy as np
+
+Algorithm = Callable[
+    [Wall, Robot, StrideManager, Config], tuple[list[Stride], list[Movement]]
+]
+
+
+def support_ordered(algorithm: Algorithm) -> Algorithm:
+    """Planner mode: run ``algorithm``, then reorder its plan by support"""
+
+    def support_ordered_algorithm(
+        wall: Wall, robot: Robot, stride_manager: StrideManager, config: Config
+    ) -> tuple[list[Stride], list[Movement]]:
+        draft, _ = algorithm(wall, robot, StrideManager(), config)
+        return order_by_support(wall, robot, draft, stride_manager)
+
+    support_ordered_algorithm.__name__ = f"support_ordered_{algorithm.__name__}"
+    return support_ordered_algorithm
+
+
+def order_by_support(
+    wall: Wall, robot: Robot, draft: list[Stride], stride_manager: StrideManager
+) -> tuple[list[Stride], list[Movement]]:
+    """
+    Re-emit a plan so every brick is laid after the bricks it rests on.
+
+    The draft's robot positions are swept in order; each visit lays every
+    unlaid brick reachable from the position whose supporters are already
+    laid, bottom course first, so a brick may move to an earlier stride that
+    can also reach it. Sweeps repeat (revisiting positions) until every
+    brick is laid; a plan that already respects support keeps its strides.
+    """
+    graph = SupportGraph(wall)
+    # Bricks outside the draft count as laid, so nothing new is planned
+    laid = np.ones(len(graph), dtype=bool)
+    laid[graph.rows_of([b.id for s in draft for b in s.bricks])] = False
+    # Supporters not laid yet, by row
+    brick, supporter = graph.edges()
+    waiting = np.bincount(brick[~laid[supporter]], minlength=len(graph))
+
+    reachability = ReachabilityMatrix.for_robot(
+        wall, robot, [(s.robot_position.x, s.robot_position.y) for s in draft]
+    )
+    candidates: list[list[int]] = []
+    for i in range(len(draft)):
+        rows = reachability.bricks_reachable_from(i)
+        rows = rows[~laid[rows]]
+        rows = rows[np.lexsort((rows, graph.course[rows]))]
+        candidates.append(rows.tolist())
+
+    movements: list[Movement] = []
+    strides: list[Stride] = []
+
+    current_robot_pos = Position(robot.position.x, robot.position.y)
+
+    remaining = sum(len(stride.bricks) for stride in draft)
+    while remaining:
+        laid_in_sweep = 0
+        for draft_stride, rows in zip(draft, candidates):
+            ready: list[int] = []
+            for row in rows:
+                if not laid[row] and waiting[row] == 0:
+                    ready.append(row)
+                    laid[row] = True
+                    waiting[graph.dependents(row)] -= 1
+            if not ready:
+                continue
+
+            new_pos = draft_stride.robot_position
+            if current_robot_pos != new_pos:
+                movements.append(Movement(current_robot_pos, new_pos))
+                current_robot_pos = new_pos
+
+            current_stride = stride_manager.create_stride(current_robot_pos)
+            for row in ready:
+                current_stride.add_brick(wall.bricks[row])
+            strides.append(current_stride)
+            laid_in_sweep += len(ready)
+
+        if not laid_in_sweep:
+            raise ValueError(
+                f"{remaining} bricks cannot be laid on top of the plan's bricks"
+            )
+        remaining -= laid_in_sweep
+
+    return strides, movements
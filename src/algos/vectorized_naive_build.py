@@ -0,0 +1,52 @@
+from .naive_build import zig_zag_positions
+from ..models.wall import Wall
+from ..models.reachability import ReachabilityMatrix
+from ..models.robot import Robot
+from ..models.stride import StrideManager, Stride
+from ..models.common import Position, Movement
+from ..configs.config import Config
+import numpy as np
+
+
+def vectorized_naive_build_algorithm(
+    wall: Wall, robot: Robot, stride_manager: StrideManager, config: Config
+) -> tuple[list[Stride], list[Movement]]:
+    """
+    Same zig-zag lattice and brick assignment as naive_build_algorithm,
+    producing identical strides and movements.
+
+    Reach is read from the shared ReachabilityMatrix for the lattice, so
+    each robot position only looks at the bricks it covers and an
+    assigned-bricks mask replaces removing from a list.
+    """
+    positions = zig_zag_positions(wall, config)
+    reachability = ReachabilityMatrix.for_robot(
+        wall, robot, [(p.x, p.y) for p in positions]
+    )
+    assigned = np.zeros(wall.total_bricks, dtype=bool)  # indexed by row
+
+    movements: list[Movement] = []
+    strides: list[Stride] = []
+
+    current_robot_pos = Position(robot.position.x, robot.position.y)
+
+    for i, new_pos in enumerate(positions):
+        if current_robot_pos != new_pos:
+            movements.append(Movement(current_robot_pos, new_pos))
+            current_robot_pos = new_pos
+
+        rows = reachability.bricks_reachable_from(i)
+        rows = rows[~assigned[rows]]
+
+        # Create stride and add bricks
+        if len(rows):
+            assigned[rows] = True
+            current_stride: Stride = stride_manager.create_stride(current_robot_pos)
+            for row in rows.tolist():
+                current_stride.add_brick(wall.bricks[row])
+            strides.append(current_stride)
+
+    built_count = int(assigned.sum())
+    print(f"Built {built_count}/{wall.total_bricks} bricks")
+
+    return strides, movements
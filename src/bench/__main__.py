@@ -0,0 +1,189 @@
+"""
+Headless algorithm x wall benchmark.
+
+Runs every registered algorithm against every wall config in
+``src/configs/`` plus scaled stretcher bond walls, in a process pool, and
+writes a JSON and a CSV report with the time per stage (bond calculation,
+validation, wall population, bond quality analysis, planning), bond
+quality (minimum lap, aligned joints, long staggered-step runs), strides,
+movements and travel time.
+
+    python -m src.bench --sizes 10000 100000 --out bench_results
+"""
+
+from .synthetic import scaled_config
+from ..configs.config import load_wall_config, Config
+from ..models.bond_quality import analyze_bond
+from ..models.brick import Brick
+from ..models.robot import Robot
+from ..models.stride import StrideManager
+from ..models.travel import TravelCostModel
+from ..models.wall import Wall
+from ..registry import (
+    ALGORITHMS,
+    get_algorithm,
+    get_bond_calculator,
+    bond_type_for_wall,
+)
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+import argparse
+import contextlib
+import csv
+import io
+import json
+import os
+import time
+
+CONFIG_DIR = Path("src/configs")
+
+
+@dataclass
+class BenchResult:
+    wall: str
+    bond: str
+    algorithm: str
+    bricks: int = 0
+    layout_issues: int = 0
+    bond_s: float = 0.0
+    validation_s: float = 0.0
+    population_s: float = 0.0
+    quality_s: float = 0.0
+    min_lap: float = 0.0
+    aligned_joints: int = 0
+    long_step_runs: int = 0
+    planning_s: float = 0.0
+    strides: int = 0
+    movements: int = 0
+    travel_s: float = 0.0
+    error: str = ""
+
+
+def wall_cases(sizes: list[int]) -> list[tuple[str, Config]]:
+    """Every shipped wall config, then stretcher bond walls scaled to ``sizes``"""
+    cases = [
+        (path.stem, load_wall_config(path.stem))
+        for path in sorted(CONFIG_DIR.glob("*.yaml"))
+    ]
+    for size in sizes:
+        config = scaled_config(load_wall_config("stretcher_bond_wall"), size)
+        cases.append((config["name"], config))
+    return cases
+
+
+def run_case(wall_name: str, config: Config, algo_name: str) -> BenchResult:
+    """Run one algorithm on one wall config, timing every stage"""
+    bond_type = bond_type_for_wall(wall_name)
+    result = BenchResult(wall_name, bond_type, algo_name)
+    try:
+        Brick.configure(config)
+        wall = Wall(config)
+
+        start = time.perf_counter()
+        bricks = get_bond_calculator(bond_type)(wall, config)
+        result.bond_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        report = wall.validate_layout(bricks)
+        result.validation_s = time.perf_counter() - start
+        # Invalid layouts are still planned with their accepted bricks
+        result.layout_issues = len(report.issues)
+
+        start = time.perf_counter()
+        for brick in report.accepted:
+            wall.add_brick(brick)
+        result.population_s = time.perf_counter() - start
+        result.bricks = wall.total_bricks
+
+        start = time.perf_counter()
+        quality = analyze_bond(wall)
+        result.quality_s = time.perf_counter() - start
+        result.min_lap = quality.min_lap
+        result.aligned_joints = quality.aligned_joints
+        result.long_step_runs = quality.long_step_runs
+
+        robot = Robot(config)
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            strides, movements = get_algorithm(algo_name)(
+                wall, robot, StrideManager(), config
+            )
+        result.planning_s = time.perf_counter() - start
+
+        result.strides = len(strides)
+        result.movements = len(movements)
+        result.travel_s = TravelCostModel.from_config(config).total(movements)
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    return result
+
+
+def run_all(
+    cases: list[tuple[str, Config]], algorithms: list[str], workers: int | None
+) -> list[BenchResult]:
+    jobs = [(name, config, algo) for name, config in cases for algo in algorithms]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_case, *job) for job in jobs]
+        return [future.result() for future in futures]
+
+
+def write_report(results: list[BenchResult], out_dir: Path) -> tuple[Path, Path]:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    json_path = out_dir / "bench.json"
+    csv_path = out_dir / "bench.csv"
+
+    json_path.write_text(json.dumps([asdict(r) for r in results], indent=2))
+    with open(csv_path, "w", newline="") as file:
+        names = [f.name for f in fields(BenchResult)]
+        writer = csv.DictWriter(file, fieldnames=names)
+        writer.writeheader()
+        writer.writerows(asdict(r) for r in results)
+
+    return json_path, csv_path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Algorithm x wall benchmark")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="*",
+        default=[10_000],
+        help="Brick counts of the scaled stretcher bond walls to add",
+    )
+    parser.add_argument(
+        "--algos",
+        nargs="+",
+        default=list(ALGORITHMS),
+        help="Algorithms to run (default: all registered)",
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--out", type=Path, default=Path("bench_results"))
+    args = parser.parse_args()
+
+    results = run_all(wall_cases(args.sizes), args.algos, args.workers)
+
+    print(
+        f"{'wall':<32} {'algorithm':<24} {'bricks':>8} {'issues':>6} {'bond':>7} "
+        f"{'valid':>7} {'populate':>8} {'quality':>7} {'lap':>5} {'aligned':>7} "
+        f"{'plan':>7} {'strides':>7} {'moves':>6} {'travel':>8}"
+    )
+    for r in results:
+        if r.error:
+            print(f"{r.wall:<32} {r.algorithm:<24} {r.error}")
+            continue
+        print(
+            f"{r.wall:<32} {r.algorithm:<24} {r.bricks:>8} {r.layout_issues:>6} "
+            f"{r.bond_s:>7.3f} "
+            f"{r.validation_s:>7.3f} {r.population_s:>8.3f} {r.quality_s:>7.3f} "
+            f"{r.min_lap:>5g} {r.aligned_joints:>7} {r.planning_s:>7.3f} "
+            f"{r.strides:>7} {r.movements:>6} {r.travel_s:>8.1f}"
+        )
+
+    json_path, csv_path = write_report(results, args.out)
+    print(f"Wrote {json_path} and {csv_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Brick geometry micro-benchmark.
+
+Times the hot geometry checks (overlap, reach, point containment) and counts
+how many ``Position`` objects each check allocates, next to the equivalent
+written against the ``Position``-returning properties.
+
+    python -m src.bench.geometry
+"""
+
+from .synthetic import scaled_config
+from ..bonds.stretcher_bond import calculate_stretcher_bond
+from ..configs.config import load_wall_config
+from ..models.brick import Brick
+from ..models.common import Position
+from ..models.robot import Robot
+from ..models.wall import Wall
+from collections.abc import Callable
+import argparse
+import time
+
+
+def _allocating_contains(brick: Brick, x: float, y: float) -> bool:
+    return (
+        brick.bottom_left.x <= x <= brick.bottom_right.x
+        and brick.bottom_left.y <= y <= brick.top_left.y
+    )
+
+
+def _allocating_overlap(wall: Wall, brick1: Brick, brick2: Brick) -> bool:
+    head_joint = wall.config["joints"]["head_joint"]
+    return not (
+        brick1.bottom_left.x + brick1.length + head_joint <= brick2.bottom_left.x
+        or brick2.bottom_left.x + brick2.length + head_joint <= brick1.bottom_left.x
+        or brick1.top_left.y <= brick2.bottom_left.y
+        or brick2.top_left.y <= brick1.bottom_left.y
+    )
+
+
+def _allocating_reach(robot: Robot, brick: Brick) -> bool:
+    x_min, y_min, x_max, y_max = robot.reach_area
+    center = brick.center
+    return x_min <= center.x <= x_max and y_min <= center.y <= y_max
+
+
+def count_position_allocations(check: Callable[[], object]) -> int:
+    """Number of Position objects created by one call of ``check``"""
+    created = 0
+    original_init = Position.__init__
+
+    def counting_init(self: Position, x: float, y: float) -> None:
+        nonlocal created
+        created += 1
+        original_init(self, x, y)
+
+    Position.__init__ = counting_init  # type: ignore[method-assign]
+    try:
+        check()
+    finally:
+        Position.__init__ = original_init  # type: ignore[method-assign]
+    return created
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Brick geometry micro-benchmark")
+    parser.add_argument("--bricks", type=int, default=10_000)
+    args = parser.parse_args()
+
+    config = scaled_config(load_wall_config("stretcher_bond_wall"), args.bricks)
+    Brick.configure(config)
+    wall = Wall(config)
+    bricks = calculate_stretcher_bond(wall, config)
+    robot = Robot(config)
+    probe = bricks[len(bricks) // 2]
+    px, py = probe.center_x, probe.center_y
+
+    cases: list[tuple[str, Callable[[], object], Callable[[], object]]] = [
+        (
+            "overlap",
+            lambda: [wall._bricks_overlap(probe, b) for b in bricks],
+            lambda: [_allocating_overlap(wall, probe, b) for b in bricks],
+        ),
+        (
+            "reach",
+            lambda: [robot.can_reach_brick(b) for b in bricks],
+            lambda: [_allocating_reach(robot, b) for b in bricks],
+        ),
+        (
+            "contains_point",
+            lambda: [b.contains_point(px, py) for b in bricks],
+            lambda: [_allocating_contains(b, px, py) for b in bricks],
+        ),
+    ]
+
+    print(f"{len(bricks)} bricks per pass")
+    print(f"{'check':<16} {'variant':<12} {'ns/check':>10} {'Position allocs':>16}")
+    for name, current, allocating in cases:
+        for variant, check in (("current", current), ("allocating", allocating)):
+            start = time.perf_counter()
+            check()
+            elapsed = time.perf_counter() - start
+            allocs = count_position_allocations(check) / len(bricks)
+            print(
+                f"{name:<16} {variant:<12} {elapsed / len(bricks) * 1e9:>10.0f} "
+                f"{allocs:>16.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Planner scaling benchmark.
+
+Runs naive_build and its vectorized variant on scaled stretcher bond walls
+and reports planning time. The original planner is skipped above
+``--naive-max`` bricks since it is quadratic.
+
+    python -m src.bench.planner_scaling --sizes 1000 10000 100000
+"""
+
+from .synthetic import scaled_config
+from ..algos.naive_build import naive_build_algorithm
+from ..algos.vectorized_naive_build import vectorized_naive_build_algorithm
+from ..bonds.stretcher_bond import calculate_stretcher_bond
+from ..configs.config import load_wall_config
+from ..models.brick import Brick
+from ..models.robot import Robot
+from ..models.stride import StrideManager
+from ..models.wall import Wall
+import argparse
+import contextlib
+import io
+import time
+
+
+def time_planner(algorithm, target_bricks: int) -> tuple[int, int, float]:
+    """Returns (bricks, strides, seconds spent planning)"""
+    config = scaled_config(load_wall_config("stretcher_bond_wall"), target_bricks)
+    Brick.configure(config)
+    wall = Wall(config)
+    wall.add_bricks(calculate_stretcher_bond(wall, config))
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        strides, _ = algorithm(wall, Robot(config), StrideManager(), config)
+    elapsed = time.perf_counter() - start
+
+    return wall.total_bricks, len(strides), elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Planner scaling benchmark")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument(
+        "--naive-max",
+        type=int,
+        default=20_000,
+        help="Largest wall to run the original naive_build on",
+    )
+    args = parser.parse_args()
+
+    print(f"{'bricks':>10} {'strides':>8} {'naive (s)':>10} {'vectorized (s)':>15}")
+    for size in args.sizes:
+        count, strides, vectorized = time_planner(
+            vectorized_naive_build_algorithm, size
+        )
+        naive = "-"
+        if size <= args.naive_max:
+            naive = f"{time_planner(naive_build_algorithm, size)[2]:.3f}"
+        print(f"{count:>10} {strides:>8} {naive:>10} {vectorized:>15.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Headless build simulation throughput.
+
+Plans scaled stretcher bond walls with naive_build_vectorized and lays every
+brick through ``BuildSimulator`` in robot mode, with no display, reporting
+brick placements per second.
+
+    python -m src.bench.simulation --sizes 10000 100000 1000000 --columnar
+"""
+
+from .synthetic import scaled_config
+from ..algos.vectorized_naive_build import vectorized_naive_build_algorithm
+from ..bonds.stretcher_bond import calculate_stretcher_bond
+from ..configs.config import load_wall_config
+from ..models.brick import Brick
+from ..models.robot import Robot
+from ..models.stride import StrideManager
+from ..models.wall import Wall
+from ..simulator import BuildSimulator
+import argparse
+import contextlib
+import io
+import time
+
+
+def simulate(target_bricks: int, columnar: bool = False) -> tuple[int, float]:
+    """Returns (bricks laid, seconds spent laying them)"""
+    config = scaled_config(load_wall_config("stretcher_bond_wall"), target_bricks)
+    Brick.configure(config)
+    wall = Wall(config, columnar=columnar)
+    wall.add_bricks(calculate_stretcher_bond(wall, config))
+    robot = Robot(config)
+    with contextlib.redirect_stdout(io.StringIO()):
+        strides, _ = vectorized_naive_build_algorithm(
+            wall, robot, StrideManager(), config
+        )
+
+    simulator = BuildSimulator(wall, robot, strides)
+    simulator.toggle_mode()
+    start = time.perf_counter()
+    laid = simulator.run_to_end()
+    elapsed = time.perf_counter() - start
+
+    assert wall.built_count == wall.total_bricks
+    return laid, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Headless build simulation")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument(
+        "--columnar", action="store_true", help="Use the columnar brick store"
+    )
+    args = parser.parse_args()
+
+    print(f"{'bricks':>10} {'seconds':>8} {'bricks/s':>10}")
+    for size in args.sizes:
+        laid, elapsed = simulate(size, args.columnar)
+        print(f"{laid:>10} {elapsed:>8.2f} {laid / elapsed:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
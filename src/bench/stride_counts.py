@@ -0,0 +1,81 @@
+"""
+Stride / movement comparison of the planners.
+
+Plans every shipped wall config (plus optional scaled stretcher bond walls)
+with naive_build and min_stride and prints the stride and movement counts.
+
+    python -m src.bench.stride_counts --sizes 10000 100000
+"""
+
+from .synthetic import scaled_config
+from ..algos.naive_build import naive_build_algorithm
+from ..algos.vectorized_naive_build import vectorized_naive_build_algorithm
+from ..algos.min_stride_build import min_stride_build_algorithm
+from ..bonds.stretcher_bond import calculate_stretcher_bond
+from ..bonds.english_cross_bond import calculate_english_cross_bond
+from ..bonds.flemish_bond import calculate_flemish_bond
+from ..bonds.wild_bond import calculate_wild_bond
+from ..configs.config import load_wall_config, Config
+from ..models.brick import Brick
+from ..models.robot import Robot
+from ..models.stride import StrideManager
+from ..models.wall import Wall
+import argparse
+import contextlib
+import io
+
+SHIPPED_WALLS = {
+    "test_small_wall": calculate_stretcher_bond,
+    "stretcher_bond_wall": calculate_stretcher_bond,
+    "english_cross_bond_wall": calculate_english_cross_bond,
+    "flemish_bond_wall": calculate_flemish_bond,
+    "wild_bond_wall": calculate_wild_bond,
+}
+
+
+def plan_counts(config: Config, bond_calculator, algorithm) -> tuple[int, int]:
+    """Returns (strides, movements) of planning ``config`` with ``algorithm``"""
+    Brick.configure(config)
+    wall = Wall(config)
+    wall.add_bricks(bond_calculator(wall, config))
+    with contextlib.redirect_stdout(io.StringIO()):
+        strides, movements = algorithm(wall, Robot(config), StrideManager(), config)
+    return len(strides), len(movements)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Planner stride comparison")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="*",
+        default=[],
+        help="Also compare scaled stretcher bond walls of these brick counts",
+    )
+    args = parser.parse_args()
+
+    cases = [
+        (name, load_wall_config(name), calculator)
+        for name, calculator in SHIPPED_WALLS.items()
+    ]
+    for size in args.sizes:
+        config = scaled_config(load_wall_config("stretcher_bond_wall"), size)
+        cases.append((config["name"], config, calculate_stretcher_bond))
+
+    print(
+        f"{'wall':<32} {'naive strides':>13} {'min strides':>11} "
+        f"{'naive moves':>11} {'min moves':>9}"
+    )
+    for name, config, calculator in cases:
+        # naive_build is quadratic; its vectorized twin yields the same plan
+        naive = plan_counts(config, calculator, vectorized_naive_build_algorithm)
+        if name in SHIPPED_WALLS:
+            assert naive == plan_counts(config, calculator, naive_build_algorithm)
+        best = plan_counts(config, calculator, min_stride_build_algorithm)
+        print(
+            f"{name:<32} {naive[0]:>13} {best[0]:>11} {naive[1]:>11} {best[1]:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+from ..configs.config import Config
+import copy
+import math
+
+
+def scaled_config(config: Config, target_bricks: int) -> Config:
+    """Scale a wall config up (or down) to hold roughly ``target_bricks``.
+
+    The wall keeps the aspect ratio of the original config and is snapped to
+    whole brick units / courses so the shipped bond calculators still close
+    the courses cleanly.
+    """
+    scaled = copy.deepcopy(config)
+
+    head_joint = config["joints"]["head_joint"]
+    unit_width = config["bricks"]["full"]["length"] + head_joint
+    course_height = config["joints"]["bed_joint"] + config["bricks"]["full"]["height"]
+
+    aspect = config["wall"]["width"] / config["wall"]["height"]
+    area = target_bricks * unit_width * course_height
+    height = math.sqrt(area / aspect)
+    width = area / height
+
+    scaled["wall"]["width"] = max(1, round(width / unit_width)) * unit_width
+    scaled["wall"]["height"] = max(1, round(height / course_height)) * course_height
+    scaled["name"] = f"{config.get('name', 'wall')}_x{target_bricks}"
+
+    return scaled
@@ -0,0 +1,73 @@
+"""
+Wall population benchmark.
+
+Populates scaled stretcher bond walls through ``Wall.try_add_brick`` (or the
+bulk ``Wall.add_bricks`` sweep with ``--bulk``) and reports the time per
+brick, which should stay roughly flat as the wall grows. ``--stream`` feeds
+the course generator straight into ``Wall.add_courses`` instead, so the time
+includes generating the bond and the full brick list is never built.
+
+    python -m src.bench.wall_population --sizes 1000 10000 100000 1000000
+"""
+
+from .synthetic import scaled_config
+from ..bonds.stretcher_bond import calculate_stretcher_bond, iter_stretcher_courses
+from ..configs.config import load_wall_config
+from ..models.brick import Brick
+from ..models.wall import Wall
+import argparse
+import time
+
+
+def populate(
+    target_bricks: int, bulk: bool = False, stream: bool = False
+) -> tuple[int, float]:
+    """Returns (bricks added, seconds spent validating and adding)"""
+    config = scaled_config(load_wall_config("stretcher_bond_wall"), target_bricks)
+    Brick.configure(config)
+    wall = Wall(config)
+    if stream:
+        start = time.perf_counter()
+        wall.add_courses(iter_stretcher_courses(wall, config))
+        return wall.total_bricks, time.perf_counter() - start
+
+    bricks = calculate_stretcher_bond(wall, config)
+
+    start = time.perf_counter()
+    if bulk:
+        wall.add_bricks(bricks)
+    else:
+        for brick in bricks:
+            wall.try_add_brick(brick)
+    elapsed = time.perf_counter() - start
+
+    return wall.total_bricks, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Wall population benchmark")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1_000, 10_000, 100_000, 1_000_000],
+        help="Approximate brick counts to benchmark",
+    )
+    parser.add_argument(
+        "--bulk", action="store_true", help="Use the bulk Wall.add_bricks sweep"
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Generate and add course by course with Wall.add_courses",
+    )
+    args = parser.parse_args()
+
+    print(f"{'bricks':>10} {'total (s)':>10} {'per brick (us)':>15}")
+    for size in args.sizes:
+        count, elapsed = populate(size, bulk=args.bulk, stream=args.stream)
+        print(f"{count:>10} {elapsed:>10.3f} {elapsed / count * 1e6:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
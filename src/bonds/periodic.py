@@ -0,0 +1,206 @@
+"""
+Declarative engine for periodic bonds.
+
+A periodic bond is a repeating sequence of course templates. Each template
+says which bricks open the course, which unit repeats along it and how it
+closes at the wall's edge. For a given wall the templates are compiled once
+into x offset / brick type arrays, then tiled across the courses with NumPy,
+so generating a wall costs O(period * width) + O(n) array fills and a new
+periodic bond is a few lines of data.
+"""
+
+from ..models.wall import Wall
+from ..models.common import Position
+from ..models.brick import Brick
+from ..configs.config import Config
+from collections.abc import Iterator
+from dataclasses import dataclass
+import numpy as np
+import numpy.typing as npt
+
+
+@dataclass(frozen=True)
+class CourseTemplate:
+    """
+    One course of a periodic bond, laid left to right:
+
+    1. ``start`` bricks, while they fit.
+    2. ``repeat`` cycled for as long as the next brick still leaves room
+       for the ``end`` bricks.
+    3. ``end`` bricks if they all fit, otherwise the first ``fill`` brick
+       that fits in the remaining space.
+    """
+
+    start: tuple[str, ...] = ()
+    repeat: tuple[str, ...] = ("full",)
+    end: tuple[str, ...] = ()
+    fill: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class PeriodicBond:
+    """A bond whose course ``c`` is laid from ``courses[c % len(courses)]``"""
+
+    name: str
+    courses: tuple[CourseTemplate, ...]
+
+    def compile(self, config: Config) -> "CompiledBond":
+        return CompiledBond.compile(self, config)
+
+    def calculate(self, wall: Wall, config: Config) -> list[Brick]:
+        return self.compile(config).bricks()
+
+    def iter_courses(self, wall: Wall, config: Config) -> Iterator[list[Brick]]:
+        compiled = self.compile(config)
+        brick_id = 0
+        for course in range(compiled.num_courses):
+            bricks = compiled.course_bricks(course, brick_id)
+            brick_id += len(bricks)
+            yield bricks
+
+
+@dataclass
+class CompiledBond:
+    """Course templates laid out for one wall, as x offset / type code arrays"""
+
+    types: list[str]  # type code -> brick type
+    course_xs: list[npt.NDArray[np.float64]]  # per template
+    course_types: list[npt.NDArray[np.int16]]  # per template
+    course_height: float
+    num_courses: int
+
+    @classmethod
+    def compile(cls, bond: PeriodicBond, config: Config) -> "CompiledBond":
+        width = config["wall"]["width"]
+        height = config["wall"]["height"]
+        full_height = config["bricks"]["full"]["height"]
+        course_height = config["joints"]["bed_joint"] + full_height
+        lengths = {name: brick["length"] for name, brick in config["bricks"].items()}
+        head_joint = config["joints"]["head_joint"]
+
+        types = sorted(
+            {
+                name
+                for template in bond.courses
+                for name in (
+                    *template.start,
+                    *template.repeat,
+                    *template.end,
+                    *template.fill,
+                )
+            }
+        )
+        code = {name: i for i, name in enumerate(types)}
+        course_xs = []
+        course_types = []
+        for template in bond.courses:
+            layout = _lay_course(template, width, lengths, head_joint)
+            course_xs.append(np.array([x for x, _ in layout], dtype=np.float64))
+            course_types.append(
+                np.array([code[name] for _, name in layout], dtype=np.int16)
+            )
+
+        # Every course must fit its full-height bricks under the wall's top
+        num_courses = int(height / course_height)
+        while num_courses and (num_courses - 1) * course_height + full_height > height:
+            num_courses -= 1
+
+        return cls(types, course_xs, course_types, course_height, num_courses)
+
+    @property
+    def period(self) -> int:
+        return len(self.course_xs)
+
+    def arrays(
+        self,
+    ) -> tuple[
+        npt.NDArray[np.int64],
+        npt.NDArray[np.float64],
+        npt.NDArray[np.float64],
+        npt.NDArray[np.int16],
+    ]:
+        """(ids, xs, ys, type codes) of every brick, course by course"""
+        period = self.period
+        template_sizes = np.array([len(xs) for xs in self.course_xs], dtype=np.int64)
+        template_starts = np.concatenate(([0], np.cumsum(template_sizes)[:-1]))
+        all_xs = np.concatenate(self.course_xs)
+        all_types = np.concatenate(self.course_types)
+
+        courses = np.arange(self.num_courses)
+        templates = courses % period
+        sizes = template_sizes[templates]
+        total = int(sizes.sum())
+        course_starts = np.cumsum(sizes) - sizes
+
+        course_of = np.repeat(courses, sizes)
+        within = np.arange(total) - course_starts[course_of]
+        source = template_starts[templates[course_of]] + within
+
+        ids = np.arange(total, dtype=np.int64)
+        ys = course_of * self.course_height
+        return ids, all_xs[source], ys.astype(np.float64), all_types[source]
+
+    def bricks(self) -> list[Brick]:
+        ids, xs, ys, codes = self.arrays()
+        types = self.types
+        return [
+            Brick(id=brick_id, brick_type=types[code], position=Position(x, y))
+            for brick_id, x, y, code in zip(
+                ids.tolist(), xs.tolist(), ys.tolist(), codes.tolist()
+            )
+        ]
+
+    def course_bricks(self, course: int, first_id: int) -> list[Brick]:
+        template = course % self.period
+        y = course * self.course_height
+        types = self.types
+        return [
+            Brick(id=first_id + i, brick_type=types[code], position=Position(x, y))
+            for i, (x, code) in enumerate(
+                zip(
+                    self.course_xs[template].tolist(),
+                    self.course_types[template].tolist(),
+                )
+            )
+        ]
+
+
+def _lay_course(
+    template: CourseTemplate,
+    width: float,
+    lengths: dict[str, float],
+    head_joint: float,
+) -> list[tuple[float, str]]:
+    """(x, brick type) of every brick of one course, left to right"""
+    laid: list[tuple[float, str]] = []
+    x_pos = 0.0
+
+    for name in template.start:
+        if x_pos + lengths[name] > width:
+            break
+        laid.append((x_pos, name))
+        x_pos += lengths[name] + head_joint
+
+    # Room the end bricks need after a repeated brick, joints included
+    reserve = sum(head_joint + lengths[name] for name in template.end)
+    if template.repeat:
+        i = 0
+        while True:
+            name = template.repeat[i % len(template.repeat)]
+            if x_pos + lengths[name] + reserve > width:
+                break
+            laid.append((x_pos, name))
+            x_pos += lengths[name] + head_joint
+            i += 1
+
+    if template.end and x_pos + reserve - head_joint <= width:
+        for name in template.end:
+            laid.append((x_pos, name))
+            x_pos += lengths[name] + head_joint
+    else:
+        for name in template.fill:
+            if x_pos + lengths[name] <= width:
+                laid.append((x_pos, name))
+                break
+
+    return laid
@@ -2,15 +2,59 @@ from ..models.wall import Wall
 from ..models.common import Position
 from ..models.brick import Brick
 from ..configs.config import Config
+from bisect import bisect_right
+from collections import deque
+from collections.abc import Iterator, Sequence
 import random
 
-# set random seed
-random.seed(44)
+
+class JointIndex:
+    """
+    Perpend positions of the last ``depth`` courses, for alignment checks.
+
+    Courses are laid left to right, so each course's joints arrive sorted
+    and a check is a bisect per course: O(depth * log m) per brick instead
+    of a scan of every joint below.
+    """
+
+    def __init__(self, depth: int = 1) -> None:
+        self.depth = depth
+        self._courses: deque[Sequence[float]] = deque(maxlen=depth)
+
+    def push(self, joints: Sequence[float]) -> None:
+        """Add the joints of the course just laid (sorted), dropping the oldest"""
+        self._courses.append(joints)
+
+    def aligned(self, x: float, tolerance: float = 1.0) -> int | None:
+        """Courses down to the nearest joint closer than ``tolerance`` to x
+        (1 is the course below), None if no indexed joint is"""
+        for depth, joints in enumerate(reversed(self._courses), start=1):
+            i = bisect_right(joints, x - tolerance)
+            if i < len(joints) and joints[i] < x + tolerance:
+                return depth
+        return None
 
 
-def calculate_wild_bond(wall: Wall, config: Config) -> list[Brick]:
+def calculate_wild_bond(
+    wall: Wall, config: Config, rng: random.Random | None = None
+) -> list[Brick]:
     """
     Calculate Wild Bond (Wildverband) pattern.
+    """
+    return [
+        brick for course in iter_wild_courses(wall, config, rng) for brick in course
+    ]
+
+
+def iter_wild_courses(
+    wall: Wall, config: Config, rng: random.Random | None = None
+) -> Iterator[list[Brick]]:
+    """
+    Wild Bond (Wildverband) one course at a time, bottom to top.
+
+    Without ``rng`` the brick choices are a fixed function of the course
+    and position, so the layout is always the same; with one they are
+    drawn from it (see wild_search for picking a good seed).
 
     Rules:
     1. Random mix of full and half bricks
@@ -18,8 +62,6 @@ def calculate_wild_bond(wall: Wall, config: Config) -> list[Brick]:
     3. Maximum 6 consecutive "staggered steps"
     4. No two joints directly above each other
     """
-    wall_height = config["wall"]["height"]
-    wall_width = config["wall"]["width"]
     course_height = config["joints"]["bed_joint"] + config["bricks"]["full"]["height"]
 
     full_length = config["bricks"]["full"]["length"]  # 210mm
@@ -27,22 +69,12 @@ def calculate_wild_bond(wall: Wall, config: Config) -> list[Brick]:
     quarter_length = config["bricks"]["quarter"]["length"]  # 45mm
     head_joint = config["joints"]["head_joint"]
 
-    brick_list: list[Brick] = []
     brick_id = 0
-    num_courses = int(wall_height / course_height)
-
-    course_patterns = _generate_wild_bond_pattern(
-        num_courses=num_courses,
-        wall_width=wall_width,
-        full_length=full_length,
-        half_length=half_length,
-        quarter_length=quarter_length,
-        head_joint=head_joint,
-    )
-
-    for course_num, pattern in enumerate(course_patterns):
+
+    for course_num, (pattern, _) in enumerate(iter_wild_patterns(config, rng)):
         y_pos = course_num * course_height
         x_pos = 0.0
+        brick_list: list[Brick] = []
 
         for brick_type in pattern:
             brick = Brick(
@@ -58,37 +90,36 @@ def calculate_wild_bond(wall: Wall, config: Config) -> list[Brick]:
             else:  # quarter
                 x_pos += quarter_length + head_joint
 
-    return brick_list
+        yield brick_list
 
 
-def _generate_wild_bond_pattern(
-    num_courses: int,
-    wall_width: float,
-    full_length: float,
-    half_length: float,
-    quarter_length: float,
-    head_joint: float,
-) -> list[list[str]]:
-    patterns: list[list[str]] = []
-    joint_positions_by_course: list[list[float]] = []
+def iter_wild_patterns(
+    config: Config, rng: random.Random | None = None
+) -> Iterator[tuple[list[str], list[float]]]:
+    """Yield (brick types, joint positions) of every course, bottom to top.
+
+    Perpends are kept from aligning with those of the ``wild.joint_courses``
+    courses below (default 1).
+    """
+    course_height = config["joints"]["bed_joint"] + config["bricks"]["full"]["height"]
+    num_courses = int(config["wall"]["height"] / course_height)
+
+    joints_below = JointIndex(config.get("wild", {}).get("joint_courses", 1))
 
     for course in range(num_courses):
         pattern, joint_positions = _calculate_course_pattern(
             course_num=course,
-            wall_width=wall_width,
-            full_length=full_length,
-            half_length=half_length,
-            quarter_length=quarter_length,
-            head_joint=head_joint,
-            previous_joints=(
-                joint_positions_by_course[-1] if joint_positions_by_course else []
-            ),
+            wall_width=config["wall"]["width"],
+            full_length=config["bricks"]["full"]["length"],
+            half_length=config["bricks"]["half"]["length"],
+            quarter_length=config["bricks"]["quarter"]["length"],
+            head_joint=config["joints"]["head_joint"],
+            joints_below=joints_below,
+            rng=rng,
         )
+        joints_below.push(joint_positions)
 
-        patterns.append(pattern)
-        joint_positions_by_course.append(joint_positions)
-
-    return patterns
+        yield pattern, joint_positions
 
 
 def _calculate_course_pattern(
@@ -98,7 +129,8 @@ def _calculate_course_pattern(
     half_length: float,
     quarter_length: float,
     head_joint: float,
-    previous_joints: list[float],
+    joints_below: JointIndex,
+    rng: random.Random | None = None,
 ) -> tuple[list[str], list[float]]:
     pattern: list[str] = []
     joint_positions: list[float] = []
@@ -140,6 +172,8 @@ def _calculate_course_pattern(
         if consecutive_steps >= 6 and "full" in options:
             brick_type = "full"
             consecutive_steps = 0
+        elif rng is not None:
+            brick_type = rng.choice(options)
         else:
             index = (course_num + int(x_pos / 100)) % len(options)
             brick_type = options[index]
@@ -147,19 +181,18 @@ def _calculate_course_pattern(
         length = full_length if brick_type == "full" else half_length
         joint_pos = x_pos + length
 
-        # Check for vertical joint alignment
-        aligned = False
-        for prev_joint in previous_joints:
-            if abs(joint_pos - prev_joint) < 1:
-                aligned = True
-                break
-
-        # Choose alternative brick type if aligned
-        if aligned and len(options) > 1:
+        # Choose alternative brick type if aligned with a joint below and
+        # the alternative isn't, or only with one further down
+        aligned = joints_below.aligned(joint_pos)
+        if aligned is not None and len(options) > 1:
             other_type = "half" if brick_type == "full" else "full"
-            if other_type in options:
+            other_length = full_length if other_type == "full" else half_length
+            other_aligned = joints_below.aligned(x_pos + other_length)
+            if other_type in options and (
+                other_aligned is None or other_aligned > aligned
+            ):
                 brick_type = other_type
-                length = full_length if brick_type == "full" else half_length
+                length = other_length
                 joint_pos = x_pos + length
 
         pattern.append(brick_type)
@@ -0,0 +1,163 @@
+"""
+Multi-seed search for a good wild bond layout.
+
+Every candidate is the wild bond generated with its own ``random.Random``
+seeded from the search seed, so candidates are independent and any result
+can be regenerated from the seed it reports. Candidates are scored in a
+process pool on joint alignment, staggered-step runs and brick-type mix,
+and the lowest score wins. The deterministic layout calculate_wild_bond
+produces without an rng is always scored too (seed ``None``), so a search
+never returns something worse than the default.
+
+    search = search_wild_bond(config, candidates=64, seed=0)
+    bricks = calculate_wild_bond(wall, config, search.best.rng())
+"""
+
+from .wild_bond import iter_wild_patterns
+from ..configs.config import Config
+from ..models.bond_quality import analyze_perpends
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+import random
+import numpy as np
+
+
+@dataclass(frozen=True)
+class WildBondWeights:
+    aligned: float = 10.0  # per joint directly above a joint in the course below
+    long_runs: float = 5.0  # per staggered-step run over max_steps courses
+    mix: float = 100.0  # per unit of full-brick share away from target_full_share
+    target_full_share: float = 0.5
+    max_steps: int = 6
+    tolerance: float = 1.0  # joints closer than this are aligned
+
+
+@dataclass
+class WildBondScore:
+    aligned_joints: int
+    long_step_runs: int
+    longest_step_run: int
+    full_share: float  # full bricks / (full + half bricks)
+    total: float  # weighted, lower is better
+
+    def __str__(self) -> str:
+        return (
+            f"score {self.total:.1f}: {self.aligned_joints} aligned joints, "
+            f"{self.long_step_runs} long step runs (longest "
+            f"{self.longest_step_run}), {self.full_share:.0%} full bricks"
+        )
+
+
+@dataclass
+class WildBondCandidate:
+    seed: int | None  # None: the deterministic layout
+    score: WildBondScore
+
+    def rng(self) -> random.Random | None:
+        """The rng to pass to calculate_wild_bond to regenerate this layout"""
+        return None if self.seed is None else random.Random(self.seed)
+
+
+@dataclass
+class WildBondSearch:
+    best: WildBondCandidate
+    candidates: list[WildBondCandidate] = field(default_factory=list)
+
+    def __str__(self) -> str:
+        seed = "default layout" if self.best.seed is None else f"seed {self.best.seed}"
+        return (
+            f"Wild bond search: best of {len(self.candidates)} is {seed}, "
+            f"{self.best.score}"
+        )
+
+
+def search_wild_bond(
+    config: Config,
+    candidates: int = 32,
+    seed: int = 0,
+    workers: int | None = None,
+    weights: WildBondWeights = WildBondWeights(),
+) -> WildBondSearch:
+    """Score the default layout and ``candidates`` seeded ones, best first.
+
+    Candidate ``i`` uses seed ``seed + i``. ``workers=1`` scores them in
+    this process.
+    """
+    seeds: list[int | None] = [None, *range(seed, seed + candidates)]
+    if workers == 1:
+        results = [evaluate_seed(config, s, weights) for s in seeds]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(
+                pool.map(
+                    evaluate_seed,
+                    [config] * len(seeds),
+                    seeds,
+                    [weights] * len(seeds),
+                    chunksize=max(1, len(seeds) // 32),
+                )
+            )
+
+    # Ties go to the earliest candidate, so the default layout wins them
+    best = min(results, key=lambda c: c.score.total)
+    return WildBondSearch(best, results)
+
+
+def evaluate_seed(
+    config: Config, seed: int | None, weights: WildBondWeights = WildBondWeights()
+) -> WildBondCandidate:
+    rng = None if seed is None else random.Random(seed)
+    types: list[str] = []
+    joints: list[list[float]] = []
+    for pattern, joint_positions in iter_wild_patterns(config, rng):
+        types.extend(pattern)
+        # The last joint is the course's right edge, not a perpend
+        joints.append(joint_positions[:-1])
+    return WildBondCandidate(
+        seed,
+        score_layout(
+            types,
+            joints,
+            config["bricks"]["quarter"]["length"] + config["joints"]["head_joint"],
+            weights,
+        ),
+    )
+
+
+def score_layout(
+    types: list[str],
+    joints: list[list[float]],
+    max_step: float,
+    weights: WildBondWeights = WildBondWeights(),
+) -> WildBondScore:
+    """
+    Score a layout from its brick types and per-course perpend positions.
+
+    A staggered step is a perpend moved by at most ``max_step`` (but not
+    aligned) from a perpend in the course below, a quarter brick and its
+    joint for wild bond; see bond_quality.analyze_perpends.
+    """
+    quality = analyze_perpends(
+        np.repeat(np.arange(len(joints)), [len(j) for j in joints]),
+        np.concatenate([np.empty(0), *joints]),
+        max_step,
+        weights.tolerance,
+        weights.max_steps,
+    )
+
+    full = types.count("full")
+    half = types.count("half")
+    full_share = full / (full + half) if full + half else 0.0
+
+    total = (
+        weights.aligned * quality.aligned_joints
+        + weights.long_runs * quality.long_step_runs
+        + weights.mix * abs(full_share - weights.target_full_share)
+    )
+    return WildBondScore(
+        quality.aligned_joints,
+        quality.long_step_runs,
+        quality.longest_step_run,
+        full_share,
+        total,
+    )
@@ -1,6 +1,6 @@
 import yaml
 from pathlib import Path
-from typing import TypedDict
+from typing import NotRequired, TypedDict
 
 
 class BrickDimensions(TypedDict):
@@ -29,12 +29,32 @@ class RobotConfig(TypedDict):
     reach_height: float
 
 
+class TravelConfig(TypedDict, total=False):
+    speed_x: float
+    speed_y: float
+    lift_penalty: float
+
+
+class ArmConfig(TypedDict, total=False):
+    pickup_x: float
+    pickup_y: float
+    speed: float
+    place_time: float
+
+
+class WildConfig(TypedDict, total=False):
+    joint_courses: int  # courses below a perpend must not align with
+
+
 class Config(TypedDict):
     name: str
     bricks: dict[str, BrickDimensions]
     joints: JointsConfig
     wall: WallConfig
     robot: RobotConfig
+    travel: NotRequired[TravelConfig]
+    arm: NotRequired[ArmConfig]
+    wild: NotRequired[WildConfig]
 
 
 def load_wall_config(config_name: str) -> Config:
@@ -1,45 +1,14 @@
-from .renderer import PygameRenderer
 from .models.wall import Wall
 from .models.brick import Brick, BrickState
 from .models.robot import Robot
-from .models.stride import StrideManager
+from .models.stride import StrideManager, Stride
 from .configs.config import load_wall_config, Config
-from .bonds.stretcher_bond import calculate_stretcher_bond
-from .bonds.english_cross_bond import calculate_english_cross_bond
-from .bonds.flemish_bond import calculate_flemish_bond
-from .bonds.wild_bond import calculate_wild_bond
-from .algos.naive_build import naive_build_algorithm
-import pygame
+from .registry import get_algorithm, get_bond_courses, bond_type_for_wall
+from .plan_cache import PlanCache
+from .simulator import BuildSimulator, BuildEvent
 import argparse
 
 
-def get_bond_calculator(bond_type: str):
-    bond_calculators = {
-        "stretcher": calculate_stretcher_bond,
-        "english_cross": calculate_english_cross_bond,
-        "flemish": calculate_flemish_bond,
-        "wild": calculate_wild_bond,
-    }
-
-    if bond_type not in bond_calculators:
-        available = ", ".join(bond_calculators.keys())
-        raise ValueError(f"Unknown bond type '{bond_type}'. Available: {available}")
-
-    return bond_calculators[bond_type]
-
-
-def get_algorithm(algo_name: str):
-    algorithms = {
-        "naive_build": naive_build_algorithm,
-    }
-
-    if algo_name not in algorithms:
-        available = ", ".join(algorithms.keys())
-        raise ValueError(f"Unknown algorithm '{algo_name}'. Available: {available}")
-
-    return algorithms[algo_name]
-
-
 def main():
     parser = argparse.ArgumentParser(description="Bricklaying Robot Visualization")
     parser.add_argument(
@@ -48,7 +17,41 @@ def main():
         help="Wall configuration (stretcher_bond_wall, english_cross_bond_wall, flemish_bond_wall, wild_bond_wall)",
     )
     parser.add_argument(
-        "--algo", default="naive_build", help="Build algorithm (naive_build)"
+        "--algo",
+        default="naive_build",
+        help="Build algorithm (naive_build, naive_build_vectorized, min_stride)",
+    )
+    parser.add_argument(
+        "--support-order",
+        action="store_true",
+        help="Reorder the plan so every brick is laid after the bricks it rests on",
+    )
+    parser.add_argument(
+        "--order-strides",
+        action="store_true",
+        help="Reorder strides to minimise robot travel time (see the travel config)",
+    )
+    parser.add_argument(
+        "--sequence-bricks",
+        action="store_true",
+        help="Order bricks within each stride to minimise arm time (see the arm config)",
+    )
+    parser.add_argument(
+        "--wild-search",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Wild bond only: score N seeded layouts (and the default) in parallel and build the best",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always recompute the wall and plan instead of using .plan_cache/",
+    )
+    parser.add_argument(
+        "--no-gui",
+        action="store_true",
+        help="Print the plan and exit without opening a window (pygame is not imported)",
     )
     parser.add_argument(
         "--scale",
@@ -76,15 +79,7 @@ def main():
         return
 
     # Determine bond type from config name
-    bond_type = "stretcher"
-    if "english_cross" in args.wall:
-        bond_type = "english_cross"
-    elif "flemish" in args.wall:
-        bond_type = "flemish"
-    elif "stretcher" in args.wall:
-        bond_type = "stretcher"
-    elif "wild" in args.wall:
-        bond_type = "wild"
+    bond_type = bond_type_for_wall(args.wall)
 
     print("=" * 50)
     print("Config")
@@ -92,6 +87,11 @@ def main():
     print(f"Loading wall: {args.wall}")
     print(f"Bond type: {bond_type}")
     print(f"Algorithm: {args.algo}")
+    print(f"Support order: {args.support_order}")
+    print(f"Order strides: {args.order_strides}")
+    print(f"Sequence bricks: {args.sequence_bricks}")
+    if args.wild_search:
+        print(f"Wild bond search: {args.wild_search} seeds")
     print(f"Scale: {args.scale}")
     print("=" * 50)
 
@@ -100,42 +100,85 @@ def main():
     stride_manager = StrideManager()
     Brick.configure(config)
 
-    try:
-        bond_calculator = get_bond_calculator(bond_type)
-        bricks = bond_calculator(wall, config)
-    except ValueError as e:
-        print(f"Error: {e}")
-        return
-    except Exception as e:
-        print(f"Error calculating bond pattern: {e}")
-        return
-
-    # Bond & Brick validation
-    failed_bricks = 0
-    for brick in bricks:
-        if not wall.try_add_brick(brick):
-            print(f"Failed to add brick {brick.id}, {brick.position.x}, {brick.position.y}")
-            failed_bricks += 1
-
-    if failed_bricks > 0 or not wall.validate_wall_integrity():
-        print("❌ Configuration Error: Wall validation failed")
-        print("💡 This indicates the wall configuration isn't suitable for this bond pattern")
-        print(f"   Please adjust the wall configuration in: src/configs/{args.wall}.yaml")
-        return
-
-    for brick in wall.bricks:
-        brick.state = BrickState.PLANNED
-
-    print("Calculating build algorithm...")
-    try:
-        algorithm = get_algorithm(args.algo)
-        strides, movements = algorithm(wall, robot, stride_manager, config)
-    except ValueError as e:
-        print(f"Error: {e}")
-        return
-    except Exception as e:
-        print(f"Error running build algorithm: {e}")
-        return
+    stages = [
+        stage
+        for stage, enabled in (
+            ("support_order", args.support_order),
+            ("order_strides", args.order_strides),
+            ("sequence_bricks", args.sequence_bricks),
+        )
+        if enabled
+    ]
+    wild_search = args.wild_search if bond_type == "wild" else 0
+    bond_key = f"{bond_type}+search{wild_search}" if wild_search else bond_type
+    plan_cache = None if args.no_cache else PlanCache()
+    cache_key = ""
+    cached = None
+    if plan_cache is not None:
+        cache_key = plan_cache.key(config, bond_key, "+".join([args.algo, *stages]))
+        cached = plan_cache.load(cache_key, stride_manager)
+
+    if cached is not None:
+        # Cached plans were validated when they were generated
+        bricks, strides, movements = cached
+        for brick in bricks:
+            wall.add_brick(brick)
+        wall.set_all_brick_states(BrickState.PLANNED)
+        print(f"Loaded wall and plan from {plan_cache.path(cache_key)}")
+    else:
+        # Bricks stream into the wall course by course as the bond generates
+        try:
+            if wild_search:
+                from .bonds.wild_bond import iter_wild_courses
+                from .bonds.wild_search import search_wild_bond
+
+                search = search_wild_bond(config, candidates=wild_search)
+                print(search)
+                courses = iter_wild_courses(wall, config, search.best.rng())
+            else:
+                courses = get_bond_courses(bond_type)(wall, config)
+            report = wall.add_courses(courses)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return
+        except Exception as e:
+            print(f"Error calculating bond pattern: {e}")
+            return
+
+        if not report.ok:
+            print(report.summary())
+            print("❌ Configuration Error: Wall validation failed")
+            print("💡 This indicates the wall configuration isn't suitable for this bond pattern")
+            print(f"   Please adjust the wall configuration in: src/configs/{args.wall}.yaml")
+            return
+
+        wall.set_all_brick_states(BrickState.PLANNED)
+
+        print("Calculating build algorithm...")
+        try:
+            algorithm = get_algorithm(args.algo)
+            if args.support_order:
+                from .algos.support_order import support_ordered
+
+                algorithm = support_ordered(algorithm)
+            if args.order_strides:
+                from .algos.stride_ordering import travel_ordered
+
+                algorithm = travel_ordered(algorithm)
+            if args.sequence_bricks:
+                from .algos.brick_sequencing import sequenced
+
+                algorithm = sequenced(algorithm)
+            strides, movements = algorithm(wall, robot, stride_manager, config)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return
+        except Exception as e:
+            print(f"Error running build algorithm: {e}")
+            return
+
+        if plan_cache is not None:
+            plan_cache.save(cache_key, list(wall.bricks), strides, movements)
 
     print("=" * 50)
     print("Stride info")
@@ -143,19 +186,36 @@ def main():
     print(f"Generated {len(strides)} strides with {len(movements)} movements")
     print("Stride positions:")
     for i, stride in enumerate(strides):
+        arm_time = "" if stride.arm_time is None else f", arm {stride.arm_time:.0f}s"
         print(
-            f"  Stride {i+1}: ({stride.robot_position.x:.0f}, {stride.robot_position.y:.0f}) - {len(stride.bricks)} bricks"
+            f"  Stride {i+1}: ({stride.robot_position.x:.0f}, {stride.robot_position.y:.0f}) - {len(stride.bricks)} bricks{arm_time}"
         )
     print("=" * 50)
 
+    if args.no_gui:
+        return
+
     # Reset robot to initial position
     robot.position.x = robot.reach_width / 2
     robot.position.y = 0
 
-    current_brick_index = 0
-    current_stride_index = 0
-    current_brick_in_stride = 0
-    robot_mode = False
+    run_gui(args, config, wall, robot, stride_manager, strides)
+
+
+def run_gui(
+    args: argparse.Namespace,
+    config: Config,
+    wall: Wall,
+    robot: Robot,
+    stride_manager: StrideManager,
+    strides: list[Stride],
+) -> None:
+    """Open the pygame window and run the interactive build until ESC"""
+    # pygame is only imported once a window is actually opened
+    from .renderer import PygameRenderer
+    import pygame
+
+    simulator = BuildSimulator(wall, robot, strides)
 
     renderer = PygameRenderer(config, target_scale=args.scale, debug_mode=args.debug)
 
@@ -181,10 +241,6 @@ def main():
     print()
     print("Press ENTER to start building...")
 
-    auto_play = False
-    auto_play_timer = 0
-    auto_play_delay = 30
-
     running = True
     clock = pygame.time.Clock()
 
@@ -200,160 +256,76 @@ def main():
                     renderer.debug_mode = not renderer.debug_mode
                 elif event.key == pygame.K_m:
                     # Toggle robot mode
-                    robot_mode = not robot_mode
-                    auto_play = False
-                    mode_name = "Robot Algorithm" if robot_mode else "Manual"
+                    simulator.toggle_mode()
+                    mode_name = "Robot Algorithm" if simulator.robot_mode else "Manual"
                     print(f"Switched to {mode_name} mode")
-                    if robot_mode and current_stride_index < len(strides):
-                        stride = strides[current_stride_index]
-                        robot.position.x = stride.robot_position.x
-                        robot.position.y = stride.robot_position.y
+                    if simulator.robot_mode and simulator.current_stride is not None:
                         print(
-                            f"Robot moved to stride {current_stride_index + 1} position: ({robot.position.x:.0f}, {robot.position.y:.0f})"
+                            f"Robot moved to stride {simulator.stride_index + 1} position: ({robot.position.x:.0f}, {robot.position.y:.0f})"
                         )
-                elif event.key == pygame.K_a and robot_mode:
-                    auto_play = not auto_play
-                    status = "started" if auto_play else "stopped"
+                elif event.key == pygame.K_a and simulator.robot_mode:
+                    simulator.toggle_auto_play()
+                    status = "started" if simulator.auto_play else "stopped"
                     print(f"Auto-play {status}")
                 elif event.key == pygame.K_RETURN or event.key == pygame.K_KP_ENTER:
-                    if not robot_mode:
+                    if not simulator.robot_mode:
                         # Manual mode
-                        if current_brick_index < len(wall.bricks):
-                            wall.bricks[current_brick_index].state = BrickState.BUILT
-                            current_brick_index += 1
-                            built_count = sum(
-                                1 for b in wall.bricks if b.state == BrickState.BUILT
-                            )
-                            progress = built_count / len(wall.bricks) * 100
+                        build = simulator.step()
+                        if build.brick is not None:
+                            brick = build.brick
+                            progress = wall.completion_percentage
                             print(
-                                f"Built brick at ({wall.bricks[current_brick_index].position.x}, {wall.bricks[current_brick_index].position.y}) {current_brick_index}/{len(wall.bricks)} ({progress:.1f}%)"
+                                f"Built brick at ({brick.position.x}, {brick.position.y}) {simulator.brick_index}/{len(wall.bricks)} ({progress:.1f}%)"
                             )
 
-                            if current_brick_index >= len(wall.bricks):
+                            if build.finished:
                                 print("🎉 Wall completed!")
                     else:
                         # Robot mode: Build next brick in current stride
-                        if current_stride_index < len(strides):
-                            stride = strides[current_stride_index]
-                            if current_brick_in_stride < len(stride.bricks):
-                                brick = stride.bricks[current_brick_in_stride]
-                                brick.state = BrickState.BUILT
-                                current_brick_in_stride += 1
-
-                                built_in_stride = current_brick_in_stride
-                                total_in_stride = len(stride.bricks)
-                                built_count = sum(
-                                    1
-                                    for b in wall.bricks
-                                    if b.state == BrickState.BUILT
-                                )
-                                progress = built_count / len(wall.bricks) * 100
-
-                                print(
-                                    f"🤖 Built brick {built_in_stride}/{total_in_stride} in stride {current_stride_index + 1} ({progress:.1f}% total)"
-                                )
-
-                                if current_brick_in_stride >= len(stride.bricks):
-                                    print(
-                                        f"✅ Stride {current_stride_index + 1} completed!"
-                                    )
-                                    current_stride_index += 1
-                                    current_brick_in_stride = 0
-
-                                    if current_stride_index < len(strides):
-                                        next_stride = strides[current_stride_index]
-                                        robot.position.x = next_stride.robot_position.x
-                                        robot.position.y = next_stride.robot_position.y
-                                        print(
-                                            f"🤖 Robot moved to stride {current_stride_index + 1} position: ({robot.position.x:.0f}, {robot.position.y:.0f})"
-                                        )
-                                    else:
-                                        print("🤖 Robot algorithm completed! 🎉")
-                elif event.key == pygame.K_s and robot_mode:
-                    # Robot mode: Complete current stride
-                    if current_stride_index < len(strides):
-                        stride = strides[current_stride_index]
-                        for i in range(current_brick_in_stride, len(stride.bricks)):
-                            stride.bricks[i].state = BrickState.BUILT
-
-                        built_count = sum(
-                            1 for b in wall.bricks if b.state == BrickState.BUILT
-                        )
-                        progress = built_count / len(wall.bricks) * 100
-                        print(
-                            f"🤖 Completed stride {current_stride_index + 1} ({len(stride.bricks)} bricks, {progress:.1f}% total)"
-                        )
-
-                        current_stride_index += 1
-                        current_brick_in_stride = 0
+                        stride_index = simulator.stride_index
+                        build = simulator.step()
+                        if build.brick is not None:
+                            built_in_stride, total_in_stride = wall.stride_progress(
+                                strides[stride_index]
+                            )
+                            progress = wall.completion_percentage
 
-                        if current_stride_index < len(strides):
-                            next_stride = strides[current_stride_index]
-                            robot.position.x = next_stride.robot_position.x
-                            robot.position.y = next_stride.robot_position.y
                             print(
-                                f"🤖 Robot moved to stride {current_stride_index + 1} position: ({robot.position.x:.0f}, {robot.position.y:.0f})"
+                                f"🤖 Built brick {built_in_stride}/{total_in_stride} in stride {stride_index + 1} ({progress:.1f}% total)"
                             )
-                        else:
-                            print("🤖 Robot algorithm completed! 🎉")
-                elif event.key == pygame.K_SPACE and not robot_mode:
+                        report_stride_change(build, robot)
+                elif event.key == pygame.K_s and simulator.robot_mode:
+                    # Robot mode: Complete current stride
+                    stride = simulator.current_stride
+                    if stride is not None:
+                        build = simulator.complete_stride()
+                        completed = build.completed_stride
+                        progress = wall.completion_percentage
+                        print(
+                            f"🤖 Completed stride {completed + 1} ({len(stride.bricks)} bricks, {progress:.1f}% total)"
+                        )
+                        report_robot_move(build, robot)
+                elif event.key == pygame.K_SPACE and not simulator.robot_mode:
                     # Manual mode: Build all remaining bricks
-                    remaining = len(wall.bricks) - sum(
-                        1 for b in wall.bricks if b.state == BrickState.BUILT
-                    )
+                    remaining = simulator.build_all()
                     if remaining > 0:
-                        for brick in wall.bricks:
-                            brick.state = BrickState.BUILT
-                        current_brick_index = len(wall.bricks)
                         print(
                             f"Built {remaining} remaining bricks - Wall completed! 🎉"
                         )
                 elif event.key == pygame.K_r:
                     # Reset all bricks to planned
-                    for brick in wall.bricks:
-                        brick.state = BrickState.PLANNED
-                    current_brick_index = 0
-                    current_stride_index = 0
-                    current_brick_in_stride = 0
-                    robot.position.x = 0
-                    robot.position.y = 0
-                    auto_play = False
+                    simulator.reset()
                     print("Reset - All bricks back to planned state, robot at origin")
             elif event.type == pygame.VIDEORESIZE:
                 # Handle window resize
-                renderer.window_width = event.w
-                renderer.window_height = event.h
-                renderer.screen = pygame.display.set_mode(
-                    (renderer.window_width, renderer.window_height), pygame.RESIZABLE
-                )
+                renderer.resize(event.w, event.h)
 
         # Auto-play logic
-        if auto_play and robot_mode:
-            auto_play_timer += 1
-            if auto_play_timer >= auto_play_delay:
-                auto_play_timer = 0
-                if current_stride_index < len(strides):
-                    stride = strides[current_stride_index]
-                    if current_brick_in_stride < len(stride.bricks):
-                        # Build next brick in stride
-                        brick = stride.bricks[current_brick_in_stride]
-                        brick.state = BrickState.BUILT
-                        current_brick_in_stride += 1
-
-                        if current_brick_in_stride >= len(stride.bricks):
-                            current_stride_index += 1
-                            current_brick_in_stride = 0
-
-                            if current_stride_index < len(strides):
-                                next_stride = strides[current_stride_index]
-                                robot.position.x = next_stride.robot_position.x
-                                robot.position.y = next_stride.robot_position.y
-                            else:
-                                auto_play = False
-                                print("🤖 Robot algorithm completed! 🎉")
-
-        robot_for_render = robot if robot_mode else None
-        stride_manager_for_render = stride_manager if robot_mode else None
+        if simulator.tick().finished:
+            print("🤖 Robot algorithm completed! 🎉")
+
+        robot_for_render = robot if simulator.robot_mode else None
+        stride_manager_for_render = stride_manager if simulator.robot_mode else None
 
         renderer.render_wall(wall, robot_for_render, stride_manager_for_render)
         clock.tick(60)
@@ -362,5 +334,22 @@ def main():
     print("Demo finished.")
 
 
+def report_stride_change(build: BuildEvent, robot: Robot) -> None:
+    """Print the stride completion / robot move messages of a robot-mode action"""
+    if build.completed_stride is not None:
+        print(f"✅ Stride {build.completed_stride + 1} completed!")
+    report_robot_move(build, robot)
+
+
+def report_robot_move(build: BuildEvent, robot: Robot) -> None:
+    """Print where the robot moved after a robot-mode action, or that it is done"""
+    if build.moved_to_stride is not None:
+        print(
+            f"🤖 Robot moved to stride {build.moved_to_stride + 1} position: ({robot.position.x:.0f}, {robot.position.y:.0f})"
+        )
+    elif build.finished:
+        print("🤖 Robot algorithm completed! 🎉")
+
+
 if __name__ == "__main__":
     main()
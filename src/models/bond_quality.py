@@ -0,0 +1,170 @@
+"""
+Bond quality of a laid-out wall.
+
+Every perpend (head joint) is matched against the perpends of the course
+below it to measure how far apart they are (the lap), count joints that
+line up and follow staggered steps, perpends shifting the same way by at
+most a quarter brick course after course. Everything runs on one sorted
+(course, x) array with ``np.searchsorted``, O(n log n) overall.
+"""
+
+from .wall import Wall
+from dataclasses import dataclass
+import numpy as np
+import numpy.typing as npt
+
+
+@dataclass
+class BondQuality:
+    """Per-perpend measurements, sorted by (course, x)"""
+
+    course: npt.NDArray[np.int64]
+    x: npt.NDArray[np.float64]  # right edge of the brick before the joint
+    laps: npt.NDArray[np.float64]  # to the nearest perpend below, inf if none
+    # Staggered steps in a row ending at each perpend, per direction
+    right_runs: npt.NDArray[np.int64]
+    left_runs: npt.NDArray[np.int64]
+    tolerance: float
+    max_steps: int
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    @property
+    def aligned_joints(self) -> int:
+        """Perpends directly above a perpend in the course below"""
+        return int(np.count_nonzero(self.laps < self.tolerance))
+
+    @property
+    def min_lap(self) -> float:
+        return float(self.laps.min()) if len(self.laps) else float("inf")
+
+    @property
+    def long_step_runs(self) -> int:
+        """Staggered-step runs longer than ``max_steps`` courses"""
+        limit = self.max_steps + 1
+        return int(
+            np.count_nonzero(self.right_runs == limit)
+            + np.count_nonzero(self.left_runs == limit)
+        )
+
+    @property
+    def longest_step_run(self) -> int:
+        if not len(self.x):
+            return 0
+        return int(max(self.right_runs.max(), self.left_runs.max()))
+
+    def perpends(self, course: int) -> npt.NDArray[np.float64]:
+        """Perpend positions of one course, left to right"""
+        start, end = np.searchsorted(self.course, [course, course + 1])
+        return self.x[start:end]
+
+    def __str__(self) -> str:
+        return (
+            f"{len(self)} perpends, min lap {self.min_lap:g}, "
+            f"{self.aligned_joints} aligned, {self.long_step_runs} step runs over "
+            f"{self.max_steps} (longest {self.longest_step_run})"
+        )
+
+
+def analyze_bond(
+    wall: Wall,
+    max_step: float | None = None,
+    tolerance: float = 1.0,
+    max_steps: int = 6,
+) -> BondQuality:
+    """
+    Bond quality of the bricks on ``wall``.
+
+    A perpend is the joint after every brick but the last of its course.
+    ``max_step`` is the largest shift counted as a staggered step, a
+    quarter of a full brick plus a head joint by default.
+    """
+    if max_step is None:
+        full_length = wall.config["bricks"]["full"]["length"]
+        max_step = full_length / 4 + wall.config["joints"]["head_joint"]
+
+    layout = wall.sorted_courses()
+    # Every brick followed by another in the same course ends at a perpend
+    followed = np.flatnonzero(layout.course[1:] == layout.course[:-1])
+    return analyze_perpends(
+        layout.course[followed],
+        layout.x[followed] + layout.lengths[followed],
+        max_step,
+        tolerance,
+        max_steps,
+    )
+
+
+def analyze_perpends(
+    course: npt.ArrayLike,
+    x: npt.ArrayLike,
+    max_step: float,
+    tolerance: float = 1.0,
+    max_steps: int = 6,
+) -> BondQuality:
+    """Bond quality from bare perpend positions and their course numbers"""
+    course = np.asarray(course, dtype=np.int64)
+    x = np.asarray(x, dtype=np.float64)
+    order = np.lexsort((x, course))
+    course = course[order]
+    x = x[order]
+    count = len(x)
+
+    laps = np.full(count, np.inf)
+    right_parent = np.full(count, -1, dtype=np.int64)
+    left_parent = np.full(count, -1, dtype=np.int64)
+    if count:
+        # Combined key, wide enough that neighbouring courses never interleave
+        x_offset = float(x.min()) - max_step - tolerance
+        span = float(x.max()) - x_offset + max_step + tolerance + 1
+        keys = course * span + (x - x_offset)
+        below = course - 1
+
+        def key(xs: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+            return below * span + (xs - x_offset)
+
+        def in_course_below(i: npt.NDArray[np.int64]) -> npt.NDArray[np.bool_]:
+            ok = (i >= 0) & (i < count)
+            ok[ok] = course[i[ok]] == below[ok]
+            return ok
+
+        # Nearest perpend below: the one either side of x
+        after = np.searchsorted(keys, key(x))
+        for i in (after - 1, after):
+            ok = in_course_below(i)
+            laps[ok] = np.minimum(laps[ok], np.abs(x[ok] - x[i[ok]]))
+
+        # Stepping right: nearest perpend below in [x - max_step, x - tolerance]
+        i = np.searchsorted(keys, key(x - tolerance), side="right") - 1
+        ok = in_course_below(i)
+        ok[ok] = x[ok] - x[i[ok]] <= max_step
+        right_parent[ok] = i[ok]
+
+        # Stepping left: nearest perpend below in [x + tolerance, x + max_step]
+        i = np.searchsorted(keys, key(x + tolerance), side="left")
+        ok = in_course_below(i)
+        ok[ok] = x[i[ok]] - x[ok] <= max_step
+        left_parent[ok] = i[ok]
+
+    return BondQuality(
+        course,
+        x,
+        laps,
+        _chain_lengths(right_parent),
+        _chain_lengths(left_parent),
+        tolerance,
+        max_steps,
+    )
+
+
+def _chain_lengths(parent: npt.NDArray[np.int64]) -> npt.NDArray[np.int64]:
+    """Links from each node down to the root of its chain (pointer doubling)"""
+    length = (parent >= 0).astype(np.int64)
+    jump = parent.copy()
+    while True:
+        linked = np.flatnonzero(jump >= 0)
+        if not len(linked):
+            return length
+        length[linked] += length[jump[linked]]
+        jump[linked] = jump[jump[linked]]
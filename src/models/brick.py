@@ -1,7 +1,7 @@
 from enum import Enum
 from dataclasses import dataclass
 from .common import Position
-from ..configs.config import Config, BrickDimensions
+from ..configs.config import Config
 from typing import ClassVar
 
 
@@ -15,33 +15,83 @@ class BrickState(Enum):
     BUILT = "built"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class DimensionTable:
+    """Brick dimensions compiled per type code (position in ``types``)"""
+
+    types: tuple[str, ...]
+    codes: dict[str, int]
+    lengths: tuple[float, ...]
+    heights: tuple[float, ...]
+    widths: tuple[float, ...]
+
+    @classmethod
+    def from_config(cls, config: Config) -> "DimensionTable":
+        bricks = config["bricks"]
+        types = tuple(bricks)
+        return cls(
+            types=types,
+            codes={name: code for code, name in enumerate(types)},
+            lengths=tuple(float(bricks[name]["length"]) for name in types),
+            heights=tuple(float(bricks[name]["height"]) for name in types),
+            widths=tuple(float(bricks[name]["width"]) for name in types),
+        )
+
+
+@dataclass(slots=True)
 class Brick:
     id: int
-    brick_type: str 
+    brick_type: str
     position: Position
     state: BrickState = BrickState.PLANNED
     stride_id: int | None = None
 
-    # Class-level config 
-    _brick_configs: ClassVar[dict[str, BrickDimensions]] = {}
+    # Class-level config: brick type -> dimension, a single dict lookup per
+    # accessor
+    _lengths: ClassVar[dict[str, float]] = {}
+    _heights: ClassVar[dict[str, float]] = {}
+    _widths: ClassVar[dict[str, float]] = {}
 
     @classmethod
     def configure(cls, config: Config) -> None:
         """Configure all brick types from config"""
-        cls._brick_configs = config['bricks']
-    
+        table = DimensionTable.from_config(config)
+        cls._lengths = dict(zip(table.types, table.lengths))
+        cls._heights = dict(zip(table.types, table.heights))
+        cls._widths = dict(zip(table.types, table.widths))
+
     @property
     def width(self) -> float:
-        return self._brick_configs[self.brick_type]['width']
+        return self._widths[self.brick_type]
 
-    @property  
+    @property
     def length(self) -> float:
-        return self._brick_configs[self.brick_type]['length']
+        return self._lengths[self.brick_type]
 
     @property
     def height(self) -> float:
-        return self._brick_configs[self.brick_type]['height']
+        return self._heights[self.brick_type]
+
+    # Allocation-free geometry, prefer these over the Position properties
+    # in hot loops
+
+    @property
+    def center_x(self) -> float:
+        return self.position.x + self._widths[self.brick_type] / 2
+
+    @property
+    def center_y(self) -> float:
+        return self.position.y + self._heights[self.brick_type] / 2
+
+    @property
+    def right(self) -> float:
+        """x of the right edge"""
+        return self.position.x + self._lengths[self.brick_type]
+
+    @property
+    def top(self) -> float:
+        """y of the top edge"""
+        return self.position.y + self._heights[self.brick_type]
 
     @property
     def center(self) -> Position:
@@ -67,7 +117,8 @@ class Brick:
 
     def contains_point(self, x: float, y: float) -> bool:
         """Check if a point is within this brick"""
+        position = self.position
         return (
-            self.bottom_left.x <= x <= self.bottom_right.x
-            and self.bottom_left.y <= y <= self.top_left.y
+            position.x <= x <= position.x + self._widths[self.brick_type]
+            and position.y <= y <= position.y + self._heights[self.brick_type]
         )
@@ -0,0 +1,223 @@
+from .brick import Brick, BrickState, DimensionTable
+from .common import Position
+from ..configs.config import Config
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+import numpy as np
+import numpy.typing as npt
+
+
+STATE_CODES: dict[BrickState, int] = {state: i for i, state in enumerate(BrickState)}
+STATES: list[BrickState] = list(BrickState)
+NO_STRIDE = -1
+
+
+@dataclass(frozen=True)
+class BrickColumns:
+    """Read-only geometry columns of a wall's bricks, in row order"""
+
+    ids: npt.NDArray[np.int64]
+    x: npt.NDArray[np.float64]
+    y: npt.NDArray[np.float64]
+    lengths: npt.NDArray[np.float64]
+    heights: npt.NDArray[np.float64]
+    widths: npt.NDArray[np.float64]
+
+    @classmethod
+    def from_bricks(cls, bricks: Sequence[Brick]) -> "BrickColumns":
+        count = len(bricks)
+        return cls(
+            ids=np.fromiter((b.id for b in bricks), dtype=np.int64, count=count),
+            x=np.fromiter((b.position.x for b in bricks), dtype=float, count=count),
+            y=np.fromiter((b.position.y for b in bricks), dtype=float, count=count),
+            lengths=np.fromiter((b.length for b in bricks), dtype=float, count=count),
+            heights=np.fromiter((b.height for b in bricks), dtype=float, count=count),
+            widths=np.fromiter((b.width for b in bricks), dtype=float, count=count),
+        )
+
+    @classmethod
+    def from_store(cls, store: "BrickStore") -> "BrickColumns":
+        return cls(
+            ids=store.ids,
+            x=store.x,
+            y=store.y,
+            lengths=store.lengths,
+            heights=store.heights,
+            widths=store.widths,
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+class BrickStore:
+    """Struct-of-arrays brick storage.
+
+    Holds x, y, type code, state and stride id of every brick in flat NumPy
+    arrays so that wall queries can be answered with vectorized masks.
+    Indexing returns a ``BrickView`` that reads and writes through to the
+    arrays, so a store can stand in for ``list[Brick]`` in ``Wall.bricks``.
+    """
+
+    def __init__(self, config: Config, capacity: int = 1024) -> None:
+        table = DimensionTable.from_config(config)
+        self.brick_types: tuple[str, ...] = table.types
+        self.type_codes: dict[str, int] = table.codes
+        self.type_lengths = np.array(table.lengths)
+        self.type_heights = np.array(table.heights)
+        self.type_widths = np.array(table.widths)
+
+        self._size = 0
+        self._ids = np.empty(capacity, dtype=np.int64)
+        self._x = np.empty(capacity, dtype=float)
+        self._y = np.empty(capacity, dtype=float)
+        self._type_code = np.empty(capacity, dtype=np.int8)
+        self._state = np.empty(capacity, dtype=np.int8)
+        self._stride_id = np.empty(capacity, dtype=np.int32)
+
+    def append(self, brick: Brick) -> int:
+        """Copy a brick into the store and return its row"""
+        if self._size == len(self._x):
+            self._grow(2 * self._size)
+
+        row = self._size
+        self._ids[row] = brick.id
+        self._x[row] = brick.position.x
+        self._y[row] = brick.position.y
+        self._type_code[row] = self.type_codes[brick.brick_type]
+        self._state[row] = STATE_CODES[brick.state]
+        self._stride_id[row] = NO_STRIDE if brick.stride_id is None else brick.stride_id
+        self._size += 1
+        return row
+
+    def _grow(self, capacity: int) -> None:
+        capacity = max(capacity, 1)
+        for name in ("_ids", "_x", "_y", "_type_code", "_state", "_stride_id"):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[: self._size] = old[: self._size]
+            setattr(self, name, new)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, row: int) -> "BrickView":
+        if row < 0:
+            row += self._size
+        if not 0 <= row < self._size:
+            raise IndexError("brick row out of range")
+        return BrickView(self, row)
+
+    def __iter__(self) -> Iterator["BrickView"]:
+        for row in range(self._size):
+            yield BrickView(self, row)
+
+    def set_all_states(self, state: BrickState) -> None:
+        self.state[:] = STATE_CODES[state]
+
+    # Live columns (views into the backing arrays, no copies)
+
+    @property
+    def ids(self) -> npt.NDArray[np.int64]:
+        return self._ids[: self._size]
+
+    @property
+    def x(self) -> npt.NDArray[np.float64]:
+        return self._x[: self._size]
+
+    @property
+    def y(self) -> npt.NDArray[np.float64]:
+        return self._y[: self._size]
+
+    @property
+    def type_code(self) -> npt.NDArray[np.int8]:
+        return self._type_code[: self._size]
+
+    @property
+    def state(self) -> npt.NDArray[np.int8]:
+        return self._state[: self._size]
+
+    @property
+    def stride_id(self) -> npt.NDArray[np.int32]:
+        return self._stride_id[: self._size]
+
+    @property
+    def lengths(self) -> npt.NDArray[np.float64]:
+        return self.type_lengths[self.type_code]
+
+    @property
+    def heights(self) -> npt.NDArray[np.float64]:
+        return self.type_heights[self.type_code]
+
+    @property
+    def widths(self) -> npt.NDArray[np.float64]:
+        return self.type_widths[self.type_code]
+
+    def centers(self) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Brick centres, matching ``Brick.center``"""
+        return self.x + self.widths / 2, self.y + self.heights / 2
+
+    # Vectorized queries, all returning row indices
+
+    def rows_in_state(self, state: BrickState) -> npt.NDArray[np.intp]:
+        return np.flatnonzero(self.state == STATE_CODES[state])
+
+    def rows_reachable(
+        self, x_min: float, y_min: float, x_max: float, y_max: float
+    ) -> npt.NDArray[np.intp]:
+        """Rows of planned bricks whose centre lies inside a reach area"""
+        center_x, center_y = self.centers()
+        mask = (
+            (x_min <= center_x)
+            & (center_x <= x_max)
+            & (y_min <= center_y)
+            & (center_y <= y_max)
+            & (self.state == STATE_CODES[BrickState.PLANNED])
+        )
+        return np.flatnonzero(mask)
+
+
+class BrickView(Brick):
+    """A ``Brick`` whose fields live in a row of a ``BrickStore``"""
+
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, store: BrickStore, row: int) -> None:
+        self._store = store
+        self._row = row
+
+    @property  # type: ignore[override]
+    def id(self) -> int:
+        return int(self._store._ids[self._row])
+
+    @property  # type: ignore[override]
+    def brick_type(self) -> str:
+        return self._store.brick_types[self._store._type_code[self._row]]
+
+    @property  # type: ignore[override]
+    def position(self) -> Position:
+        return Position(
+            float(self._store._x[self._row]), float(self._store._y[self._row])
+        )
+
+    @position.setter
+    def position(self, value: Position) -> None:
+        self._store._x[self._row] = value.x
+        self._store._y[self._row] = value.y
+
+    @property  # type: ignore[override]
+    def state(self) -> BrickState:
+        return STATES[self._store._state[self._row]]
+
+    @state.setter
+    def state(self, value: BrickState) -> None:
+        self._store._state[self._row] = STATE_CODES[value]
+
+    @property  # type: ignore[override]
+    def stride_id(self) -> int | None:
+        stride_id = int(self._store._stride_id[self._row])
+        return None if stride_id == NO_STRIDE else stride_id
+
+    @stride_id.setter
+    def stride_id(self, value: int | None) -> None:
+        self._store._stride_id[self._row] = NO_STRIDE if value is None else value
@@ -1,13 +1,13 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     x: float
     y: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Movement:
     from_pos: Position
     to_pos: Position
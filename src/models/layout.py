@@ -0,0 +1,221 @@
+from .brick import Brick
+from enum import Enum
+from dataclasses import dataclass, field
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .wall import Wall
+
+
+class LayoutIssueKind(Enum):
+    OUT_OF_WALL = "out_of_wall"
+    OVERLAP = "overlap"
+    HEAD_JOINT = "head_joint"
+    COURSE_GAP = "course_gap"
+    WASTED_HEIGHT = "wasted_height"
+
+
+# Issues that cause the brick itself to be rejected
+BRICK_ISSUES = {
+    LayoutIssueKind.OUT_OF_WALL,
+    LayoutIssueKind.OVERLAP,
+    LayoutIssueKind.HEAD_JOINT,
+}
+
+
+@dataclass
+class LayoutIssue:
+    kind: LayoutIssueKind
+    brick_id: int | None = None
+    other_id: int | None = None
+    course: int | None = None
+    size: float | None = None
+
+    def __str__(self) -> str:
+        match self.kind:
+            case LayoutIssueKind.OUT_OF_WALL:
+                return f"Brick {self.brick_id} is not in the wall"
+            case LayoutIssueKind.OVERLAP:
+                return f"Brick {self.brick_id} overlaps with {self.other_id}"
+            case LayoutIssueKind.HEAD_JOINT:
+                return f"Brick {self.brick_id} leaves no head joint to {self.other_id}"
+            case LayoutIssueKind.COURSE_GAP:
+                return f"Course {self.course} has gap of {self.size}"
+            case LayoutIssueKind.WASTED_HEIGHT:
+                return f"Wasted height space ({self.size} units)"
+
+
+@dataclass
+class LayoutReport:
+    accepted: list[Brick] = field(default_factory=list)
+    issues: list[LayoutIssue] = field(default_factory=list)
+    # Accepted bricks that were added to the wall as they streamed past
+    # (Wall.add_courses) and so are not kept in ``accepted``
+    streamed: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return not self.issues
+
+    @property
+    def accepted_count(self) -> int:
+        return len(self.accepted) + self.streamed
+
+    @property
+    def rejected_ids(self) -> set[int | None]:
+        return {i.brick_id for i in self.issues if i.kind in BRICK_ISSUES}
+
+    def count(self, kind: LayoutIssueKind) -> int:
+        return sum(1 for i in self.issues if i.kind == kind)
+
+    def summary(self, limit: int = 10) -> str:
+        lines = [
+            f"Layout validation: {self.accepted_count} bricks accepted, "
+            f"{len(self.rejected_ids)} rejected"
+        ]
+        for kind in LayoutIssueKind:
+            if count := self.count(kind):
+                lines.append(f"  {kind.value}: {count}")
+        for issue in self.issues[:limit]:
+            lines.append(f"  - {issue}")
+        if len(self.issues) > limit:
+            lines.append(f"  ... and {len(self.issues) - limit} more")
+        return "\n".join(lines)
+
+
+@dataclass
+class _Entry:
+    brick: Brick
+    order: int  # input order, negative for bricks already on the wall
+    x: float
+    y: float
+    length: float
+    height: float
+
+
+def validate_layout(
+    wall: "Wall", bricks: Iterable[Brick], existing: Iterable[Brick] | None = None
+) -> LayoutReport:
+    """Validate a whole layout against the wall in one pass.
+
+    Bricks are checked in order against the wall's bricks and the new bricks
+    accepted before them, the same outcome as calling ``try_add_brick`` in
+    order: a rejected brick never blocks a later one. All bricks are sorted by
+    course and x once up front; each check is then a bisect plus a scan of
+    the bricks within a brick length, skipping those not placed (yet).
+
+    ``existing`` narrows the wall's bricks checked against to the given ones
+    (default: all of them), for callers that know which are nearby.
+    """
+    head_joint = wall.config["joints"]["head_joint"]
+    course_height = (
+        wall.config["joints"]["bed_joint"] + wall.config["bricks"]["full"]["height"]
+    )
+    new_bricks = list(bricks)
+    report = LayoutReport()
+    rejected: set[int] = set()
+
+    existing = list(wall.bricks if existing is None else existing)
+    existing_entries = [
+        _entry(brick, order)
+        for order, brick in enumerate(existing, start=-len(existing))
+    ]
+    new_entries: list[_Entry] = []
+    for order, brick in enumerate(new_bricks):
+        if not wall.is_brick_in_wall(brick):
+            report.issues.append(LayoutIssue(LayoutIssueKind.OUT_OF_WALL, brick.id))
+            rejected.add(order)
+            continue
+        new_entries.append(_entry(brick, order))
+
+    max_length = max((e.length for e in existing_entries), default=0.0)
+    max_length = max((e.length for e in new_entries), default=max_length)
+    max_height = max((e.height for e in existing_entries), default=0.0)
+    max_height = max((e.height for e in new_entries), default=max_height)
+
+    # Every brick per course, sorted by x (xs kept alongside for bisect)
+    by_course: dict[int, tuple[list[float], list[_Entry]]] = {}
+    for entry in sorted(
+        existing_entries + new_entries,
+        key=lambda e: (int(e.y / course_height), e.x),
+    ):
+        xs, entries = by_course.setdefault(int(entry.y / course_height), ([], []))
+        xs.append(entry.x)
+        entries.append(entry)
+    placed: set[int] = set()  # orders of the bricks placed so far
+
+    def conflict(entry: _Entry) -> _Entry | None:
+        """A placed brick closer than a head joint to ``entry``, if any"""
+        first = int((entry.y - max_height) / course_height)
+        last = int((entry.y + entry.height) / course_height)
+        for course in range(first, last + 1):
+            if course not in by_course:
+                continue
+            xs, entries = by_course[course]
+            start = bisect_right(xs, entry.x - head_joint - max_length)
+            end = bisect_left(xs, entry.x + entry.length + head_joint)
+            for other in entries[start:end]:
+                if (
+                    other.order in placed
+                    and other.x + other.length + head_joint > entry.x
+                    and _y_overlap(entry, other)
+                ):
+                    return other
+        return None
+
+    placed.update(entry.order for entry in existing_entries)
+
+    for entry in new_entries:
+        other = conflict(entry)
+        if other is None:
+            placed.add(entry.order)
+            continue
+        kind = (
+            LayoutIssueKind.OVERLAP
+            if min(entry.x + entry.length, other.x + other.length)
+            > max(entry.x, other.x)
+            else LayoutIssueKind.HEAD_JOINT
+        )
+        report.issues.append(LayoutIssue(kind, entry.brick.id, other.brick.id))
+        rejected.add(entry.order)
+
+    report.accepted = [b for i, b in enumerate(new_bricks) if i not in rejected]
+
+    # Course level checks, same rules as Wall.validate_wall_integrity
+    used_height = wall.num_courses * course_height
+    remaining_height = wall.height - used_height
+    if remaining_height > wall.config["joints"]["bed_joint"]:
+        report.issues.append(
+            LayoutIssue(LayoutIssueKind.WASTED_HEIGHT, size=remaining_height)
+        )
+
+    num_courses = wall.num_courses
+    for course in sorted(c for c in by_course if 0 <= c < num_courses):
+        entries = [e for e in by_course[course][1] if e.order in placed]
+        if not entries:
+            continue
+        rightmost = max(entries, key=lambda e: e.x + e.length)
+        remaining_space = wall.width - (rightmost.x + rightmost.length)
+        if remaining_space > 0 and remaining_space != head_joint:
+            report.issues.append(
+                LayoutIssue(
+                    LayoutIssueKind.COURSE_GAP,
+                    brick_id=rightmost.brick.id,
+                    course=course,
+                    size=remaining_space,
+                )
+            )
+
+    return report
+
+
+def _entry(brick: Brick, order: int) -> _Entry:
+    return _Entry(
+        brick, order, brick.position.x, brick.position.y, brick.length, brick.height
+    )
+
+
+def _y_overlap(a: _Entry, b: _Entry) -> bool:
+    return a.y < b.y + b.height and b.y < a.y + a.height
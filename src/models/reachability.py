@@ -0,0 +1,164 @@
+from .wall import Wall
+from .brick_store import BrickColumns
+from .robot import Robot
+import numpy as np
+import numpy.typing as npt
+from collections import OrderedDict
+import weakref
+
+
+# wall -> {(reach_width, reach_height, positions): matrix}, least recently
+# used first
+_CacheKey = tuple[float, float, bytes]
+_cache: (
+    "weakref.WeakKeyDictionary[Wall, OrderedDict[_CacheKey, ReachabilityMatrix]]"
+) = weakref.WeakKeyDictionary()
+CACHE_SIZE = 8  # matrices kept per wall
+
+
+class ReachabilityMatrix:
+    """Sparse robot position x brick coverage matrix.
+
+    Entry (p, b) is set when the centre of brick row b lies inside the reach
+    area of a robot standing at position p, using the same centre and
+    inclusive bounds as ``Robot.can_reach_brick``. The matrix is stored
+    twice, by position (CSR) and by brick (CSC), so both directions are
+    answered in O(output). Coverage is purely geometric; planners filter by
+    brick state themselves.
+    """
+
+    def __init__(
+        self,
+        columns: BrickColumns,
+        positions: npt.ArrayLike,
+        reach_width: float,
+        reach_height: float,
+    ) -> None:
+        self.columns = columns
+        self.positions = np.asarray(positions, dtype=float).reshape(-1, 2)
+        self.reach_width = reach_width
+        self.reach_height = reach_height
+
+        center_x = columns.x + columns.widths / 2
+        center_y = columns.y + columns.heights / 2
+        px = self.positions[:, 0]
+        py = self.positions[:, 1]
+
+        # Bucket centres into bands one reach high, sorted by (band, x), so a
+        # position's reach is one contiguous slice in each of at most two
+        # bands
+        band_height = reach_height if reach_height > 0 else 1.0
+        band = np.floor(center_y / band_height).astype(np.int64)
+        x_offset = min(center_x.min(initial=0.0), px.min(initial=0.0)) - reach_width
+        span = max(center_x.max(initial=0.0), px.max(initial=0.0)) - x_offset
+        span += reach_width + 1.0
+        keys = band * span + (center_x - x_offset)
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+
+        first_band = np.floor(py / band_height).astype(np.int64)
+        last_band = np.floor((py + reach_height) / band_height).astype(np.int64)
+        bands_per_position = last_band - first_band + 1
+        pair_position = np.repeat(np.arange(len(px)), bands_per_position)
+        pair_offset = np.cumsum(bands_per_position) - bands_per_position
+        pair_band = np.repeat(
+            first_band - pair_offset, bands_per_position
+        ) + np.arange(len(pair_position))
+        pair_x = px[pair_position] - x_offset
+        start = np.searchsorted(
+            keys, pair_band * span + pair_x - reach_width / 2, side="left"
+        )
+        end = np.searchsorted(
+            keys, pair_band * span + pair_x + reach_width / 2, side="right"
+        )
+        sizes = end - start
+
+        position = np.repeat(pair_position, sizes)
+        slot = np.repeat(start - (np.cumsum(sizes) - sizes), sizes) + np.arange(
+            int(sizes.sum())
+        )
+        rows = order[slot]
+        in_reach = (py[position] <= center_y[rows]) & (
+            center_y[rows] <= py[position] + reach_height
+        )
+        position = position[in_reach]
+        rows = rows[in_reach]
+
+        by_position = np.lexsort((rows, position))
+        self._rows = rows[by_position]
+        self._row_ptr = np.searchsorted(
+            position[by_position], np.arange(len(px) + 1)
+        )
+
+        by_brick = np.lexsort((position, rows))
+        self._positions = position[by_brick]
+        self._position_ptr = np.searchsorted(
+            rows[by_brick], np.arange(len(columns) + 1)
+        )
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return len(self.positions), len(self.columns)
+
+    @property
+    def nnz(self) -> int:
+        return len(self._rows)
+
+    def bricks_reachable_from(self, position: int) -> npt.NDArray[np.intp]:
+        """Rows of the bricks reachable from a position, ascending"""
+        return self._rows[self._row_ptr[position] : self._row_ptr[position + 1]]
+
+    def positions_covering(self, row: int) -> npt.NDArray[np.intp]:
+        """Indices of the positions that can reach a brick row, ascending"""
+        return self._positions[self._position_ptr[row] : self._position_ptr[row + 1]]
+
+    def brick_ids_reachable_from(self, position: int) -> npt.NDArray[np.int64]:
+        return self.columns.ids[self.bricks_reachable_from(position)]
+
+    def coverage_counts(self) -> npt.NDArray[np.intp]:
+        """Number of positions covering each brick row"""
+        return np.diff(self._position_ptr)
+
+    @classmethod
+    def for_wall(
+        cls,
+        wall: Wall,
+        positions: npt.ArrayLike,
+        reach_width: float,
+        reach_height: float,
+    ) -> "ReachabilityMatrix":
+        """Shared, cached matrix for a wall.
+
+        Matrices are cached per wall and (reach, positions) and rebuilt once
+        bricks are added to the wall. Only the ``CACHE_SIZE`` most recently
+        used matrices are kept per wall.
+        """
+        points = np.ascontiguousarray(positions, dtype=float).reshape(-1, 2)
+        key = (float(reach_width), float(reach_height), points.tobytes())
+        columns = wall.columns()
+
+        cache = _cache.setdefault(wall, OrderedDict())
+        matrix = cache.get(key)
+        if matrix is None or matrix.columns is not columns:
+            matrix = cls(columns, points, reach_width, reach_height)
+            cache[key] = matrix
+            if len(cache) > CACHE_SIZE:
+                cache.popitem(last=False)
+        cache.move_to_end(key)
+        return matrix
+
+    @classmethod
+    def for_robot(
+        cls, wall: Wall, robot: Robot, positions: npt.ArrayLike
+    ) -> "ReachabilityMatrix":
+        return cls.for_wall(wall, positions, robot.reach_width, robot.reach_height)
+
+
+def lattice_positions(
+    wall: Wall, step_x: float, step_y: float, x_start: float = 0.0
+) -> npt.NDArray[np.float64]:
+    """Candidate robot positions on a regular lattice over the wall, row by row"""
+    xs = np.arange(x_start, wall.width + step_x / 2, step_x)
+    ys = np.arange(0.0, wall.height, step_y)
+    grid_x, grid_y = np.meshgrid(xs, ys)
+    return np.column_stack([grid_x.ravel(), grid_y.ravel()])
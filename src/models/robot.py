@@ -21,12 +21,6 @@ class Robot:
         y_max: float = self.position.y + self.reach_height
         return (x_min, y_min, x_max, y_max)
 
-    def _get_brick_center(self, brick: Brick) -> tuple[float, float]:
-        return (
-            brick.position.x + brick.width / 2, 
-            brick.position.y + brick.height / 2
-        )
-
     def can_reach_brick(self, brick: Brick) -> bool:
         """Check if robot can reach a brick based on its center position.
         With center-based reach, we can use simpler positioning since
@@ -34,14 +28,15 @@ class Robot:
         It's safe to assume that robot would pick up the brick
         in the center of the brick.
         """
-        x_min = self.position.x - self.reach_width / 2
-        x_max = self.position.x + self.reach_width / 2
-        y_min = self.position.y
-        y_max = self.position.y + self.reach_height
+        position = self.position
+        half_reach = self.reach_width / 2
+        center_x = brick.center_x
+        center_y = brick.center_y
 
-        center_x, center_y = self._get_brick_center(brick)
-
-        return x_min <= center_x <= x_max and y_min <= center_y <= y_max
+        return (
+            position.x - half_reach <= center_x <= position.x + half_reach
+            and position.y <= center_y <= position.y + self.reach_height
+        )
 
     def move_to(self, x: float, y: float) -> None:
         """Move robot to new position"""
@@ -53,6 +48,10 @@ class Robot:
 
     def get_reachable_bricks(self, wall: Wall) -> list[Brick]:
         """Get all bricks reachable from current position"""
+        if wall.store is not None:
+            return [
+                wall.store[row] for row in wall.store.rows_reachable(*self.reach_area)
+            ]
         return [
             b
             for b in wall.bricks
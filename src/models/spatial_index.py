@@ -0,0 +1,230 @@
+from .brick_store import BrickColumns
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator, Sequence
+import numpy as np
+import numpy.typing as npt
+
+
+class CourseIndex:
+    """Per-course interval index over brick positions.
+
+    Bricks are bucketed by course (``int(y / course_height)``) and kept sorted
+    by x inside each course, so a rectangle query only bisects into the
+    handful of courses it spans instead of scanning the whole wall.
+    Entries are row numbers into the owning wall's brick sequence, held in
+    typed arrays so the index itself stays small on very large walls.
+    """
+
+    def __init__(self, course_height: float) -> None:
+        self.course_height = course_height
+        self._xs: dict[int, array[float]] = {}
+        self._rows: dict[int, array[int]] = {}
+        # Largest extents seen so far, used to widen queries so that bricks
+        # starting left of / below the query rectangle are still found.
+        self.max_length: float = 0.0
+        self.max_height: float = 0.0
+
+    def course_of(self, y: float) -> int:
+        return int(y / self.course_height)
+
+    def insert(
+        self, row: int, x: float, y: float, length: float, height: float
+    ) -> None:
+        course = self.course_of(y)
+        xs = self._xs.get(course)
+        if xs is None:
+            xs = self._xs[course] = array("d")
+            rows = self._rows[course] = array("q")
+        else:
+            rows = self._rows[course]
+        if not xs or x >= xs[-1]:
+            # Bond calculators emit bricks left to right, keep that path O(1)
+            xs.append(x)
+            rows.append(row)
+        else:
+            i = bisect_right(xs, x)
+            xs.insert(i, x)
+            rows.insert(i, row)
+
+        self.max_length = max(self.max_length, length)
+        self.max_height = max(self.max_height, height)
+
+    def rows_in_course(self, course: int) -> Sequence[int]:
+        """Rows of the bricks in a course, ordered left to right (a copy)"""
+        return tuple(self._rows.get(course, ()))
+
+    def entries_between(
+        self, course: int, x_min: float, x_max: float
+    ) -> Iterator[tuple[float, int]]:
+        """Yield (x, row) for bricks of a course starting within [x_min, x_max]"""
+        xs = self._xs.get(course)
+        if not xs:
+            return
+        start = bisect_left(xs, x_min)
+        end = bisect_right(xs, x_max)
+        yield from zip(xs[start:end], self._rows[course][start:end])
+
+    @property
+    def courses(self) -> list[int]:
+        """Non-empty course numbers, bottom to top"""
+        return sorted(self._rows)
+
+    def candidates(
+        self, x_min: float, x_max: float, y_min: float, y_max: float
+    ) -> Iterator[int]:
+        """Yield rows of bricks that may intersect [x_min, x_max] x [y_min, y_max].
+
+        The result is a superset: callers apply their exact predicate.
+        """
+        first_course = self.course_of(y_min - self.max_height)
+        last_course = self.course_of(y_max)
+        x_lo = x_min - self.max_length
+
+        for course in range(first_course, last_course + 1):
+            xs = self._xs.get(course)
+            if not xs:
+                continue
+            start = bisect_left(xs, x_lo)
+            end = bisect_right(xs, x_max)
+            yield from self._rows[course][start:end]
+
+    def __len__(self) -> int:
+        return sum(len(rows) for rows in self._rows.values())
+
+
+
+class SortedCourses:
+    """Static snapshot of a wall's bricks sorted by (course, x).
+
+    Built once from ``BrickColumns`` and answers batched queries with
+    ``np.searchsorted`` on a combined (course, x) key.
+    """
+
+    def __init__(self, columns: BrickColumns, course_height: float) -> None:
+        self.course_height = course_height
+        course = (columns.y / course_height).astype(np.int64)
+        order = np.lexsort((columns.x, course))
+
+        self.rows = order
+        self.course = course[order]
+        self.x = columns.x[order]
+        self.y = columns.y[order]
+        self.lengths = columns.lengths[order]
+        self.heights = columns.heights[order]
+        self.widths = columns.widths[order]
+
+        if len(order):
+            self.max_length = float(self.lengths.max())
+            self.max_height = float(self.heights.max())
+            self.max_width = float(self.widths.max())
+            self.x_offset = float(self.x.min())
+            # Wide enough that keys of neighbouring courses never interleave
+            margin = max(self.max_length, self.max_width)
+            self.course_span = float(self.x.max() - self.x_offset) + 2 * margin + 1
+        else:
+            self.max_length = self.max_height = self.max_width = 0.0
+            self.x_offset = 0.0
+            self.course_span = 1.0
+        self.keys = self._key(self.course, self.x)
+
+    def _key(
+        self, course: npt.NDArray[np.int64], x: npt.NDArray[np.float64]
+    ) -> npt.NDArray[np.float64]:
+        return course * self.course_span + (x - self.x_offset)
+
+    def locate(self, xs: npt.ArrayLike, ys: npt.ArrayLike) -> npt.NDArray[np.int64]:
+        """Row of the brick containing each point, -1 where there is none.
+
+        Containment is ``Brick.contains_point`` (x within the brick's width).
+        When several bricks contain a point the lowest row wins, like a scan
+        over the wall in row order.
+        """
+        px = np.asarray(xs, dtype=float).ravel()
+        py = np.asarray(ys, dtype=float).ravel()
+        result = np.full(px.shape, -1, dtype=np.int64)
+        if not len(self.rows):
+            return result
+
+        point_course = (py / self.course_height).astype(np.int64)
+        points = np.arange(len(px))
+        # Bricks taller than a course can reach up into the courses above
+        for below in range(int(self.max_height / self.course_height) + 2):
+            course = point_course - below
+            # Bricks of the course starting within a brick width left of x
+            start = np.searchsorted(
+                self.keys, self._key(course, px - self.max_width), side="left"
+            )
+            end = np.searchsorted(self.keys, self._key(course, px), side="right")
+            sizes = np.maximum(end - start, 0)
+            point = np.repeat(points, sizes)
+            i = np.repeat(start - (np.cumsum(sizes) - sizes), sizes) + np.arange(
+                int(sizes.sum())
+            )
+            hit = (
+                (self.course[i] == course[point])
+                & (self.x[i] <= px[point])
+                & (px[point] <= self.x[i] + self.widths[i])
+                & (self.y[i] <= py[point])
+                & (py[point] <= self.y[i] + self.heights[i])
+            )
+            point = point[hit]
+            rows = self.rows[i[hit]]
+            missing = result[point] == -1
+            result[point[missing]] = rows[missing]
+            np.minimum.at(result, point, rows)
+        return result
+
+    def rows_in_regions(self, regions: npt.ArrayLike) -> list[npt.NDArray[np.int64]]:
+        """Rows of bricks lying completely inside each (x, y, width, height).
+
+        Every (rectangle, course) pair becomes one searchsorted slice of the
+        sorted layout, so only bricks in the overlapping courses and x ranges
+        are touched. Rows are returned in ascending order per rectangle.
+        """
+        rects = np.asarray(regions, dtype=float).reshape(-1, 4)
+        count = len(rects)
+        if not len(self.rows) or not count:
+            return [np.empty(0, dtype=np.int64) for _ in range(count)]
+
+        x_min = rects[:, 0]
+        y_min = rects[:, 1]
+        x_max = x_min + rects[:, 2]
+        y_max = y_min + rects[:, 3]
+
+        # One entry per (rectangle, course) pair
+        first_course = (y_min / self.course_height).astype(np.int64)
+        last_course = (y_max / self.course_height).astype(np.int64)
+        courses_per_rect = np.maximum(last_course - first_course + 1, 0)
+        pair_rect = np.repeat(np.arange(count), courses_per_rect)
+        pair_offset = np.arange(len(pair_rect)) - np.repeat(
+            np.cumsum(courses_per_rect) - courses_per_rect, courses_per_rect
+        )
+        pair_course = first_course[pair_rect] + pair_offset
+
+        # Keep the x bounds inside the layout so keys stay within their course
+        lo_x = np.maximum(x_min[pair_rect], self.x_offset)
+        hi_x = np.minimum(x_max[pair_rect], float(self.x.max()))
+        start = np.searchsorted(self.keys, self._key(pair_course, lo_x), side="left")
+        end = np.searchsorted(self.keys, self._key(pair_course, hi_x), side="right")
+        sizes = np.maximum(end - start, 0)
+
+        # Expand the slices into sorted-layout positions
+        hit_rect = np.repeat(pair_rect, sizes)
+        hit = np.repeat(start - (np.cumsum(sizes) - sizes), sizes) + np.arange(
+            int(sizes.sum())
+        )
+        inside = (
+            (x_min[hit_rect] <= self.x[hit])
+            & (y_min[hit_rect] <= self.y[hit])
+            & (self.x[hit] + self.lengths[hit] <= x_max[hit_rect])
+            & (self.y[hit] + self.heights[hit] <= y_max[hit_rect])
+        )
+        hit_rect = hit_rect[inside]
+        hit_rows = self.rows[hit[inside]]
+
+        order = np.lexsort((hit_rows, hit_rect))
+        hit_rect = hit_rect[order]
+        hit_rows = hit_rows[order]
+        bounds = np.searchsorted(hit_rect, np.arange(count + 1))
+        return [hit_rows[bounds[i] : bounds[i + 1]] for i in range(count)]
@@ -8,6 +8,7 @@ class Stride:
         self.robot_position: Position = robot_position
         self.bricks: list[Brick] = []
         self.color: tuple[int, int, int] = color
+        self.arm_time: float | None = None  # seconds, set by brick sequencing
 
     @property
     def brick_count(self) -> int:
@@ -0,0 +1,95 @@
+from .wall import Wall
+from collections.abc import Iterable
+import numpy as np
+import numpy.typing as npt
+
+
+class SupportGraph:
+    """Which bricks each brick rests on.
+
+    Brick b rests on brick s when s is in the course directly below b and
+    their horizontal extents overlap (bricks only touching across a head
+    joint do not count). Built from the wall's (course, x)-sorted layout:
+    since bricks in a course do not overlap, the bricks under b form one
+    contiguous run of the course below, found with two searchsorted calls,
+    so the build is O(n log n + edges). Edges are stored by brick (CSR) and
+    by supporter (CSC), indexed by wall row.
+    """
+
+    def __init__(self, wall: Wall) -> None:
+        layout = wall.sorted_courses()
+        count = wall.total_bricks
+        ids = wall.columns().ids
+        self._id_order = np.argsort(ids, kind="stable")
+        self._sorted_ids = ids[self._id_order]
+        self.course = np.empty(count, dtype=np.int64)
+        self.course[layout.rows] = layout.course
+
+        rights = layout.keys + layout.lengths
+        below = layout.course - 1
+        start = np.searchsorted(rights, layout._key(below, layout.x), side="right")
+        end = np.searchsorted(
+            layout.keys, layout._key(below, layout.x + layout.lengths), side="left"
+        )
+        sizes = np.maximum(end - start, 0)
+
+        brick = np.repeat(layout.rows, sizes)
+        slot = np.repeat(start - (np.cumsum(sizes) - sizes), sizes) + np.arange(
+            int(sizes.sum())
+        )
+        supporter = layout.rows[slot]
+
+        by_brick = np.lexsort((supporter, brick))
+        self._supporters = supporter[by_brick]
+        self._supporter_ptr = np.searchsorted(brick[by_brick], np.arange(count + 1))
+
+        by_supporter = np.lexsort((brick, supporter))
+        self._dependents = brick[by_supporter]
+        self._dependent_ptr = np.searchsorted(
+            supporter[by_supporter], np.arange(count + 1)
+        )
+
+    def __len__(self) -> int:
+        return len(self._supporter_ptr) - 1
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._supporters)
+
+    def rows_of(self, brick_ids: npt.ArrayLike) -> npt.NDArray[np.intp]:
+        """Wall rows of the given brick ids"""
+        positions = np.searchsorted(self._sorted_ids, np.asarray(brick_ids))
+        return self._id_order[positions]
+
+    def supporters(self, row: int) -> npt.NDArray[np.intp]:
+        """Rows of the bricks a brick rests on, ascending"""
+        return self._supporters[self._supporter_ptr[row] : self._supporter_ptr[row + 1]]
+
+    def dependents(self, row: int) -> npt.NDArray[np.intp]:
+        """Rows of the bricks resting on a brick, ascending"""
+        return self._dependents[self._dependent_ptr[row] : self._dependent_ptr[row + 1]]
+
+    def support_counts(self) -> npt.NDArray[np.intp]:
+        """Number of supporters per row"""
+        return np.diff(self._supporter_ptr)
+
+    def edges(self) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]]:
+        """(brick rows, supporter rows) of every edge, by brick"""
+        brick = np.repeat(np.arange(len(self)), self.support_counts())
+        return brick, self._supporters
+
+    def unsupported_rows(self) -> npt.NDArray[np.intp]:
+        """Rows above the first course that rest on nothing"""
+        return np.flatnonzero((self.course > 0) & (self.support_counts() == 0))
+
+    def order_violations(self, rows: Iterable[int]) -> list[tuple[int, int]]:
+        """(brick row, supporter row) pairs where a build order places a brick
+        before one of its supporters, or leaves a supporter out."""
+        step = np.full(len(self), -1, dtype=np.int64)
+        order = np.fromiter(rows, dtype=np.int64)
+        step[order] = np.arange(len(order))
+
+        brick, supporter = self.edges()
+        built = step[brick] >= 0
+        late = built & ((step[supporter] < 0) | (step[supporter] > step[brick]))
+        return list(zip(brick[late].tolist(), supporter[late].tolist()))
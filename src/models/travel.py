@@ -0,0 +1,85 @@
+from .common import Position, Movement
+from ..configs.config import Config
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, fields
+from typing import Any
+import math
+import numpy as np
+import numpy.typing as npt
+
+
+@dataclass(frozen=True)
+class TravelCostModel:
+    """Time in seconds for the robot platform to move between positions.
+
+    The platform traverses and lifts one axis at a time, at its own speed
+    (mm/s) per axis, and every move that changes height pays a fixed
+    ``lift_penalty`` for re-levelling. Read from the optional ``travel``
+    section of a wall config.
+    """
+
+    speed_x: float = 500.0
+    speed_y: float = 100.0
+    lift_penalty: float = 10.0
+
+    @classmethod
+    def from_config(cls, config: Config) -> "TravelCostModel":
+        return cls(**_known_fields(cls, config.get("travel", {})))
+
+    def cost(self, from_pos: Position, to_pos: Position) -> float:
+        dx = abs(to_pos.x - from_pos.x)
+        dy = abs(to_pos.y - from_pos.y)
+        lift = self.lift_penalty if dy else 0.0
+        return dx / self.speed_x + dy / self.speed_y + lift
+
+    def movement_cost(self, movement: Movement) -> float:
+        return self.cost(movement.from_pos, movement.to_pos)
+
+    def total(self, movements: Iterable[Movement]) -> float:
+        return sum(self.movement_cost(m) for m in movements)
+
+    def cost_matrix(
+        self, from_points: npt.ArrayLike, to_points: npt.ArrayLike
+    ) -> npt.NDArray[np.float64]:
+        """Pairwise costs between (x, y) rows of two point arrays"""
+        a = np.asarray(from_points, dtype=float).reshape(-1, 2)
+        b = np.asarray(to_points, dtype=float).reshape(-1, 2)
+        dx = np.abs(a[:, None, 0] - b[None, :, 0])
+        dy = np.abs(a[:, None, 1] - b[None, :, 1])
+        return dx / self.speed_x + dy / self.speed_y + np.where(
+            dy > 0, self.lift_penalty, 0.0
+        )
+
+
+@dataclass(frozen=True)
+class ArmCostModel:
+    """Time in seconds for the arm to lay the bricks of one stride.
+
+    Bricks are fed to the laying head, which starts at the pickup point
+    (offset in mm from the robot position), moves in a straight line at
+    ``speed`` (mm/s) from one brick centre to the next, spends
+    ``place_time`` on each brick and parks back at the pickup point. Read
+    from the optional ``arm`` section of a wall config.
+    """
+
+    pickup_x: float = 0.0
+    pickup_y: float = 0.0
+    speed: float = 250.0
+    place_time: float = 4.0
+
+    @classmethod
+    def from_config(cls, config: Config) -> "ArmCostModel":
+        return cls(**_known_fields(cls, config.get("arm", {})))
+
+    def pickup(self, robot_position: Position) -> Position:
+        return Position(
+            robot_position.x + self.pickup_x, robot_position.y + self.pickup_y
+        )
+
+    def cost(self, from_pos: Position, to_pos: Position) -> float:
+        return math.hypot(to_pos.x - from_pos.x, to_pos.y - from_pos.y) / self.speed
+
+
+def _known_fields(cls: type, section: Mapping[str, Any]) -> dict[str, Any]:
+    """The entries of a config section that are fields of ``cls``"""
+    return {f.name: section[f.name] for f in fields(cls) if f.name in section}
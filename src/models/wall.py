@@ -1,24 +1,64 @@
 from .brick import Brick, BrickState
+from .brick_store import BrickColumns, BrickStore
+from .layout import LayoutIssueKind, LayoutReport, validate_layout
+from .spatial_index import CourseIndex, SortedCourses
+from .stride import Stride
 from ..configs.config import Config
+from collections.abc import Iterable, Iterator
+import numpy as np
+import numpy.typing as npt
 
 
 class Wall:
-    def __init__(self, config: Config) -> None:
+    def __init__(self, config: Config, columnar: bool = False) -> None:
+        """
+        With ``columnar=True`` the wall is backed by a ``BrickStore``: added
+        bricks are copied into NumPy columns and ``bricks`` yields lightweight
+        ``BrickView`` objects reading from them.
+        """
         self.width: float = config["wall"]["width"]
         self.height: float = config["wall"]["height"]
         self.config = config
-        self.bricks: list[Brick] = []
-        self.brick_grid: dict[tuple[int, int], Brick] = {}  # (row, col) -> Brick
+        self.store: BrickStore | None = BrickStore(config) if columnar else None
+        self.bricks: list[Brick] | BrickStore = (
+            self.store if self.store is not None else []
+        )
+        self._index = CourseIndex(
+            config["joints"]["bed_joint"] + config["bricks"]["full"]["height"]
+        )
+        self._head_joint: float = config["joints"]["head_joint"]
+        # Point lookups test the x extent against the brick width, like
+        # Brick.contains_point
+        self._max_width: float = max(
+            (float(brick["width"]) for brick in config["bricks"].values()),
+            default=0.0,
+        )
+        # NumPy snapshots for batch queries, dropped whenever a brick is added
+        self._columns: BrickColumns | None = None
+        self._sorted_courses: SortedCourses | None = None
+        # Build progress, kept up to date by set_brick_state
+        self._built_count = 0
+        self._built_by_course: dict[int, int] = {}
+        self._built_by_stride: dict[int, int] = {}
+        # Bricks whose state changed since the last take_state_changes(),
+        # None when any brick may have (nobody asked yet, bulk change)
+        self._state_changes: list[Brick] | None = None
 
     def add_brick(self, brick: Brick) -> None:
         """Add a brick to the wall"""
-        course_height = (
-            self.config["joints"]["bed_joint"] + self.config["bricks"]["full"]["height"]
+        self._index.insert(
+            len(self.bricks),
+            brick.position.x,
+            brick.position.y,
+            brick.length,
+            brick.height,
         )
         self.bricks.append(brick)
-        row = int(brick.position.y / course_height)
-        col = self._calculate_column(brick.position.x, row)
-        self.brick_grid[(row, col)] = brick
+        self._columns = None
+        self._sorted_courses = None
+        self._state_changes = None
+        if brick.state == BrickState.BUILT:
+            self._count_built(brick, 1)
 
     def try_add_brick(self, brick: Brick) -> bool:
         """Try to add a brick with validation. Returns True if successful."""
@@ -30,6 +70,64 @@ class Wall:
         self.add_brick(brick)
         return True
 
+    def validate_layout(self, bricks: Iterable[Brick]) -> LayoutReport:
+        """Validate a whole layout in one sweep without adding anything"""
+        return validate_layout(self, bricks)
+
+    def add_bricks(self, bricks: Iterable[Brick]) -> LayoutReport:
+        """Bulk version of try_add_brick.
+
+        Validates all bricks in a single sweep, adds the accepted ones in
+        order and returns a report of every failure.
+        """
+        report = validate_layout(self, bricks)
+        for brick in report.accepted:
+            self.add_brick(brick)
+        return report
+
+    def add_courses(self, courses: Iterable[Iterable[Brick]]) -> LayoutReport:
+        """Streaming add_bricks for bond generators that yield course by course.
+
+        Each batch is validated against the wall's bricks that reach into the
+        courses it spans, then added, so only one course of new bricks
+        is held at a time. Accepted bricks are counted in the report's
+        ``streamed`` rather than kept.
+
+        This only bounds memory while the wall is populated: the wall itself
+        keeps every brick, and planning works on the full brick list.
+        """
+        report = LayoutReport()
+        for batch in courses:
+            bricks = list(batch)
+            if not bricks:
+                continue
+            bottom = min(b.position.y for b in bricks)
+            top = max(b.top for b in bricks)
+            first = self._index.course_of(bottom - self._index.max_height)
+            last = self._index.course_of(top)
+            nearby = [
+                brick
+                for course in range(first, last + 1)
+                for row in self._index.rows_in_course(course)
+                if (brick := self.bricks[row]).top > bottom
+            ]
+
+            batch_report = validate_layout(self, bricks, existing=nearby)
+            for brick in batch_report.accepted:
+                self.add_brick(brick)
+            report.streamed += len(batch_report.accepted)
+
+            # Course checks of the nearby courses were reported with their batch
+            courses_in_batch = {self.get_course(b) for b in bricks}
+            for issue in batch_report.issues:
+                if issue.kind == LayoutIssueKind.WASTED_HEIGHT:
+                    if report.count(LayoutIssueKind.WASTED_HEIGHT):
+                        continue
+                elif issue.course is not None and issue.course not in courses_in_batch:
+                    continue
+                report.issues.append(issue)
+        return report
+
     def _calculate_column(self, x_position: float, row: int) -> int:
         brick_lengths = [brick["length"] for brick in self.config["bricks"].values()]
         min_brick_length = min(brick_lengths)
@@ -38,45 +136,123 @@ class Wall:
         return int(x_position / unit_width)
 
     def get_brick_at_position(self, x: float, y: float) -> Brick | None:
-        """Get brick at specific coordinates"""
-        for brick in self.bricks:
-            if brick.contains_point(x, y):
-                return brick
-        return None
+        """Get brick at specific coordinates.
+
+        Looks up the course arithmetically and bisects on x inside it, so
+        this is O(log k) for k bricks per course.
+        """
+        found: int | None = None
+        for row in self._index.candidates(x - self._max_width, x, y, y):
+            if (found is None or row < found) and self.bricks[row].contains_point(x, y):
+                found = row
+        return None if found is None else self.bricks[found]
+
+    def get_bricks_at_positions(
+        self, xs: npt.ArrayLike, ys: npt.ArrayLike
+    ) -> npt.NDArray[np.int64]:
+        """Batch get_brick_at_position: brick id per point, -1 where empty"""
+        rows = self.sorted_courses().locate(xs, ys)
+        ids = self.columns().ids
+        if not len(ids):
+            return rows
+        return np.where(rows >= 0, ids[rows], -1)
+
+    def columns(self) -> BrickColumns:
+        """Brick geometry as NumPy arrays in row order, cached until the next add"""
+        if self._columns is None:
+            if self.store is not None:
+                self._columns = BrickColumns.from_store(self.store)
+            else:
+                self._columns = BrickColumns.from_bricks(self.bricks)
+        return self._columns
+
+    def sorted_courses(self) -> SortedCourses:
+        """Bricks sorted by (course, x) for batch queries, cached until the next add"""
+        if self._sorted_courses is None:
+            self._sorted_courses = SortedCourses(
+                self.columns(), self._index.course_height
+            )
+        return self._sorted_courses
 
     def get_brick_at_grid(self, row: int, col: int) -> Brick | None:
-        """Get brick at specific grid position"""
-        return self.brick_grid.get((row, col))
+        """Get brick at specific grid position.
+
+        Resolved from the course index rather than a separate grid dict; when
+        several bricks share a cell the most recently added one wins.
+        """
+        brick_lengths = [brick["length"] for brick in self.config["bricks"].values()]
+        unit_width = min(brick_lengths) + self.config["joints"]["head_joint"]
+
+        found: int | None = None
+        for x, index in self._index.entries_between(
+            row, (col - 1) * unit_width, (col + 1) * unit_width
+        ):
+            if self._calculate_column(x, row) != col:
+                continue
+            if found is None or index > found:
+                found = index
+        return None if found is None else self.bricks[found]
 
     def get_bricks_in_region(
         self, x: float, y: float, width: float, height: float
     ) -> list[Brick]:
-        """Get all bricks within a rectangular region (stride)"""
-        return [
-            brick
-            for brick in self.bricks
+        """Get all bricks within a rectangular region (stride).
+
+        Only the courses and x ranges the region overlaps are read from the
+        spatial index.
+        """
+        rows = []
+        for row in self._index.candidates(x, x + width, y, y + height):
+            brick = self.bricks[row]
+            position = brick.position
             if (
-                x <= brick.position.x <= x + width
-                and y <= brick.position.y <= y + height
-                and brick.position.x + brick.length <= x + width
-                and brick.position.y + brick.height <= y + height
-            )
-        ]
+                x <= position.x
+                and y <= position.y
+                and brick.right <= x + width
+                and brick.top <= y + height
+            ):
+                rows.append(row)
+        return [self.bricks[row] for row in sorted(rows)]
+
+    def get_bricks_in_regions(
+        self, regions: npt.ArrayLike
+    ) -> list[npt.NDArray[np.int64]]:
+        """Batch get_bricks_in_region.
+
+        Takes an (m, 4) array of (x, y, width, height) rectangles and returns
+        one array of brick ids per rectangle, in row order.
+        """
+        rows = self.sorted_courses().rows_in_regions(regions)
+        ids = self.columns().ids
+        return [ids[r] for r in rows]
 
     def get_bricks_in_course(self, course: int) -> list[Brick]:
-        """Get all bricks in a specific course (row)"""
-        course_height = (
-            self.config["joints"]["bed_joint"] + self.config["bricks"]["full"]["height"]
-        )
-        return [
-            brick
-            for brick in self.bricks
-            if int(brick.position.y / course_height) == course
-        ]
+        """Get all bricks in a specific course (row), ordered left to right"""
+        return [self.bricks[row] for row in self._index.rows_in_course(course)]
+
+    def get_course(self, brick: Brick) -> int:
+        """Course (row) number a brick belongs to"""
+        return self._index.course_of(brick.position.y)
+
+    def iter_courses(self) -> Iterator[tuple[int, list[Brick]]]:
+        """Yield (course, bricks) for every non-empty course, bottom to top"""
+        for course in self._index.courses:
+            yield course, self.get_bricks_in_course(course)
 
     def validate_brick_placement(self, brick: Brick) -> bool:
-        """Check if a brick can be placed without overlapping existing bricks"""
-        for existing_brick in self.bricks:
+        """Check if a brick can be placed without overlapping existing bricks.
+
+        Only bricks from the spatial index that are near the new brick are
+        compared, so this stays cheap as the wall grows.
+        """
+        head_joint = self.config["joints"]["head_joint"]
+        for row in self._index.candidates(
+            brick.position.x - head_joint,
+            brick.position.x + brick.length + head_joint,
+            brick.position.y,
+            brick.position.y + brick.height,
+        ):
+            existing_brick = self.bricks[row]
             if self._bricks_overlap(brick, existing_brick):
                 # print(f"Brick {brick.id}, {brick.position.x}, {brick.position.y} overlaps with {existing_brick.id}, {existing_brick.position.x}, {existing_brick.position.y}")
                 return False
@@ -94,12 +270,14 @@ class Wall:
 
     def _bricks_overlap(self, brick1: Brick, brick2: Brick) -> bool:
         """Check if two bricks overlap (accounting for joints)"""
-        head_joint = self.config["joints"]["head_joint"]
+        head_joint = self._head_joint
+        position1 = brick1.position
+        position2 = brick2.position
         return not (
-            brick1.position.x + brick1.length + head_joint <= brick2.position.x
-            or brick2.position.x + brick2.length + head_joint <= brick1.position.x
-            or brick1.position.y + brick1.height <= brick2.position.y
-            or brick2.position.y + brick2.height <= brick1.position.y
+            brick1.right + head_joint <= position2.x
+            or brick2.right + head_joint <= position1.x
+            or brick1.top <= position2.y
+            or brick2.top <= position1.y
         )
 
     @property
@@ -116,17 +294,93 @@ class Wall:
 
     @property
     def built_bricks(self) -> list[Brick]:
+        if self.store is not None:
+            return [
+                self.store[row] for row in self.store.rows_in_state(BrickState.BUILT)
+            ]
         return [b for b in self.bricks if b.state == BrickState.BUILT]
 
     @property
     def unbuilt_bricks(self) -> list[Brick]:
+        if self.store is not None:
+            return [
+                self.store[row] for row in self.store.rows_in_state(BrickState.PLANNED)
+            ]
         return [b for b in self.bricks if b.state == BrickState.PLANNED]
 
+    @property
+    def built_count(self) -> int:
+        return self._built_count
+
+    @property
+    def planned_count(self) -> int:
+        return len(self.bricks) - self._built_count
+
     @property
     def completion_percentage(self) -> float:
         if not self.bricks:
             return 0.0
-        return len(self.built_bricks) / len(self.bricks) * 100
+        return self._built_count / len(self.bricks) * 100
+
+    def course_progress(self, course: int) -> tuple[int, int]:
+        """(built, total) bricks in a course"""
+        return (
+            self._built_by_course.get(course, 0),
+            len(self._index.rows_in_course(course)),
+        )
+
+    def stride_progress(self, stride: Stride) -> tuple[int, int]:
+        """(built, total) bricks in a stride"""
+        return self._built_by_stride.get(stride.id, 0), stride.brick_count
+
+    def set_brick_state(self, brick: Brick, state: BrickState) -> None:
+        """Change a brick's state and update the progress counters.
+
+        Build progress is only tracked for state changes made through the
+        wall, so callers should not assign ``brick.state`` directly.
+        """
+        if brick.state == state:
+            return
+        brick.state = state
+        self._count_built(brick, 1 if state == BrickState.BUILT else -1)
+        if self._state_changes is not None:
+            self._state_changes.append(brick)
+
+    def set_all_brick_states(self, state: BrickState) -> None:
+        """Move every brick to the same state (build all / reset)"""
+        if self.store is not None:
+            self.store.set_all_states(state)
+        else:
+            for brick in self.bricks:
+                brick.state = state
+
+        self._built_by_course.clear()
+        self._built_by_stride.clear()
+        self._built_count = 0
+        self._state_changes = None
+        if state == BrickState.BUILT:
+            for brick in self.bricks:
+                self._count_built(brick, 1)
+
+    def take_state_changes(self) -> list[Brick] | None:
+        """Bricks whose state changed since the previous call, in order.
+
+        None means any brick may have changed (the first call, bricks added,
+        set_all_brick_states), so the caller should look at all of them.
+        Changes are only recorded once this has been called.
+        """
+        changes = self._state_changes
+        self._state_changes = []
+        return changes
+
+    def _count_built(self, brick: Brick, delta: int) -> None:
+        self._built_count += delta
+        course = self.get_course(brick)
+        self._built_by_course[course] = self._built_by_course.get(course, 0) + delta
+        if brick.stride_id is not None:
+            self._built_by_stride[brick.stride_id] = (
+                self._built_by_stride.get(brick.stride_id, 0) + delta
+            )
 
     def validate_wall_integrity(self) -> bool:
         """Validate the completed wall for proper construction"""
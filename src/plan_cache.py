@@ -0,0 +1,169 @@
+"""
+On-disk cache of generated walls and build plans.
+
+A plan (the bond's bricks, the strides and the movements) is stored as one
+compressed ``.npz`` file of flat NumPy arrays, keyed by a hash of the wall config, bond
+type, algorithm pipeline and the source code of the package, so any change
+to one of them misses the cache instead of loading a stale plan.
+"""
+
+from .configs.config import Config
+from .models.brick import Brick
+from .models.common import Position, Movement
+from .models.stride import StrideManager, Stride
+from functools import cache
+from pathlib import Path
+import hashlib
+import json
+import os
+import zipfile
+import numpy as np
+
+CACHE_DIR = Path(".plan_cache")
+PACKAGE_DIR = Path(__file__).parent
+FORMAT_VERSION = 1
+# Arrays every plan file holds, a file missing one is treated as a miss
+PLAN_ARRAYS = (
+    "brick_ids",
+    "brick_x",
+    "brick_y",
+    "brick_types",
+    "brick_type_codes",
+    "stride_positions",
+    "stride_sizes",
+    "stride_rows",
+    "stride_arm_times",
+    "movements",
+)
+
+
+@cache
+def code_version() -> str:
+    """Hash of every source file the plan depends on (tests and benches excluded)"""
+    digest = hashlib.sha256()
+    for path in sorted(PACKAGE_DIR.rglob("*.py")):
+        relative = path.relative_to(PACKAGE_DIR)
+        if relative.parts[0] in ("tests", "bench"):
+            continue
+        digest.update(str(relative).encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+class PlanCache:
+    def __init__(self, directory: Path = CACHE_DIR) -> None:
+        self.directory = directory
+
+    def key(self, config: Config, bond_type: str, algorithm: str) -> str:
+        payload = json.dumps(
+            {
+                "format": FORMAT_VERSION,
+                "config": config,
+                "bond": bond_type,
+                "algorithm": algorithm,
+                "code": code_version(),
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+    def path(self, key: str) -> Path:
+        return self.directory / f"{key}.npz"
+
+    def save(
+        self,
+        key: str,
+        bricks: list[Brick],
+        strides: list[Stride],
+        movements: list[Movement],
+    ) -> Path:
+        types = sorted({b.brick_type for b in bricks})
+        type_code = {name: code for code, name in enumerate(types)}
+        row_of = {id(b): row for row, b in enumerate(bricks)}
+        arm_times = [s.arm_time for s in strides]
+
+        arrays = {
+            "brick_ids": np.fromiter((b.id for b in bricks), np.int64, len(bricks)),
+            "brick_x": np.fromiter((b.position.x for b in bricks), float, len(bricks)),
+            "brick_y": np.fromiter((b.position.y for b in bricks), float, len(bricks)),
+            "brick_types": np.array(types, dtype=str),
+            "brick_type_codes": np.fromiter(
+                (type_code[b.brick_type] for b in bricks), np.int16, len(bricks)
+            ),
+            "stride_positions": np.array(
+                [(s.robot_position.x, s.robot_position.y) for s in strides], float
+            ).reshape(-1, 2),
+            "stride_sizes": np.array([len(s.bricks) for s in strides], np.int64),
+            "stride_rows": np.array(
+                [row_of[id(b)] for s in strides for b in s.bricks], np.int64
+            ),
+            "stride_arm_times": np.array(
+                [np.nan if t is None else t for t in arm_times], float
+            ),
+            "movements": np.array(
+                [
+                    (m.from_pos.x, m.from_pos.y, m.to_pos.x, m.to_pos.y)
+                    for m in movements
+                ],
+                float,
+            ).reshape(-1, 4),
+        }
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.path(key)
+        # Write then rename, so a crash never leaves a truncated plan behind
+        partial = path.with_suffix(".partial.npz")
+        np.savez_compressed(partial, **arrays)
+        os.replace(partial, path)
+        return path
+
+    def load(
+        self, key: str, stride_manager: StrideManager
+    ) -> tuple[list[Brick], list[Stride], list[Movement]] | None:
+        """Cached (bricks, strides, movements), or None on a miss.
+
+        Strides are re-created through ``stride_manager`` so they get its ids
+        and colours.
+        """
+        path = self.path(key)
+        if not path.exists():
+            return None
+        try:
+            with np.load(path) as data:
+                if not set(PLAN_ARRAYS) <= set(data.files):
+                    return None
+                arrays = {name: data[name] for name in PLAN_ARRAYS}
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            return None
+
+        types = arrays["brick_types"].tolist()
+        bricks = [
+            Brick(id=brick_id, brick_type=types[code], position=Position(x, y))
+            for brick_id, code, x, y in zip(
+                arrays["brick_ids"].tolist(),
+                arrays["brick_type_codes"].tolist(),
+                arrays["brick_x"].tolist(),
+                arrays["brick_y"].tolist(),
+            )
+        ]
+
+        strides: list[Stride] = []
+        rows = arrays["stride_rows"].tolist()
+        start = 0
+        for (x, y), size, arm_time in zip(
+            arrays["stride_positions"].tolist(),
+            arrays["stride_sizes"].tolist(),
+            arrays["stride_arm_times"].tolist(),
+        ):
+            stride = stride_manager.create_stride(Position(x, y))
+            for row in rows[start : start + size]:
+                stride.add_brick(bricks[row])
+            stride.arm_time = None if np.isnan(arm_time) else arm_time
+            strides.append(stride)
+            start += size
+
+        movements = [
+            Movement(Position(x0, y0), Position(x1, y1))
+            for x0, y0, x1, y1 in arrays["movements"].tolist()
+        ]
+        return bricks, strides, movements
@@ -0,0 +1,68 @@
+"""
+Bond calculators and build algorithms by name.
+
+Entries are ``"module:attribute"`` paths relative to this package and are
+only imported when looked up, so choosing one algorithm doesn't pay for
+importing every other bond and planner.
+"""
+
+from importlib import import_module
+from typing import Any
+
+BOND_CALCULATORS = {
+    "stretcher": ".bonds.stretcher_bond:calculate_stretcher_bond",
+    "english_cross": ".bonds.english_cross_bond:calculate_english_cross_bond",
+    "flemish": ".bonds.flemish_bond:calculate_flemish_bond",
+    "wild": ".bonds.wild_bond:calculate_wild_bond",
+}
+
+# Generator variants yielding one course of bricks at a time
+BOND_COURSES = {
+    "stretcher": ".bonds.stretcher_bond:iter_stretcher_courses",
+    "english_cross": ".bonds.english_cross_bond:iter_english_cross_courses",
+    "flemish": ".bonds.flemish_bond:iter_flemish_courses",
+    "wild": ".bonds.wild_bond:iter_wild_courses",
+}
+
+ALGORITHMS = {
+    "naive_build": ".algos.naive_build:naive_build_algorithm",
+    "naive_build_vectorized": ".algos.vectorized_naive_build:vectorized_naive_build_algorithm",
+    "min_stride": ".algos.min_stride_build:min_stride_build_algorithm",
+}
+
+
+def _load(path: str) -> Any:
+    module, _, attribute = path.partition(":")
+    return getattr(import_module(module, __package__), attribute)
+
+
+def get_bond_calculator(bond_type: str):
+    if bond_type not in BOND_CALCULATORS:
+        available = ", ".join(BOND_CALCULATORS.keys())
+        raise ValueError(f"Unknown bond type '{bond_type}'. Available: {available}")
+
+    return _load(BOND_CALCULATORS[bond_type])
+
+
+def get_bond_courses(bond_type: str):
+    if bond_type not in BOND_COURSES:
+        available = ", ".join(BOND_COURSES.keys())
+        raise ValueError(f"Unknown bond type '{bond_type}'. Available: {available}")
+
+    return _load(BOND_COURSES[bond_type])
+
+
+def get_algorithm(algo_name: str):
+    if algo_name not in ALGORITHMS:
+        available = ", ".join(ALGORITHMS.keys())
+        raise ValueError(f"Unknown algorithm '{algo_name}'. Available: {available}")
+
+    return _load(ALGORITHMS[algo_name])
+
+
+def bond_type_for_wall(wall_name: str) -> str:
+    """Bond type of a wall config, from its name (stretcher by default)"""
+    for bond_type in ("english_cross", "flemish", "stretcher", "wild"):
+        if bond_type in wall_name:
+            return bond_type
+    return "stretcher"
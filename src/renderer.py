@@ -1,7 +1,7 @@
 from .models.wall import Wall
 from .models.brick import Brick, BrickState
 from .models.robot import Robot
-from .models.stride import StrideManager, Stride
+from .models.stride import StrideManager
 from .configs.config import Config
 import pygame
 
@@ -40,6 +40,14 @@ class PygameRenderer:
         self.font = pygame.font.Font(None, 24)
         self.small_font = pygame.font.Font(None, 16)
 
+        # What the screen currently shows, see render_wall
+        self._frame: tuple[Wall, StrideManager | None, bool] | None = None
+        self._stale = True
+        self._stride_colors: dict[int, tuple[int, int, int]] = {}
+        # Wall, grid and every brick as planned, see _get_static_layer
+        self._static_layer: pygame.Surface | None = None
+        self._static_key: tuple[Wall, int, bool] | None = None
+
         self._calculate_layout()
 
     def _calculate_layout(self):
@@ -74,6 +82,13 @@ class PygameRenderer:
         # Info panel positioning (bottom)
         self.info_x = base_margin
         self.info_y = self.window_height - info_panel_height + 10
+        # Left of the legend, which may run down past info_y
+        self.info_rect = pygame.Rect(
+            0, self.info_y, self.legend_x, self.window_height - self.info_y
+        )
+
+        self._stale = True
+        self._static_layer = None
 
     def mm_to_px(self, mm: float) -> int:
         return int(mm * self.scale)
@@ -84,43 +99,103 @@ class PygameRenderer:
         robot: Robot | None = None,
         stride_manager: StrideManager | None = None,
     ):
+        """
+        Draw a frame of the wall.
+
+        Only the bricks whose state changed since the previous frame and the
+        info panel are redrawn and pushed with ``pygame.display.update``;
+        the whole window is redrawn on the first frame, after a resize or a
+        bulk state change, and when the debug mode or the strides shown
+        change. Planned bricks come from the static layer, so only built
+        bricks are ever drawn per frame.
+        """
+        changes = wall.take_state_changes()
+        frame = (wall, stride_manager, self.debug_mode)
+        if changes is None or self._stale or frame != self._frame:
+            self._frame = frame
+            self._stale = False
+            self._stride_colors = self._map_stride_colors(stride_manager)
+            self._draw_frame(wall, stride_manager)
+            self._draw_info_panel(wall, robot)
+            pygame.display.flip()
+            return
+
+        static_layer = self._get_static_layer(wall)
+        dirty = []
+        for brick in changes:
+            if brick.state == BrickState.BUILT:
+                area = self._draw_brick(
+                    self.screen, brick, self._stride_colors.get(brick.id)
+                )
+            else:
+                area = self._brick_area(brick)
+                self.screen.blit(static_layer, area, area)
+            dirty.append(area)
+        dirty.append(self._draw_info_panel(wall, robot))
+        pygame.display.update(dirty)
+
+    def resize(self, width: int, height: int):
+        self.window_width = width
+        self.window_height = height
+        self.screen = pygame.display.set_mode(
+            (self.window_width, self.window_height), pygame.RESIZABLE
+        )
+        self._calculate_layout()
+
+    def _draw_frame(self, wall: Wall, stride_manager: StrideManager | None):
+        self.screen.blit(self._get_static_layer(wall), (0, 0))
 
-        self.screen.fill(self.COLORS["background"])
+        stride_colors = self._stride_colors
+        for brick in wall.built_bricks:
+            self._draw_brick(self.screen, brick, stride_colors.get(brick.id))
+
+        if stride_manager:
+            self._draw_stride_legend(stride_manager)
+
+    def _get_static_layer(self, wall: Wall) -> pygame.Surface:
+        """
+        The window as it looks with every brick planned.
+
+        Rasterised once per layout and reused until the window is resized,
+        the debug mode changes or bricks are added to the wall.
+        """
+        key = (wall, wall.total_bricks, self.debug_mode)
+        if self._static_layer is not None and key == self._static_key:
+            return self._static_layer
+
+        layer = self.screen.copy()
+        layer.fill(self.COLORS["background"])
 
         wall_rect = pygame.Rect(
             self.wall_x, self.wall_y, self.wall_width_px, self.wall_height_px
         )
-        pygame.draw.rect(self.screen, self.COLORS["wall_background"], wall_rect)
-        pygame.draw.rect(self.screen, self.COLORS["brick_outline"], wall_rect, 2)
+        pygame.draw.rect(layer, self.COLORS["wall_background"], wall_rect)
+        pygame.draw.rect(layer, self.COLORS["brick_outline"], wall_rect, 2)
 
         if self.debug_mode:
-            self._draw_grid()
+            self._draw_grid(layer)
 
-        brick_to_stride: dict[int, Stride] = {}
+        for _, course_bricks in wall.iter_courses():
+            for brick in course_bricks:
+                self._draw_brick(layer, brick, planned=True)
+
+        self._static_layer = layer
+        self._static_key = key
+        return layer
+
+    @staticmethod
+    def _map_stride_colors(
+        stride_manager: StrideManager | None,
+    ) -> dict[int, tuple[int, int, int]]:
+        """brick id -> color of the stride it is laid in"""
+        brick_to_color: dict[int, tuple[int, int, int]] = {}
         if stride_manager:
             for stride in stride_manager.strides:
                 for brick in stride.bricks:
-                    brick_to_stride[brick.id] = stride
-
-        for course in range(wall.num_courses):
-            course_bricks = wall.get_bricks_in_course(course)
-            for brick in course_bricks:
-                stride_color = None
-                if brick.id in brick_to_stride:
-                    stride = brick_to_stride[brick.id]
-                    stride_color = stride.color
-                self._draw_brick(brick, stride_color)
-
-        if stride_manager:
-            self._draw_stride_legend(stride_manager)
-
-        self._draw_info_panel(wall, robot)
-        pygame.display.flip()
-
-    def _draw_brick(
-        self, brick: Brick, stride_color: tuple[int, int, int] | None = None
-    ):
+                    brick_to_color[brick.id] = stride.color
+        return brick_to_color
 
+    def _brick_rect(self, brick: Brick) -> pygame.Rect:
         brick_config = self.config["bricks"][brick.brick_type]
 
         # Calculate course number for positioning
@@ -140,29 +215,50 @@ class PygameRenderer:
         length_px = self.mm_to_px(brick_config["length"])
         height_px = self.mm_to_px(brick_config["height"])
 
-        brick_rect = pygame.Rect(x_px, y_px, length_px, height_px)
+        return pygame.Rect(x_px, y_px, length_px, height_px)
+
+    def _brick_area(self, brick: Brick) -> pygame.Rect:
+        """Screen area a brick covers, its debug label included"""
+        brick_rect = self._brick_rect(brick)
+        if self.debug_mode and brick_rect.width > 15:
+            text_rect = pygame.Rect((0, 0), self.small_font.size(str(brick.id)))
+            text_rect.center = brick_rect.center
+            return brick_rect.union(text_rect)
+        return brick_rect
 
-        if stride_color and brick.state == BrickState.BUILT:
+    def _draw_brick(
+        self,
+        surface: pygame.Surface,
+        brick: Brick,
+        stride_color: tuple[int, int, int] | None = None,
+        planned: bool = False,
+    ) -> pygame.Rect:
+        """Draw one brick (as planned if ``planned``), returns the area it covers"""
+        brick_rect = self._brick_rect(brick)
+
+        if planned or brick.state != BrickState.BUILT:
+            color = self.COLORS["planned_brick"]
+        elif stride_color:
             color = stride_color
-        elif brick.state == BrickState.BUILT:
-            color = self.COLORS["built_brick"]
         else:
-            color = self.COLORS["planned_brick"]
+            color = self.COLORS["built_brick"]
 
-        pygame.draw.rect(self.screen, color, brick_rect)
-        pygame.draw.rect(self.screen, self.COLORS["brick_outline"], brick_rect, 1)
+        pygame.draw.rect(surface, color, brick_rect)
+        pygame.draw.rect(surface, self.COLORS["brick_outline"], brick_rect, 1)
 
-        if self.debug_mode and length_px > 15:
+        if self.debug_mode and brick_rect.width > 15:
             text = self.small_font.render(str(brick.id), True, self.COLORS["text"])
             text_rect = text.get_rect(center=brick_rect.center)
-            self.screen.blit(text, text_rect)
+            surface.blit(text, text_rect)
+            return brick_rect.union(text_rect)
+        return brick_rect
 
-    def _draw_grid(self):
+    def _draw_grid(self, surface: pygame.Surface):
         # Vertical lines every 100mm
         for x_mm in range(0, int(self.config["wall"]["width"]), 100):
             x_px = self.wall_x + self.mm_to_px(x_mm)
             pygame.draw.line(
-                self.screen,
+                surface,
                 self.COLORS["grid"],
                 (x_px, self.wall_y),
                 (x_px, self.wall_y + self.wall_height_px),
@@ -176,7 +272,7 @@ class PygameRenderer:
             y_mm = course * course_height
             y_px = self.wall_y + self.wall_height_px - self.mm_to_px(y_mm)
             pygame.draw.line(
-                self.screen,
+                surface,
                 self.COLORS["grid"],
                 (self.wall_x, y_px),
                 (self.wall_x + self.wall_width_px, y_px),
@@ -198,12 +294,15 @@ class PygameRenderer:
             )
             self.screen.blit(text, (self.legend_x + 20, y))
 
-    def _draw_info_panel(self, wall: Wall, robot: Robot | None = None):
+    def _draw_info_panel(self, wall: Wall, robot: Robot | None = None) -> pygame.Rect:
+        """Clear and draw the info panel, returns its screen area"""
+        self.screen.fill(self.COLORS["background"], self.info_rect)
+
         wall_info = f"Wall: {wall.width:.0f}mm × {wall.height:.0f}mm ({wall.num_courses} courses)"
         text = self.font.render(wall_info, True, self.COLORS["text"])
         self.screen.blit(text, (self.info_x, self.info_y))
 
-        brick_info = f"Bricks: {len(wall.built_bricks)}/{wall.total_bricks} ({wall.completion_percentage:.1f}%)"
+        brick_info = f"Bricks: {wall.built_count}/{wall.total_bricks} ({wall.completion_percentage:.1f}%)"
         text = self.font.render(brick_info, True, self.COLORS["text"])
         self.screen.blit(text, (self.info_x, self.info_y + 25))
 
@@ -216,6 +315,7 @@ class PygameRenderer:
         text = self.small_font.render(scale_info, True, self.COLORS["text"])
         scale_y = self.info_y + 75 if robot else self.info_y + 50
         self.screen.blit(text, (self.info_x, scale_y))
+        return self.info_rect
 
     def handle_events(self) -> bool:
         for event in pygame.event.get():
@@ -227,12 +327,7 @@ class PygameRenderer:
                 elif event.key == pygame.K_d:
                     self.debug_mode = not self.debug_mode
             elif event.type == pygame.VIDEORESIZE:
-                self.window_width = event.w
-                self.window_height = event.h
-                self.screen = pygame.display.set_mode(
-                    (self.window_width, self.window_height), pygame.RESIZABLE
-                )
-                self._calculate_layout()
+                self.resize(event.w, event.h)
         return True
 
     def cleanup(self):
@@ -0,0 +1,165 @@
+from .models.wall import Wall
+from .models.brick import Brick, BrickState
+from .models.robot import Robot
+from .models.stride import Stride
+from dataclasses import dataclass
+
+
+@dataclass
+class BuildEvent:
+    """What a single simulator action did"""
+
+    brick: Brick | None = None
+    completed_stride: int | None = None  # index into the plan's strides
+    moved_to_stride: int | None = None
+    finished: bool = False
+
+
+class BuildSimulator:
+    """
+    Build state of a wall being laid, with no display attached.
+
+    Manual mode lays bricks in wall order; robot mode follows the plan's
+    strides, moving the robot to each stride's position once the previous
+    stride is complete. The pygame front-end drives it from key presses and
+    ``tick()`` once per frame; headless callers can call ``run_to_end()``
+    and run at full CPU speed.
+    """
+
+    def __init__(
+        self,
+        wall: Wall,
+        robot: Robot,
+        strides: list[Stride],
+        auto_play_delay: int = 30,
+    ) -> None:
+        self.wall = wall
+        self.robot = robot
+        self.strides = strides
+        self.auto_play_delay = auto_play_delay  # frames between auto-play bricks
+
+        self.robot_mode = False
+        self.auto_play = False
+        self.auto_play_timer = 0
+        self.brick_index = 0
+        self.stride_index = 0
+        self.brick_in_stride = 0
+
+    @property
+    def current_stride(self) -> Stride | None:
+        if self.stride_index < len(self.strides):
+            return self.strides[self.stride_index]
+        return None
+
+    @property
+    def done(self) -> bool:
+        if self.robot_mode:
+            return self.stride_index >= len(self.strides)
+        return self.brick_index >= self.wall.total_bricks
+
+    def toggle_mode(self) -> None:
+        """Switch between manual and robot mode, stopping auto-play"""
+        self.robot_mode = not self.robot_mode
+        self.auto_play = False
+        if self.robot_mode:
+            self._move_to_current_stride()
+
+    def toggle_auto_play(self) -> None:
+        self.auto_play = not self.auto_play
+
+    def step(self) -> BuildEvent:
+        """Lay the next brick of the current mode"""
+        if self.robot_mode:
+            return self._step_stride()
+
+        if self.brick_index >= self.wall.total_bricks:
+            return BuildEvent()
+        brick = self.wall.bricks[self.brick_index]
+        self.wall.set_brick_state(brick, BrickState.BUILT)
+        self.brick_index += 1
+        return BuildEvent(brick=brick, finished=self.done)
+
+    def complete_stride(self) -> BuildEvent:
+        """Lay the rest of the current stride and move on to the next one"""
+        stride = self.current_stride
+        if stride is None:
+            return BuildEvent()
+        for brick in stride.bricks[self.brick_in_stride :]:
+            self.wall.set_brick_state(brick, BrickState.BUILT)
+        return self._next_stride()
+
+    def build_all(self) -> int:
+        """Manual mode: lay every remaining brick, returns how many"""
+        remaining = self.wall.planned_count
+        if remaining > 0:
+            self.wall.set_all_brick_states(BrickState.BUILT)
+            self.brick_index = self.wall.total_bricks
+        return remaining
+
+    def run_to_end(self) -> int:
+        """Lay bricks one by one until the current mode is done, returns how many"""
+        built = 0
+        while not self.done:
+            if self.step().brick is not None:
+                built += 1
+        return built
+
+    def tick(self) -> BuildEvent:
+        """Advance auto-play by one frame, laying a brick every auto_play_delay"""
+        if not (self.auto_play and self.robot_mode):
+            return BuildEvent()
+        self.auto_play_timer += 1
+        if self.auto_play_timer < self.auto_play_delay:
+            return BuildEvent()
+        self.auto_play_timer = 0
+
+        event = self._step_stride()
+        if event.finished:
+            self.auto_play = False
+        return event
+
+    def reset(self) -> None:
+        """All bricks back to planned, robot to the origin"""
+        self.wall.set_all_brick_states(BrickState.PLANNED)
+        self.brick_index = 0
+        self.stride_index = 0
+        self.brick_in_stride = 0
+        self.robot.position.x = 0
+        self.robot.position.y = 0
+        self.auto_play = False
+
+    def _step_stride(self) -> BuildEvent:
+        stride = self.current_stride
+        if stride is None:
+            return BuildEvent()
+        if self.brick_in_stride >= len(stride.bricks):
+            # Empty stride, nothing to lay here
+            return self._next_stride()
+
+        brick = stride.bricks[self.brick_in_stride]
+        self.wall.set_brick_state(brick, BrickState.BUILT)
+        self.brick_in_stride += 1
+        if self.brick_in_stride < len(stride.bricks):
+            return BuildEvent(brick=brick)
+
+        event = self._next_stride()
+        event.brick = brick
+        return event
+
+    def _next_stride(self) -> BuildEvent:
+        event = BuildEvent(completed_stride=self.stride_index)
+        self.stride_index += 1
+        self.brick_in_stride = 0
+        if self._move_to_current_stride():
+            event.moved_to_stride = self.stride_index
+        else:
+            event.finished = True
+        return event
+
+    def _move_to_current_stride(self) -> bool:
+        stride = self.current_stride
+        if stride is None:
+            return False
+        self.robot.position.x = stride.robot_position.x
+        self.robot.position.y = stride.robot_position.y
+        return True
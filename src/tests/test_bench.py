@@ -0,0 +1,45 @@
+from ..bench.__main__ import BenchResult, run_all, run_case, wall_cases, write_report
+from ..configs.config import load_wall_config
+from ..registry import ALGORITHMS, bond_type_for_wall
+from pathlib import Path
+import csv
+import json
+
+
+def test_wall_cases_cover_configs_and_scaled_walls() -> None:
+    names = [name for name, _ in wall_cases([2_000])]
+    assert "stretcher_bond_wall" in names and "wild_bond_wall" in names
+    assert names[-1] == "stretcher_bond_wall_x2000"
+    assert bond_type_for_wall("english_cross_bond_wall") == "english_cross"
+    assert bond_type_for_wall("test_small_wall") == "stretcher"
+
+
+def test_run_case_times_every_stage() -> None:
+    result = run_case(
+        "flemish_bond_wall", load_wall_config("flemish_bond_wall"), "naive_build"
+    )
+    assert result.error == ""
+    assert result.bond == "flemish"
+    assert result.bricks > 0 and result.layout_issues == 0
+    assert result.strides == 6 and result.movements == 5
+    assert result.travel_s > 0
+    assert min(result.bond_s, result.validation_s, result.planning_s) > 0
+
+    config = load_wall_config("stretcher_bond_wall")
+    failed = run_case("stretcher_bond_wall", config, "no_such_algo")
+    assert "Unknown algorithm" in failed.error
+
+
+def test_run_all_writes_report(tmp_path: Path) -> None:
+    cases = [("test_small_wall", load_wall_config("test_small_wall"))]
+    results = run_all(cases, list(ALGORITHMS), workers=2)
+    assert [r.algorithm for r in results] == list(ALGORITHMS)
+    assert all(isinstance(r, BenchResult) and not r.error for r in results)
+
+    json_path, csv_path = write_report(results, tmp_path / "report")
+    assert [r["strides"] for r in json.loads(json_path.read_text())] == [
+        r.strides for r in results
+    ]
+    with open(csv_path) as file:
+        rows = list(csv.DictReader(file))
+    assert [row["algorithm"] for row in rows] == list(ALGORITHMS)
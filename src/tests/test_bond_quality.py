@@ -0,0 +1,82 @@
+from ..models.bond_quality import analyze_bond, analyze_perpends
+from ..models.wall import Wall
+from ..models.brick import Brick
+from ..configs.config import load_wall_config
+from ..bonds.wild_bond import calculate_wild_bond
+from ..registry import get_bond_calculator, bond_type_for_wall
+import random
+import numpy as np
+import pytest
+
+
+def build_wall(wall_name: str) -> Wall:
+    config = load_wall_config(wall_name)
+    Brick.configure(config)
+    wall = Wall(config)
+    wall.add_bricks(get_bond_calculator(bond_type_for_wall(wall_name))(wall, config))
+    return wall
+
+
+@pytest.mark.parametrize(
+    "wall_name, min_lap",
+    [
+        ("stretcher_bond_wall", 110),
+        ("flemish_bond_wall", 55),
+        ("english_cross_bond_wall", 55),
+        ("wild_bond_wall", 55),
+    ],
+)
+def test_shipped_bonds(wall_name: str, min_lap: float) -> None:
+    wall = build_wall(wall_name)
+    quality = analyze_bond(wall)
+
+    courses = sum(1 for _ in wall.iter_courses())
+    assert len(quality) == wall.total_bricks - courses
+    assert quality.min_lap == min_lap
+    assert quality.aligned_joints == 0
+    assert quality.long_step_runs == 0
+
+    bricks = wall.get_bricks_in_course(1)
+    assert quality.perpends(1).tolist() == [b.right for b in bricks[:-1]]
+
+
+def test_matches_brute_force() -> None:
+    config = load_wall_config("wild_bond_wall")
+    config["wall"]["width"] = 5000
+    Brick.configure(config)
+    wall = Wall(config)
+    wall.add_bricks(calculate_wild_bond(wall, config, random.Random(3)))
+    quality = analyze_bond(wall, max_step=55)
+
+    perpends = [
+        [b.right for b in bricks[:-1]] for _, bricks in wall.iter_courses()
+    ]
+    laps = [
+        min((abs(x - y) for y in perpends[c - 1]), default=np.inf) if c else np.inf
+        for c, course in enumerate(perpends)
+        for x in course
+    ]
+    assert quality.laps.tolist() == laps
+    assert quality.aligned_joints == sum(lap < 1 for lap in laps) > 0
+    assert quality.long_step_runs > 0
+
+
+def test_step_runs() -> None:
+    # One perpend stepping right by 50 for five courses, next to a fixed one
+    course = [0, 1, 2, 3, 4, 5] + [0, 1, 2, 3, 4, 5]
+    x = [100, 150, 200, 250, 300, 350] + [1000] * 6
+    quality = analyze_perpends(course, x, max_step=55, max_steps=4)
+
+    assert quality.right_runs[quality.x < 1000].tolist() == [0, 1, 2, 3, 4, 5]
+    assert quality.longest_step_run == 5
+    assert quality.long_step_runs == 1
+    assert quality.aligned_joints == 5
+    assert quality.min_lap == 0
+
+
+def test_empty_wall() -> None:
+    config = load_wall_config("stretcher_bond_wall")
+    quality = analyze_bond(Wall(config))
+    assert len(quality) == 0
+    assert quality.min_lap == np.inf
+    assert quality.longest_step_run == 0
@@ -0,0 +1,79 @@
+from ..algos.naive_build import naive_build_algorithm
+from ..algos.brick_sequencing import sequence_bricks, sequenced, stride_arm_time
+from ..models.wall import Wall
+from ..models.robot import Robot
+from ..models.brick import Brick
+from ..models.common import Position
+from ..models.stride import StrideManager
+from ..models.support import SupportGraph
+from ..models.travel import ArmCostModel
+from ..configs.config import load_wall_config, Config
+from ..bonds.flemish_bond import calculate_flemish_bond
+import pytest
+
+
+@pytest.fixture
+def test_config() -> Config:
+    return load_wall_config("flemish_bond_wall")
+
+
+@pytest.fixture
+def wall(test_config: Config) -> Wall:
+    wall = Wall(test_config)
+    Brick.configure(test_config)
+    wall.add_bricks(calculate_flemish_bond(wall, test_config))
+    return wall
+
+
+def test_arm_cost_model(test_config: Config) -> None:
+    model = ArmCostModel(pickup_x=-100, pickup_y=50, speed=100, place_time=2)
+    assert model.pickup(Position(400, 0)) == Position(300, 50)
+    assert model.cost(Position(0, 0), Position(300, 400)) == 5
+
+    assert ArmCostModel.from_config(test_config) == ArmCostModel()
+    test_config["arm"] = {"speed": 500.0, "comment": "unknown keys"}
+    assert ArmCostModel.from_config(test_config).speed == 500.0
+
+
+def test_sequence_bricks_is_bottom_up_and_faster(
+    test_config: Config, wall: Wall
+) -> None:
+    strides, _ = naive_build_algorithm(
+        wall, Robot(test_config), StrideManager(), test_config
+    )
+    planned = {s.id: sorted(b.id for b in s.bricks) for s in strides}
+    model = ArmCostModel()
+
+    report = sequence_bricks(wall, strides, model)
+
+    graph = SupportGraph(wall)
+    assert report.bricks == wall.total_bricks
+    assert sum(report.after) < sum(report.before)
+    assert report.bricks_per_hour_after > report.bricks_per_hour_before
+    for stride, before, after in zip(strides, report.before, report.after):
+        assert sorted(b.id for b in stride.bricks) == planned[stride.id]
+        assert stride.arm_time == after == pytest.approx(stride_arm_time(stride, model))
+        assert after <= before
+
+        # Within a stride, supporters are laid before the bricks on them
+        step = {b.id: i for i, b in enumerate(stride.bricks)}
+        for brick in stride.bricks:
+            row = graph.rows_of([brick.id])[0]
+            for supporter in graph.supporters(row).tolist():
+                supporter_id = wall.bricks[supporter].id
+                if supporter_id in step:
+                    assert step[supporter_id] < step[brick.id]
+
+
+def test_sequenced_stage_keeps_plan(test_config: Config, wall: Wall) -> None:
+    planned, planned_movements = naive_build_algorithm(
+        wall, Robot(test_config), StrideManager(), test_config
+    )
+    strides, movements = sequenced(naive_build_algorithm)(
+        wall, Robot(test_config), StrideManager(), test_config
+    )
+    assert movements == planned_movements
+    assert [s.robot_position for s in strides] == [
+        s.robot_position for s in planned
+    ]
+    assert all(s.arm_time is not None for s in strides)
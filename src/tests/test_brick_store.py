@@ -0,0 +1,112 @@
+from ..algos.naive_build import naive_build_algorithm
+from ..models.wall import Wall
+from ..models.robot import Robot
+from ..models.brick import Brick, BrickState
+from ..models.brick_store import BrickStore
+from ..models.stride import StrideManager
+from ..configs.config import load_wall_config, Config
+from ..bonds.stretcher_bond import calculate_stretcher_bond
+import pytest
+
+
+@pytest.fixture
+def test_config() -> Config:
+    return load_wall_config("stretcher_bond_wall")
+
+
+def build_wall(config: Config, columnar: bool) -> Wall:
+    wall = Wall(config, columnar=columnar)
+    Brick.configure(config)
+    for brick in calculate_stretcher_bond(wall, config):
+        wall.add_brick(brick)
+    return wall
+
+
+def test_views_write_through(test_config: Config) -> None:
+    wall = build_wall(test_config, columnar=True)
+    assert isinstance(wall.bricks, BrickStore)
+
+    brick = wall.bricks[3]
+    assert brick.id == 3
+    assert brick.length == test_config["bricks"][brick.brick_type]["length"]
+
+    brick.state = BrickState.BUILT
+    brick.stride_id = 7
+    assert wall.bricks[3].state == BrickState.BUILT
+    assert wall.bricks[3].stride_id == 7
+    assert wall.bricks[4].stride_id is None
+    assert [b.id for b in wall.built_bricks] == [3]
+    assert len(wall.unbuilt_bricks) == wall.total_bricks - 1
+
+
+def test_columnar_queries_match_list_wall(test_config: Config) -> None:
+    list_wall = build_wall(test_config, columnar=False)
+    store_wall = build_wall(test_config, columnar=True)
+    assert store_wall.total_bricks == list_wall.total_bricks
+
+    for region in [(0, 0, 800, 1300), (500, 200, 1000, 400), (0, 0, 10, 10)]:
+        expected = [b.id for b in list_wall.get_bricks_in_region(*region)]
+        assert [b.id for b in store_wall.get_bricks_in_region(*region)] == expected
+
+    robot = Robot(test_config)
+    for x, y in [(400, 0), (1200, 650), (2020, 1300)]:
+        robot.position.x, robot.position.y = x, y
+        expected = [b.id for b in robot.get_reachable_bricks(list_wall)]
+        assert [b.id for b in robot.get_reachable_bricks(store_wall)] == expected
+
+
+def test_naive_build_on_columnar_wall(test_config: Config) -> None:
+    results = []
+    for columnar in (False, True):
+        wall = build_wall(test_config, columnar=columnar)
+        strides, movements = naive_build_algorithm(
+            wall, Robot(test_config), StrideManager(), test_config
+        )
+        results.append(
+            ([[b.id for b in s.bricks] for s in strides], [str(m) for m in movements])
+        )
+        assert all(b.stride_id is not None for b in wall.bricks)
+
+    assert results[0] == results[1]
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_point_location_matches_scan(test_config: Config, columnar: bool) -> None:
+    wall = build_wall(test_config, columnar=columnar)
+    xs = [x + 0.5 for x in range(-20, int(wall.width) + 20, 23) for _ in range(3)]
+    ys = [y for _ in range(-20, int(wall.width) + 20, 23) for y in (3.0, 61.0, 990.5)]
+
+    expected = []
+    for x, y in zip(xs, ys):
+        hits = [b.id for b in wall.bricks if b.contains_point(x, y)]
+        expected.append(hits[0] if hits else -1)
+        found = wall.get_brick_at_position(x, y)
+        assert (found.id if found else -1) == expected[-1]
+
+    assert wall.get_bricks_at_positions(xs, ys).tolist() == expected
+    assert max(expected) >= 0 and min(expected) == -1
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_region_queries_match_scan(test_config: Config, columnar: bool) -> None:
+    wall = build_wall(test_config, columnar=columnar)
+    regions = [
+        (x, y, w, h)
+        for x in (-100, 0, 333, 1750)
+        for y in (-10, 0, 260, 1500)
+        for w, h in ((800, 1300), (230, 70), (5000, 5000), (0, 0))
+    ]
+
+    batch = wall.get_bricks_in_regions(regions)
+    assert len(batch) == len(regions)
+    for (x, y, w, h), ids in zip(regions, batch):
+        expected = [
+            b.id
+            for b in wall.bricks
+            if x <= b.position.x
+            and y <= b.position.y
+            and b.position.x + b.length <= x + w
+            and b.position.y + b.height <= y + h
+        ]
+        assert [b.id for b in wall.get_bricks_in_region(x, y, w, h)] == expected
+        assert ids.tolist() == expected
@@ -0,0 +1,60 @@
+from ..algos.naive_build import naive_build_algorithm
+from ..algos.min_stride_build import min_stride_build_algorithm
+from ..models.wall import Wall
+from ..models.robot import Robot
+from ..models.brick import Brick
+from ..models.stride import StrideManager
+from ..configs.config import load_wall_config, Config
+from ..bonds.stretcher_bond import calculate_stretcher_bond
+from ..bonds.flemish_bond import calculate_flemish_bond
+from ..bonds.english_cross_bond import calculate_english_cross_bond
+from ..bonds.wild_bond import calculate_wild_bond
+from ..bench.synthetic import scaled_config
+from collections.abc import Callable
+import pytest
+
+
+def build_wall(
+    config: Config, bond_calculator: Callable[[Wall, Config], list[Brick]]
+) -> Wall:
+    wall = Wall(config)
+    Brick.configure(config)
+    wall.add_bricks(bond_calculator(wall, config))
+    return wall
+
+
+@pytest.mark.parametrize(
+    "config, bond_calculator",
+    [
+        (load_wall_config("test_small_wall"), calculate_stretcher_bond),
+        (load_wall_config("stretcher_bond_wall"), calculate_stretcher_bond),
+        (load_wall_config("flemish_bond_wall"), calculate_flemish_bond),
+        (load_wall_config("english_cross_bond_wall"), calculate_english_cross_bond),
+        (load_wall_config("wild_bond_wall"), calculate_wild_bond),
+        (
+            scaled_config(load_wall_config("stretcher_bond_wall"), 5_000),
+            calculate_stretcher_bond,
+        ),
+    ],
+)
+def test_min_stride_covers_wall_with_fewer_strides(
+    config: Config, bond_calculator: Callable[[Wall, Config], list[Brick]]
+) -> None:
+    naive_strides, _ = naive_build_algorithm(
+        build_wall(config, bond_calculator), Robot(config), StrideManager(), config
+    )
+
+    wall = build_wall(config, bond_calculator)
+    robot = Robot(config)
+    strides, movements = min_stride_build_algorithm(
+        wall, robot, StrideManager(), config
+    )
+
+    assert len(strides) <= len(naive_strides)
+    assert len(movements) <= len(strides)
+    planned = sorted(b.id for s in strides for b in s.bricks)
+    assert planned == sorted(b.id for b in wall.bricks)
+    for stride in strides:
+        robot.position = stride.robot_position
+        assert all(robot.can_reach_brick(b) for b in stride.bricks)
+        assert all(b.stride_id == stride.id for b in stride.bricks)
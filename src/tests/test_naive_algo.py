@@ -1,10 +1,15 @@
 from ..algos.naive_build import naive_build_algorithm
+from ..algos.vectorized_naive_build import vectorized_naive_build_algorithm
 from ..models.wall import Wall
 from ..models.robot import Robot
 from ..models.brick import Brick
 from ..models.stride import StrideManager
 from ..configs.config import load_wall_config, Config
 from ..bonds.stretcher_bond import calculate_stretcher_bond
+from ..bonds.flemish_bond import calculate_flemish_bond
+from ..bonds.english_cross_bond import calculate_english_cross_bond
+from ..bonds.wild_bond import calculate_wild_bond
+from collections.abc import Callable
 import pytest
 
 
@@ -71,3 +76,34 @@ def test_naive_build_algorithm_coverage(
         total_bricks_in_strides += len(stride.bricks)
 
     assert total_bricks_in_strides == len(wall_with_bricks.bricks)
+
+
+@pytest.mark.parametrize(
+    "wall_name, bond_calculator",
+    [
+        ("test_small_wall", calculate_stretcher_bond),
+        ("stretcher_bond_wall", calculate_stretcher_bond),
+        ("flemish_bond_wall", calculate_flemish_bond),
+        ("english_cross_bond_wall", calculate_english_cross_bond),
+        ("wild_bond_wall", calculate_wild_bond),
+    ],
+)
+def test_vectorized_naive_build_matches_naive_build(
+    wall_name: str, bond_calculator: Callable[[Wall, Config], list[Brick]]
+) -> None:
+    config = load_wall_config(wall_name)
+    results = []
+    for algorithm in (naive_build_algorithm, vectorized_naive_build_algorithm):
+        wall = Wall(config)
+        Brick.configure(config)
+        wall.add_bricks(bond_calculator(wall, config))
+        strides, movements = algorithm(wall, Robot(config), StrideManager(), config)
+        results.append(
+            (
+                [(s.id, s.robot_position, [b.id for b in s.bricks]) for s in strides],
+                movements,
+                [b.stride_id for b in wall.bricks],
+            )
+        )
+
+    assert results[0] == results[1]
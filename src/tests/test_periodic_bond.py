@@ -0,0 +1,54 @@
+from ..bonds.periodic import CourseTemplate, PeriodicBond
+from ..bonds.flemish_bond import FLEMISH_BOND, calculate_flemish_bond
+from ..models.wall import Wall
+from ..models.brick import Brick
+from ..configs.config import load_wall_config, Config
+import pytest
+
+
+@pytest.fixture
+def test_config() -> Config:
+    config = load_wall_config("flemish_bond_wall")
+    Brick.configure(config)
+    return config
+
+
+def test_arrays_match_bricks(test_config: Config) -> None:
+    wall = Wall(test_config)
+    bricks = calculate_flemish_bond(wall, test_config)
+    compiled = FLEMISH_BOND.compile(test_config)
+    ids, xs, ys, codes = compiled.arrays()
+
+    assert compiled.period == 2
+    assert ids.tolist() == [b.id for b in bricks]
+    assert xs.tolist() == [b.position.x for b in bricks]
+    assert ys.tolist() == [b.position.y for b in bricks]
+    assert [compiled.types[c] for c in codes] == [b.brick_type for b in bricks]
+
+    courses = list(FLEMISH_BOND.iter_courses(wall, test_config))
+    assert len(courses) == compiled.num_courses
+    assert [b.id for course in courses for b in course] == ids.tolist()
+
+
+def test_bond_declared_as_data(test_config: Config) -> None:
+    """A new periodic bond is only templates; edges follow the template rules"""
+    header_bond = PeriodicBond(
+        "header",
+        (
+            CourseTemplate(repeat=("half",), fill=("quarter",)),
+            CourseTemplate(start=("quarter",), repeat=("half",), end=("quarter",)),
+        ),
+    )
+    test_config["wall"]["width"] = 500
+    wall = Wall(test_config)
+    wall.add_bricks(header_bond.calculate(wall, test_config))
+
+    def course(number: int) -> list[tuple[str, float]]:
+        return [(b.brick_type, b.position.x) for b in wall.get_bricks_in_course(number)]
+
+    # 4 halves end at 430, leaving 70 for the fill quarter
+    assert course(0) == [("half", x) for x in (0, 110, 220, 330)] + [("quarter", 440)]
+    # a 4th half would leave no room for the end quarter
+    halves = [("half", x) for x in (55, 165, 275)]
+    assert course(1) == [("quarter", 0), *halves, ("quarter", 385)]
+    assert course(2) == course(0)
@@ -0,0 +1,82 @@
+from ..algos.naive_build import naive_build_algorithm
+from ..algos.brick_sequencing import sequenced
+from ..models.wall import Wall
+from ..models.robot import Robot
+from ..models.brick import Brick
+from ..models.stride import StrideManager
+from ..configs.config import load_wall_config, Config
+from ..bonds.wild_bond import calculate_wild_bond
+from ..plan_cache import PlanCache, code_version
+from pathlib import Path
+import copy
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def test_config() -> Config:
+    return load_wall_config("wild_bond_wall")
+
+
+def test_plan_round_trip(test_config: Config, tmp_path: Path) -> None:
+    wall = Wall(test_config)
+    Brick.configure(test_config)
+    wall.add_bricks(calculate_wild_bond(wall, test_config))
+    strides, movements = sequenced(naive_build_algorithm)(
+        wall, Robot(test_config), StrideManager(), test_config
+    )
+
+    cache = PlanCache(tmp_path)
+    key = cache.key(test_config, "wild", "naive_build+sequence_bricks")
+    assert cache.load(key, StrideManager()) is None
+    cache.save(key, list(wall.bricks), strides, movements)
+
+    manager = StrideManager()
+    bricks, cached_strides, cached_movements = cache.load(key, manager)
+    assert [(b.id, b.brick_type, b.position) for b in bricks] == [
+        (b.id, b.brick_type, b.position) for b in wall.bricks
+    ]
+    assert cached_movements == movements
+    assert manager.strides == cached_strides
+    for stride, cached in zip(strides, cached_strides, strict=True):
+        assert cached.robot_position == stride.robot_position
+        assert [b.id for b in cached.bricks] == [b.id for b in stride.bricks]
+        assert all(b.stride_id == cached.id for b in cached.bricks)
+        assert cached.arm_time == stride.arm_time
+
+
+def test_key_changes_with_inputs(test_config: Config, tmp_path: Path) -> None:
+    cache = PlanCache(tmp_path)
+    key = cache.key(test_config, "wild", "naive_build")
+    assert key == cache.key(copy.deepcopy(test_config), "wild", "naive_build")
+
+    changed = copy.deepcopy(test_config)
+    changed["robot"]["reach_width"] += 1
+    keys = {
+        key,
+        cache.key(changed, "wild", "naive_build"),
+        cache.key(test_config, "stretcher", "naive_build"),
+        cache.key(test_config, "wild", "min_stride"),
+    }
+    assert len(keys) == 4
+    assert len(code_version()) == 16
+
+
+def test_corrupt_file_is_a_miss(test_config: Config, tmp_path: Path) -> None:
+    cache = PlanCache(tmp_path)
+    key = cache.key(test_config, "wild", "naive_build")
+    cache.path(key).write_bytes(b"not a plan")
+    assert cache.load(key, StrideManager()) is None
+
+
+def test_file_missing_arrays_is_a_miss(test_config: Config, tmp_path: Path) -> None:
+    cache = PlanCache(tmp_path)
+    key = cache.key(test_config, "wild", "naive_build")
+    cache.save(key, [], [], [])
+    with np.load(cache.path(key)) as data:
+        arrays = {name: data[name] for name in data.files if name != "movements"}
+    np.savez_compressed(cache.path(key), **arrays)
+
+    manager = StrideManager()
+    assert cache.load(key, manager) is None
+    assert manager.strides == []
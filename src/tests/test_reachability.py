@@ -0,0 +1,75 @@
+from ..models.wall import Wall
+from ..models.robot import Robot
+from ..models.brick import Brick
+from ..models.reachability import ReachabilityMatrix, lattice_positions, CACHE_SIZE
+from ..configs.config import load_wall_config, Config
+from ..bonds.stretcher_bond import calculate_stretcher_bond
+import pytest
+
+
+@pytest.fixture
+def test_config() -> Config:
+    return load_wall_config("stretcher_bond_wall")
+
+
+def build_wall(config: Config, columnar: bool = False) -> Wall:
+    Brick.configure(config)
+    wall = Wall(config, columnar=columnar)
+    wall.add_bricks(calculate_stretcher_bond(wall, config))
+    return wall
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_matrix_matches_can_reach_brick(test_config: Config, columnar: bool) -> None:
+    wall = build_wall(test_config, columnar)
+    robot = Robot(test_config)
+    positions = lattice_positions(wall, 170.0, 130.0, x_start=-50.0)
+    matrix = ReachabilityMatrix.for_robot(wall, robot, positions)
+    assert matrix.shape == (len(positions), wall.total_bricks)
+
+    covering: dict[int, list[int]] = {b.id: [] for b in wall.bricks}
+    for i, (x, y) in enumerate(positions):
+        robot.position.x, robot.position.y = x, y
+        expected = [b.id for b in wall.bricks if robot.can_reach_brick(b)]
+        assert matrix.brick_ids_reachable_from(i).tolist() == expected
+        for brick_id in expected:
+            covering[brick_id].append(i)
+
+    for row, brick in enumerate(wall.bricks):
+        assert matrix.positions_covering(row).tolist() == covering[brick.id]
+    assert matrix.coverage_counts().sum() == matrix.nnz > 0
+
+
+def test_matrix_is_shared_per_wall_and_reach(test_config: Config) -> None:
+    Brick.configure(test_config)
+    wall = Wall(test_config)
+    bricks = calculate_stretcher_bond(wall, test_config)
+    wall.add_bricks(bricks[:-1])
+    robot = Robot(test_config)
+    positions = lattice_positions(wall, robot.reach_width, robot.reach_height)
+
+    matrix = ReachabilityMatrix.for_robot(wall, robot, positions)
+    assert ReachabilityMatrix.for_robot(wall, robot, positions.copy()) is matrix
+    assert ReachabilityMatrix.for_wall(wall, positions, 100, 100) is not matrix
+    other_wall = build_wall(test_config)
+    assert ReachabilityMatrix.for_robot(other_wall, robot, positions) is not matrix
+
+    # Adding bricks invalidates the shared matrix
+    wall.add_brick(bricks[-1])
+    rebuilt = ReachabilityMatrix.for_robot(wall, robot, positions)
+    assert rebuilt is not matrix
+    assert rebuilt.shape[1] == wall.total_bricks
+
+
+def test_matrix_cache_keeps_recent_positions(test_config: Config) -> None:
+    wall = build_wall(test_config)
+    robot = Robot(test_config)
+
+    first = ReachabilityMatrix.for_robot(wall, robot, [(0, 0)])
+    recent = ReachabilityMatrix.for_robot(wall, robot, [(1, 0)])
+    for x in range(2, CACHE_SIZE + 1):
+        ReachabilityMatrix.for_robot(wall, robot, [(x, 0)])
+        # Keep ``recent`` in use while the others come and go
+        assert ReachabilityMatrix.for_robot(wall, robot, [(1, 0)]) is recent
+
+    assert ReachabilityMatrix.for_robot(wall, robot, [(0, 0)]) is not first
@@ -0,0 +1,136 @@
+from ..models.wall import Wall
+from ..models.brick import Brick, BrickState
+from ..models.robot import Robot
+from ..models.stride import StrideManager
+from ..configs.config import load_wall_config, Config
+from ..algos.naive_build import naive_build_algorithm
+from ..bonds.stretcher_bond import calculate_stretcher_bond
+from collections.abc import Iterator
+import os
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+
+@pytest.fixture
+def test_config() -> Config:
+    return load_wall_config("test_small_wall")
+
+
+@pytest.fixture
+def wall(test_config: Config) -> Wall:
+    wall = Wall(test_config)
+    Brick.configure(test_config)
+    wall.add_bricks(calculate_stretcher_bond(wall, test_config))
+    return wall
+
+
+@pytest.fixture
+def renderer(test_config: Config, monkeypatch: pytest.MonkeyPatch) -> Iterator:
+    monkeypatch.setitem(os.environ, "SDL_VIDEODRIVER", "dummy")
+    from ..renderer import PygameRenderer
+
+    renderer = PygameRenderer(test_config)
+    yield renderer
+    renderer.cleanup()
+
+
+@pytest.fixture
+def updates(monkeypatch: pytest.MonkeyPatch) -> list:
+    """Every display push: None for a flip, else the updated rects"""
+    pushed: list = []
+    monkeypatch.setattr(pygame.display, "flip", lambda: pushed.append(None))
+    monkeypatch.setattr(pygame.display, "update", lambda rects: pushed.append(rects))
+    return pushed
+
+
+def pixels(renderer) -> bytes:
+    return pygame.image.tobytes(renderer.screen, "RGB")
+
+
+def test_unchanged_frames_only_update_info_panel(
+    renderer, wall: Wall, updates: list
+) -> None:
+    renderer.render_wall(wall)
+    renderer.render_wall(wall)
+    renderer.render_wall(wall)
+
+    assert updates == [None, [renderer.info_rect], [renderer.info_rect]]
+
+
+@pytest.mark.parametrize("with_strides", [False, True])
+@pytest.mark.parametrize("debug_mode", [False, True])
+def test_incremental_frames_match_full_redraw(
+    renderer,
+    wall: Wall,
+    test_config: Config,
+    updates: list,
+    with_strides: bool,
+    debug_mode: bool,
+) -> None:
+    """Redrawing the changed bricks leaves the same picture as a full redraw"""
+    renderer.debug_mode = debug_mode
+    stride_manager = None
+    if with_strides:
+        stride_manager = StrideManager()
+        naive_build_algorithm(wall, Robot(test_config), stride_manager, test_config)
+    renderer.render_wall(wall, stride_manager=stride_manager)
+
+    built = [wall.bricks[i] for i in (0, 5, len(wall.bricks) - 1)]
+    for brick in built:
+        wall.set_brick_state(brick, BrickState.BUILT)
+    wall.set_brick_state(built[1], BrickState.PLANNED)
+    renderer.render_wall(wall, stride_manager=stride_manager)
+    incremental = pixels(renderer)
+
+    assert updates[0] is None
+    # One rect per state change, plus the info panel
+    assert len(updates[1]) == len(built) + 2
+    assert updates[1][-1] == renderer.info_rect
+
+    renderer.resize(renderer.window_width, renderer.window_height)
+    renderer.render_wall(wall, stride_manager=stride_manager)
+    assert updates[2] is None
+    assert pixels(renderer) == incremental
+
+
+def test_full_redraw_on_bulk_change_and_debug_toggle(
+    renderer, wall: Wall, updates: list
+) -> None:
+    renderer.render_wall(wall)
+    wall.set_all_brick_states(BrickState.BUILT)
+    renderer.render_wall(wall)
+    renderer.debug_mode = True
+    renderer.render_wall(wall)
+    renderer.render_wall(wall)
+
+    assert updates == [None, None, None, [renderer.info_rect]]
+
+
+def test_static_layer_is_reused_until_layout_changes(
+    renderer, wall: Wall, updates: list
+) -> None:
+    renderer.render_wall(wall)
+    layer = renderer._static_layer
+    initial = pixels(renderer)
+
+    wall.set_brick_state(wall.bricks[0], BrickState.BUILT)
+    renderer.render_wall(wall)
+    wall.set_all_brick_states(BrickState.BUILT)
+    renderer.render_wall(wall)
+    assert renderer._static_layer is layer
+
+    # Back to planned is the static layer alone
+    wall.set_all_brick_states(BrickState.PLANNED)
+    renderer.render_wall(wall)
+    assert pixels(renderer) == initial
+
+    renderer.debug_mode = True
+    renderer.render_wall(wall)
+    debug_layer = renderer._static_layer
+    assert debug_layer is not layer
+
+    renderer.resize(900, 600)
+    renderer.render_wall(wall)
+    assert renderer._static_layer is not debug_layer
+    assert renderer._static_layer.get_size() == (900, 600)
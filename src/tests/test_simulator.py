@@ -0,0 +1,101 @@
+from ..algos.naive_build import naive_build_algorithm
+from ..models.wall import Wall
+from ..models.robot import Robot
+from ..models.brick import Brick, BrickState
+from ..models.stride import Stride, StrideManager
+from ..configs.config import load_wall_config, Config
+from ..bonds.stretcher_bond import calculate_stretcher_bond
+from ..simulator import BuildSimulator
+import pytest
+
+
+@pytest.fixture
+def test_config() -> Config:
+    return load_wall_config("test_small_wall")
+
+
+@pytest.fixture
+def wall(test_config: Config) -> Wall:
+    wall = Wall(test_config)
+    Brick.configure(test_config)
+    wall.add_bricks(calculate_stretcher_bond(wall, test_config))
+    return wall
+
+
+@pytest.fixture
+def robot(test_config: Config) -> Robot:
+    return Robot(test_config)
+
+
+@pytest.fixture
+def strides(wall: Wall, robot: Robot, test_config: Config) -> list[Stride]:
+    strides, _ = naive_build_algorithm(wall, robot, StrideManager(), test_config)
+    return strides
+
+
+def test_manual_mode_builds_in_wall_order(
+    wall: Wall, robot: Robot, strides: list[Stride]
+) -> None:
+    simulator = BuildSimulator(wall, robot, strides)
+
+    first = simulator.step()
+    assert first.brick is wall.bricks[0] and not first.finished
+    assert wall.built_count == 1
+
+    assert simulator.build_all() == wall.total_bricks - 1
+    assert simulator.done and simulator.build_all() == 0
+    assert simulator.step().brick is None
+
+
+def test_robot_mode_follows_strides(
+    wall: Wall, robot: Robot, strides: list[Stride]
+) -> None:
+    simulator = BuildSimulator(wall, robot, strides)
+    simulator.toggle_mode()
+    assert robot.position == strides[0].robot_position
+
+    laid = []
+    while not simulator.done:
+        event = simulator.step()
+        laid.append(event.brick)
+        if event.moved_to_stride is not None:
+            assert event.completed_stride == event.moved_to_stride - 1
+            assert robot.position == strides[event.moved_to_stride].robot_position
+
+    assert laid == [b for s in strides for b in s.bricks]
+    assert event.finished
+    assert wall.built_count == wall.total_bricks
+
+
+def test_complete_stride_and_reset(
+    wall: Wall, robot: Robot, strides: list[Stride]
+) -> None:
+    simulator = BuildSimulator(wall, robot, strides)
+    simulator.toggle_mode()
+    simulator.step()
+
+    event = simulator.complete_stride()
+    assert event.completed_stride == 0 and event.moved_to_stride == 1
+    assert wall.stride_progress(strides[0]) == (len(strides[0].bricks),) * 2
+
+    assert simulator.run_to_end() == wall.total_bricks - len(strides[0].bricks)
+    simulator.reset()
+    assert wall.built_count == 0 and simulator.stride_index == 0
+    assert (robot.position.x, robot.position.y) == (0, 0)
+    assert all(b.state == BrickState.PLANNED for b in wall.bricks)
+
+
+def test_auto_play_ticks(wall: Wall, robot: Robot, strides: list[Stride]) -> None:
+    simulator = BuildSimulator(wall, robot, strides, auto_play_delay=3)
+    simulator.toggle_auto_play()
+    assert simulator.tick().brick is None  # manual mode ignores auto-play
+
+    simulator.toggle_mode()
+    simulator.toggle_auto_play()
+    bricks = [simulator.tick().brick for _ in range(6)]
+    assert bricks[:2] == [None, None] and bricks[2] is strides[0].bricks[0]
+    assert bricks[5] is strides[0].bricks[1]
+
+    while simulator.auto_play:
+        simulator.tick()
+    assert simulator.done and wall.built_count == wall.total_bricks
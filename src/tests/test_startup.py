@@ -0,0 +1,78 @@
+from ..registry import get_algorithm
+from pathlib import Path
+import subprocess
+import sys
+import pytest
+
+ROOT = Path(__file__).parents[2]
+
+# Modules that must only be imported once a window opens or a bond/algorithm
+# is looked up
+LAZY = ("pygame", "src.renderer", "src.bonds.", "src.algos.")
+
+
+def imported_modules(code: str) -> list[str]:
+    """Modules ``code`` imports in a fresh interpreter, from its -X importtime log"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return [
+        line.rsplit("|", 1)[1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "imported package" not in line
+    ]
+
+
+def test_main_import_is_lazy() -> None:
+    modules = imported_modules("import src.main")
+    assert "src.main" in modules
+    eager = [m for m in modules if m.startswith(LAZY)]
+    assert eager == []
+
+
+def test_registry_imports_only_the_requested_entries() -> None:
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; from src.registry import get_algorithm; "
+            "get_algorithm('naive_build'); print('\\n'.join(sys.modules))",
+        ],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = result.stdout.split()
+    assert "src.algos.naive_build" in modules
+    assert "src.algos.min_stride_build" not in modules
+    assert not any(m.startswith(("src.bonds.", "pygame")) for m in modules)
+
+
+def test_no_gui_plan_does_not_import_pygame() -> None:
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; from src.main import main; main(); "
+            "assert 'pygame' not in sys.modules",
+            "--wall",
+            "stretcher_bond_wall",
+            "--no-gui",
+            "--no-cache",
+        ],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    assert "Generated 6 strides" in result.stdout
+
+
+def test_unknown_algorithm() -> None:
+    with pytest.raises(ValueError, match="Unknown algorithm"):
+        get_algorithm("nope")
@@ -0,0 +1,89 @@
+from ..algos.min_stride_build import min_stride_build_algorithm
+from ..algos.support_order import support_ordered
+from ..algos.stride_ordering import order_strides, emit_strides
+from ..models.wall import Wall
+from ..models.robot import Robot
+from ..models.brick import Brick
+from ..models.common import Position, Movement
+from ..models.stride import StrideManager
+from ..models.support import SupportGraph
+from ..models.travel import TravelCostModel
+from ..configs.config import load_wall_config, Config
+from ..bonds.stretcher_bond import calculate_stretcher_bond
+import random
+import pytest
+
+
+@pytest.fixture
+def test_config() -> Config:
+    return load_wall_config("stretcher_bond_wall")
+
+
+@pytest.fixture
+def wall(test_config: Config) -> Wall:
+    wall = Wall(test_config)
+    Brick.configure(test_config)
+    wall.add_bricks(calculate_stretcher_bond(wall, test_config))
+    return wall
+
+
+def test_travel_cost_model(test_config: Config) -> None:
+    model = TravelCostModel(speed_x=100, speed_y=50, lift_penalty=3)
+    assert model.cost(Position(0, 0), Position(200, 0)) == 2
+    assert model.cost(Position(0, 0), Position(200, 100)) == 2 + 2 + 3
+    assert model.total([Movement(Position(0, 0), Position(0, 50))] * 2) == 8
+    assert model.cost_matrix([(0, 0)], [(200, 0), (200, 100)]).tolist() == [[2, 7]]
+
+    assert TravelCostModel.from_config(test_config) == TravelCostModel()
+    test_config["travel"] = {"lift_penalty": 0.0, "comment": "unknown keys"}
+    assert TravelCostModel.from_config(test_config).lift_penalty == 0.0
+
+
+def test_order_strides_reduces_travel(test_config: Config, wall: Wall) -> None:
+    robot = Robot(test_config)
+    draft, _ = support_ordered(min_stride_build_algorithm)(
+        wall, robot, StrideManager(), test_config
+    )
+    model = TravelCostModel()
+
+    strides, movements, report = order_strides(
+        wall, robot, draft, StrideManager(), model
+    )
+
+    assert report.after < report.before
+    assert report.after == pytest.approx(model.total(movements))
+    assert report.movements_after == len(movements)
+    assert [s.id for s in strides] == list(range(len(strides)))
+    assert sorted(id(b) for s in strides for b in s.bricks) == sorted(
+        id(b) for s in draft for b in s.bricks
+    )
+
+    # The draft respected support, so the reordered plan must too
+    graph = SupportGraph(wall)
+    order = [b.id for s in strides for b in s.bricks]
+    assert graph.order_violations(graph.rows_of(order)) == []
+
+
+def test_order_strides_without_precedence_finds_short_tour(
+    test_config: Config, wall: Wall
+) -> None:
+    # One brick per stride, all in the first course: no support between them
+    bottom = [b for b in wall.bricks if wall.get_course(b) == 0]
+    manager = StrideManager()
+    draft = []
+    for brick in random.Random(1).sample(bottom, len(bottom)):
+        stride = manager.create_stride(Position(brick.center_x, 0))
+        stride.add_brick(brick)
+        draft.append(stride)
+
+    model = TravelCostModel()
+    robot = Robot(test_config)
+    strides, movements, report = order_strides(
+        wall, robot, draft, StrideManager(), model
+    )
+
+    xs = [s.robot_position.x for s in strides]
+    assert xs == sorted(xs)
+    assert report.after < report.before
+    _, draft_movements = emit_strides(robot.position, draft, None)
+    assert report.before == pytest.approx(model.total(draft_movements))
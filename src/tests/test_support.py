@@ -0,0 +1,114 @@
+from ..algos.naive_build import naive_build_algorithm
+from ..algos.min_stride_build import min_stride_build_algorithm
+from ..algos.support_order import support_ordered, order_by_support
+from ..models.wall import Wall
+from ..models.robot import Robot
+from ..models.brick import Brick
+from ..models.stride import StrideManager
+from ..models.support import SupportGraph
+from ..configs.config import load_wall_config, Config
+from ..bonds.stretcher_bond import calculate_stretcher_bond
+from ..bonds.flemish_bond import calculate_flemish_bond
+from ..bonds.english_cross_bond import calculate_english_cross_bond
+from ..bonds.wild_bond import calculate_wild_bond
+from collections.abc import Callable
+import pytest
+
+WALLS = [
+    ("test_small_wall", calculate_stretcher_bond),
+    ("stretcher_bond_wall", calculate_stretcher_bond),
+    ("flemish_bond_wall", calculate_flemish_bond),
+    ("english_cross_bond_wall", calculate_english_cross_bond),
+    ("wild_bond_wall", calculate_wild_bond),
+]
+
+
+def build_wall(
+    config: Config, bond_calculator: Callable[[Wall, Config], list[Brick]]
+) -> Wall:
+    wall = Wall(config)
+    Brick.configure(config)
+    wall.add_bricks(bond_calculator(wall, config))
+    return wall
+
+
+@pytest.mark.parametrize("wall_name, bond_calculator", WALLS)
+def test_support_graph_matches_pairwise_scan(
+    wall_name: str, bond_calculator: Callable[[Wall, Config], list[Brick]]
+) -> None:
+    wall = build_wall(load_wall_config(wall_name), bond_calculator)
+    graph = SupportGraph(wall)
+    bricks = list(wall.bricks)
+
+    for row, brick in enumerate(bricks):
+        expected = [
+            other_row
+            for other_row, other in enumerate(bricks)
+            if wall.get_course(other) == wall.get_course(brick) - 1
+            and other.position.x < brick.right
+            and brick.position.x < other.right
+        ]
+        assert graph.supporters(row).tolist() == expected
+        for other_row in expected:
+            assert row in graph.dependents(other_row)
+
+    assert len(graph.unsupported_rows()) == 0
+    assert graph.edge_count == graph.support_counts().sum()
+
+
+@pytest.mark.parametrize("wall_name, bond_calculator", WALLS)
+def test_support_ordered_plan_has_no_violations(
+    wall_name: str, bond_calculator: Callable[[Wall, Config], list[Brick]]
+) -> None:
+    config = load_wall_config(wall_name)
+    for algorithm in (naive_build_algorithm, min_stride_build_algorithm):
+        wall = build_wall(config, bond_calculator)
+        robot = Robot(config)
+        strides, movements = support_ordered(algorithm)(
+            wall, robot, StrideManager(), config
+        )
+        graph = SupportGraph(wall)
+        order = [b.id for s in strides for b in s.bricks]
+
+        assert sorted(order) == sorted(b.id for b in wall.bricks)
+        assert graph.order_violations(graph.rows_of(order)) == []
+        assert len(movements) <= len(strides)
+        for stride in strides:
+            robot.position = stride.robot_position
+            assert all(robot.can_reach_brick(b) for b in stride.bricks)
+            assert all(b.stride_id == stride.id for b in stride.bricks)
+
+
+def test_support_ordered_partial_draft() -> None:
+    # A draft without the bottom course: those bricks are already laid
+    config = load_wall_config("stretcher_bond_wall")
+    wall = build_wall(config, calculate_stretcher_bond)
+    robot = Robot(config)
+    full, _ = min_stride_build_algorithm(wall, robot, StrideManager(), config)
+    manager = StrideManager()
+    draft = []
+    for stride in full:
+        upper = [b for b in stride.bricks if wall.get_course(b) > 0]
+        if upper:
+            draft.append(manager.create_stride(stride.robot_position))
+            for brick in upper:
+                draft[-1].add_brick(brick)
+
+    strides, _ = order_by_support(wall, robot, draft, StrideManager())
+    graph = SupportGraph(wall)
+    base = [b.id for b in wall.bricks if wall.get_course(b) == 0]
+    order = [b.id for s in strides for b in s.bricks]
+
+    assert sorted(order) == sorted(b.id for s in draft for b in s.bricks)
+    assert graph.order_violations(graph.rows_of(base + order)) == []
+
+
+def test_order_violations_reports_unsupported_order() -> None:
+    wall = build_wall(load_wall_config("test_small_wall"), calculate_stretcher_bond)
+    graph = SupportGraph(wall)
+    row = int(graph.dependents(0)[0])
+
+    assert graph.order_violations(range(len(graph))) == []
+    late_base = [r for r in range(len(graph)) if r != 0] + [0]
+    assert (row, 0) in graph.order_violations(late_base)
+    assert (row, 0) in graph.order_violations([row])
@@ -1,7 +1,11 @@
 from ..models.wall import Wall
-from ..models.brick import Brick
+from ..models.layout import LayoutIssueKind
+from ..models.brick import Brick, BrickState
+from ..models.stride import StrideManager
 from ..models.common import Position
 from ..configs.config import load_wall_config, Config
+from ..registry import get_bond_calculator, get_bond_courses, bond_type_for_wall
+import itertools
 import pytest
 
 
@@ -117,3 +121,234 @@ def test_validate_brick_placement(wall: Wall) -> None:
         id=7, brick_type="full", position=Position(100, 100 + brick_height - 10)
     )
     assert wall.validate_brick_placement(brick7) is False
+
+
+def test_validate_brick_placement_matches_full_scan(wall: Wall) -> None:
+    """Indexed overlap validation agrees with comparing against every brick"""
+    for i, (x, y) in enumerate([(0, 0), (225, 0), (110, 75), (0, 150), (300, 140)]):
+        wall.add_brick(Brick(id=i, brick_type="full", position=Position(x, y)))
+
+    for x in range(-250, int(wall.width) + 50, 17):
+        for y in range(-80, int(wall.height) + 20, 13):
+            probe = Brick(id=-1, brick_type="half", position=Position(x, y))
+            expected = not any(wall._bricks_overlap(probe, b) for b in wall.bricks)
+            assert wall.validate_brick_placement(probe) is expected
+
+
+def test_course_index(wall: Wall) -> None:
+    """Course queries come from the index and stay ordered left to right"""
+    course_height = (
+        wall.config["joints"]["bed_joint"] + wall.config["bricks"]["full"]["height"]
+    )
+    positions = [(225, 0), (0, 0), (110, course_height), (0, 2 * course_height)]
+    for i, (x, y) in enumerate(positions):
+        wall.add_brick(Brick(id=i, brick_type="full", position=Position(x, y)))
+
+    assert [b.id for b in wall.get_bricks_in_course(0)] == [1, 0]
+    assert [b.id for b in wall.get_bricks_in_course(1)] == [2]
+    assert wall.get_bricks_in_course(5) == []
+    assert wall.get_course(wall.bricks[3]) == 2
+    assert [course for course, _ in wall.iter_courses()] == [0, 1, 2]
+    # Callers get their own lists: changing one leaves the wall alone
+    course = wall.get_bricks_in_course(0)
+    course.clear()
+    assert [b.id for b in wall.get_bricks_in_course(0)] == [1, 0]
+
+
+def test_get_brick_at_grid(wall: Wall) -> None:
+    """Grid lookups resolve through the course index"""
+    min_brick_length = min(brick["length"] for brick in wall.config["bricks"].values())
+    unit_width = min_brick_length + wall.config["joints"]["head_joint"]
+
+    wall.add_brick(Brick(id=1, brick_type="full", position=Position(0, 0)))
+    wall.add_brick(Brick(id=2, brick_type="half", position=Position(2 * unit_width, 0)))
+
+    assert wall.get_brick_at_grid(0, 0).id == 1
+    assert wall.get_brick_at_grid(0, 2).id == 2
+    assert wall.get_brick_at_grid(0, 1) is None
+    assert wall.get_brick_at_grid(1, 0) is None
+
+
+def test_add_bricks_matches_try_add_brick(wall_config: Config) -> None:
+    """Bulk sweep validation accepts exactly what sequential try_add_brick does"""
+    Brick.configure(wall_config)
+    types = ["full", "half"]
+    positions = [
+        (0, 0), (200, 0), (230, 0), (400, 0), (-5, 0), (120, 75), (120, 75),
+        (0, 60), (300, 40), (350, 150), (460, 150), (100, 230), (0, 149),
+    ]
+    bricks = [
+        Brick(id=i, brick_type=types[i % 2], position=Position(x, y))
+        for i, (x, y) in enumerate(positions)
+    ]
+
+    # A brick already on the wall takes precedence over the new layout
+    existing = Brick(id=99, brick_type="half", position=Position(360, 75))
+
+    sequential = Wall(wall_config)
+    sequential.add_brick(existing)
+    expected = [b.id for b in bricks if sequential.try_add_brick(b)]
+
+    bulk = Wall(wall_config)
+    bulk.add_brick(existing)
+    report = bulk.add_bricks(bricks)
+
+    assert [b.id for b in report.accepted] == expected
+    assert [b.id for b in bulk.bricks] == [b.id for b in sequential.bricks]
+    assert report.rejected_ids == {b.id for b in bricks} - set(expected)
+    assert report.count(LayoutIssueKind.OUT_OF_WALL) == 4
+
+    # A rejected brick must not knock out one accepted before it
+    chained = [
+        Brick(id=i, brick_type="full", position=Position(x, 0))
+        for i, x in enumerate([400, 200, 0])
+    ]
+    sequential = Wall(wall_config)
+    sequential.width = 1000
+    expected = [b.id for b in chained if sequential.try_add_brick(b)]
+    bulk = Wall(wall_config)
+    bulk.width = 1000
+    report = bulk.add_bricks(chained)
+    assert expected == [0, 2]
+    assert [b.id for b in report.accepted] == expected
+    assert report.rejected_ids == {1}
+
+
+def test_add_courses_keeps_bricks_a_rejected_brick_conflicts_with(
+    wall_config: Config,
+) -> None:
+    wall = Wall(wall_config)
+    wall.width = 1000
+    Brick.configure(wall_config)
+    course = [
+        Brick(id=i, brick_type="full", position=Position(x, 0))
+        for i, x in enumerate([400, 200, 0])
+    ]
+
+    report = wall.add_courses([course])
+
+    assert [b.id for b in wall.bricks] == [0, 2]
+    assert report.accepted_count == 2
+    assert report.rejected_ids == {1}
+
+
+def test_validate_layout_reports_joint_and_gap_issues(wall: Wall) -> None:
+    full_length = wall.config["bricks"]["full"]["length"]
+    bricks = [
+        Brick(id=1, brick_type="full", position=Position(0, 0)),
+        # touches brick 1 without leaving a head joint
+        Brick(id=2, brick_type="half", position=Position(full_length, 0)),
+    ]
+    report = wall.validate_layout(bricks)
+
+    assert not report.ok
+    assert report.count(LayoutIssueKind.HEAD_JOINT) == 1
+    assert report.count(LayoutIssueKind.COURSE_GAP) == 1
+    assert wall.total_bricks == 0
+
+
+@pytest.mark.parametrize(
+    "wall_name",
+    [
+        "test_small_wall",
+        "stretcher_bond_wall",
+        "flemish_bond_wall",
+        "english_cross_bond_wall",
+        "wild_bond_wall",
+    ],
+)
+@pytest.mark.parametrize("columnar", [False, True])
+def test_add_courses_matches_add_bricks(wall_name: str, columnar: bool) -> None:
+    """Streaming a bond course by course gives the same wall and issues"""
+    config = load_wall_config(wall_name)
+    Brick.configure(config)
+    bond_type = bond_type_for_wall(wall_name)
+
+    bulk = Wall(config)
+    expected = bulk.add_bricks(get_bond_calculator(bond_type)(bulk, config))
+
+    streamed = Wall(config, columnar=columnar)
+    courses = get_bond_courses(bond_type)(streamed, config)
+    first = next(courses)
+    assert {b.position.y for b in first} == {0}
+    report = streamed.add_courses(itertools.chain([first], courses))
+
+    def geometry(wall: Wall) -> list[tuple]:
+        return [(b.id, b.brick_type, b.position.x, b.position.y) for b in wall.bricks]
+
+    assert geometry(streamed) == geometry(bulk)
+    assert [str(i) for i in report.issues] == [str(i) for i in expected.issues]
+    assert report.accepted == []
+    assert report.accepted_count == len(expected.accepted)
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_build_progress_counters(wall_config: Config, columnar: bool) -> None:
+    """Progress counters follow state changes made through the wall"""
+    wall = Wall(wall_config, columnar=columnar)
+    Brick.configure(wall_config)
+    course_height = (
+        wall_config["joints"]["bed_joint"] + wall_config["bricks"]["full"]["height"]
+    )
+    for i, (x, y) in enumerate([(0, 0), (225, 0), (0, course_height)]):
+        wall.add_brick(Brick(id=i, brick_type="full", position=Position(x, y)))
+
+    stride = StrideManager().create_stride(Position(0, 0))
+    stride.add_brick(wall.bricks[0])
+    stride.add_brick(wall.bricks[2])
+
+    wall.set_brick_state(wall.bricks[0], BrickState.BUILT)
+    wall.set_brick_state(wall.bricks[0], BrickState.BUILT)
+    assert wall.built_count == 1
+    assert wall.planned_count == 2
+    assert wall.course_progress(0) == (1, 2)
+    assert wall.stride_progress(stride) == (1, 2)
+
+    wall.set_brick_state(wall.bricks[2], BrickState.BUILT)
+    wall.set_brick_state(wall.bricks[0], BrickState.PLANNED)
+    assert wall.built_count == 1
+    assert wall.course_progress(1) == (1, 1)
+    assert wall.stride_progress(stride) == (1, 2)
+    assert [b.id for b in wall.built_bricks] == [2]
+
+    wall.set_all_brick_states(BrickState.BUILT)
+    assert wall.completion_percentage == 100
+    assert wall.stride_progress(stride) == (2, 2)
+
+    wall.set_all_brick_states(BrickState.PLANNED)
+    assert wall.built_count == 0
+    assert wall.built_bricks == []
+
+
+def test_take_state_changes(wall: Wall) -> None:
+    """State changes are journaled between calls, bulk changes reset it"""
+    for i, x in enumerate([0, 225, 450]):
+        wall.add_brick(Brick(id=i, brick_type="full", position=Position(x, 0)))
+
+    assert wall.take_state_changes() is None
+    assert wall.take_state_changes() == []
+
+    wall.set_brick_state(wall.bricks[2], BrickState.BUILT)
+    wall.set_brick_state(wall.bricks[2], BrickState.BUILT)
+    wall.set_brick_state(wall.bricks[0], BrickState.BUILT)
+    assert [b.id for b in wall.take_state_changes() or []] == [2, 0]
+    assert wall.take_state_changes() == []
+
+    wall.set_brick_state(wall.bricks[1], BrickState.BUILT)
+    wall.set_all_brick_states(BrickState.PLANNED)
+    assert wall.take_state_changes() is None
+
+    wall.add_brick(Brick(id=3, brick_type="full", position=Position(675, 0)))
+    assert wall.take_state_changes() is None
+
+
+def test_brick_geometry_accessors(wall: Wall) -> None:
+    """Float accessors agree with the Position-returning properties"""
+    brick = Brick(id=1, brick_type="half", position=Position(40, 75))
+
+    assert not hasattr(brick, "__dict__")
+    assert (brick.center_x, brick.center_y) == (brick.center.x, brick.center.y)
+    assert brick.top == brick.top_left.y
+    assert brick.right == brick.position.x + brick.length
+    assert brick.contains_point(brick.center_x, brick.center_y)
+    assert not brick.contains_point(brick.position.x - 1, brick.center_y)
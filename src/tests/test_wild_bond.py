@@ -0,0 +1,44 @@
+from ..bonds.wild_bond import JointIndex, iter_wild_patterns
+from ..configs.config import load_wall_config, Config
+import pytest
+
+
+@pytest.fixture
+def test_config() -> Config:
+    return load_wall_config("wild_bond_wall")
+
+
+def test_joint_index() -> None:
+    index = JointIndex(depth=2)
+    index.push([100.0, 310.0])
+    index.push([45.0, 255.0, 365.0])
+
+    assert index.aligned(255.5) == 1
+    assert index.aligned(309.2) == 2
+    assert index.aligned(200.0) is None
+    # Strictly closer than the tolerance, either side
+    assert index.aligned(101.0) is None
+    assert index.aligned(99.0) is None
+
+    # The oldest course drops out
+    index.push([500.0])
+    assert index.aligned(310.0) is None
+    assert index.aligned(365.0) == 2
+
+
+def aligned_within(config: Config, courses: int) -> int:
+    """Perpends aligned with one in any of the ``courses`` courses below"""
+    joints = [j[:-1] for _, j in iter_wild_patterns(config)]
+    return sum(
+        any(abs(x - y) < 1 for below in joints[max(0, i - courses) : i] for y in below)
+        for i, course in enumerate(joints)
+        for x in course
+    )
+
+
+def test_joint_courses_rule(test_config: Config) -> None:
+    assert aligned_within(test_config, 1) == 0
+    default = aligned_within(test_config, 2)
+
+    test_config["wild"] = {"joint_courses": 2}
+    assert aligned_within(test_config, 2) < default / 2
@@ -0,0 +1,72 @@
+from ..bonds.wild_bond import calculate_wild_bond
+from ..bonds.wild_search import (
+    WildBondWeights,
+    evaluate_seed,
+    score_layout,
+    search_wild_bond,
+)
+from ..models.wall import Wall
+from ..models.brick import Brick
+from ..configs.config import load_wall_config, Config
+import random
+import pytest
+
+
+@pytest.fixture
+def test_config() -> Config:
+    config = load_wall_config("wild_bond_wall")
+    config["wall"]["width"] = 5000  # wide enough for the default to align joints
+    Brick.configure(config)
+    return config
+
+
+def layout(config: Config, rng: random.Random | None) -> list[tuple]:
+    bricks = calculate_wild_bond(Wall(config), config, rng)
+    return [(b.brick_type, b.position.x, b.position.y) for b in bricks]
+
+
+def test_layouts_are_reproducible(test_config: Config) -> None:
+    # The default layout doesn't touch the global RNG
+    random.seed(1)
+    default = layout(test_config, None)
+    random.seed(2)
+    assert layout(test_config, None) == default
+
+    assert layout(test_config, random.Random(7)) == layout(
+        test_config, random.Random(7)
+    )
+    assert layout(test_config, random.Random(7)) != layout(
+        test_config, random.Random(8)
+    )
+
+
+def test_search_returns_best_seed(test_config: Config) -> None:
+    search = search_wild_bond(test_config, candidates=6, seed=10, workers=1)
+
+    assert [c.seed for c in search.candidates] == [None, 10, 11, 12, 13, 14, 15]
+    assert search.best.score.total == min(c.score.total for c in search.candidates)
+    assert search.best.seed is not None  # the default aligns joints on this wall
+    assert evaluate_seed(test_config, search.best.seed) == search.best
+    assert layout(test_config, search.best.rng()) == layout(
+        test_config, random.Random(search.best.seed)
+    )
+
+    pooled = search_wild_bond(test_config, candidates=6, seed=10, workers=2)
+    assert pooled == search
+
+
+def test_score_layout() -> None:
+    weights = WildBondWeights(max_steps=2)
+    joints = [
+        [100.0, 500.0],
+        [100.0, 555.0],  # 100 aligned, 555 steps right
+        [300.0, 610.0],  # steps right again
+        [665.0],  # third step right: a run over max_steps
+    ]
+    score = score_layout(["full"] * 3 + ["half"], joints, 55.0, weights)
+
+    assert score.aligned_joints == 1
+    assert score.longest_step_run == 3
+    assert score.long_step_runs == 1
+    assert score.full_share == 0.75
+    assert score.total == 10.0 + 5.0 + 100.0 * 0.25